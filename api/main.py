@@ -4,6 +4,7 @@ Agent Fishbowl API
 Thin FastAPI backend serving the AI news feed and activity data.
 """
 
+import asyncio
 import logging
 import time
 from contextlib import asynccontextmanager
@@ -18,6 +19,7 @@ from api.config import get_settings
 from api.middleware import RequestIDMiddleware, SecurityHeadersMiddleware
 from api.routers import activity, articles, blog, board_health, feedback, goals, stats
 from api.services.blob_storage import check_storage_connectivity
+from api.services.http_client import close_shared_client, prewarm_shared_client
 
 logger = logging.getLogger(__name__)
 
@@ -31,7 +33,12 @@ _HEALTH_CACHE_TTL = 30  # seconds
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """Application lifespan: startup and shutdown."""
+    # Connect to GitHub in the background; startup doesn't wait on it
+    prewarm = asyncio.create_task(prewarm_shared_client())
     yield
+    prewarm.cancel()
+    # Release pooled GitHub connections rather than leaving the sockets open
+    await close_shared_client()
 
 
 app = FastAPI(
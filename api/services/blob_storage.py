@@ -1,12 +1,15 @@
 """Azure Blob Storage service for reading/writing article data."""
 
-import json
+import asyncio
 import logging
 import re
+from typing import Any
 
+import orjson
 from azure.core.exceptions import HttpResponseError, ResourceNotFoundError
 from azure.identity import ManagedIdentityCredential
 from azure.storage.blob import ContainerClient, ContentSettings
+from pydantic import TypeAdapter
 
 from api.config import get_settings
 from api.models.article import Article, ArticleIndex, ArticleSummary
@@ -31,6 +34,12 @@ def validate_blob_path_segment(segment: str) -> str:
 
 INDEX_BLOB = "index.json"
 BLOG_INDEX_BLOB = "blog-index.json"
+ANALYSIS_CACHE_BLOB = "analysis-cache.json"
+
+# Serialize the index lists straight to JSON bytes in pydantic's core,
+# without building an intermediate dict per entry
+_ARTICLE_INDEX_ADAPTER = TypeAdapter(list[ArticleSummary])
+_BLOG_INDEX_ADAPTER = TypeAdapter(list[BlogPost])
 
 # Lazy singletons — live for the process lifetime
 _container_client: ContainerClient | None = None
@@ -105,7 +114,7 @@ async def get_article_index(
     try:
         blob = client.get_blob_client(INDEX_BLOB)
         data = blob.download_blob().readall()
-        articles_data = json.loads(data)
+        articles_data = orjson.loads(data)
         # Handle both list format and dict format ({"articles": [...]})
         if isinstance(articles_data, dict):
             articles_data = articles_data.get("articles", [])
@@ -155,7 +164,7 @@ async def get_article(article_id: str) -> Article | None:
         # Articles stored under their ID
         blob = client.get_blob_client(f"{article_id}.json")
         data = blob.download_blob().readall()
-        return Article(**json.loads(data))
+        return Article(**orjson.loads(data))
     except ResourceNotFoundError:
         return None
     except HttpResponseError as e:
@@ -170,11 +179,14 @@ async def write_article_only(article: Article) -> None:
     """Write only the article JSON to blob storage (no index update).
 
     Used by the orchestrator during batch ingestion to avoid N+1 index writes.
+    The blob client is synchronous, so the upload runs in a worker thread;
+    articles ingested concurrently then write concurrently too.
     """
     client = _get_container_client()
     try:
         blob = client.get_blob_client(f"{article.id}.json")
-        blob.upload_blob(
+        await asyncio.to_thread(
+            blob.upload_blob,
             article.model_dump_json(indent=2),
             overwrite=True,
             content_settings=ContentSettings(content_type="application/json"),
@@ -196,7 +208,7 @@ async def get_blog_index(
     try:
         blob = client.get_blob_client(BLOG_INDEX_BLOB)
         data = blob.download_blob().readall()
-        posts_data = json.loads(data)
+        posts_data = orjson.loads(data)
         if isinstance(posts_data, dict):
             posts_data = posts_data.get("posts", [])
         posts = [BlogPost(**p) for p in posts_data]
@@ -220,11 +232,15 @@ async def get_blog_index(
 
 
 async def write_blog_index(posts: list[BlogPost]) -> None:
-    """Write the full blog post index to the $web container."""
+    """Write the full blog post index to the $web container.
+
+    The synchronous upload runs in a worker thread, as in write_article_index().
+    """
     client = _get_blog_container_client()
     index_blob = client.get_blob_client(BLOG_INDEX_BLOB)
-    index_data = json.dumps([p.model_dump(mode="json") for p in posts], indent=2)
-    index_blob.upload_blob(
+    index_data = _BLOG_INDEX_ADAPTER.dump_json(posts, indent=2)
+    await asyncio.to_thread(
+        index_blob.upload_blob,
         index_data,
         overwrite=True,
         content_settings=ContentSettings(content_type="application/json"),
@@ -280,14 +296,55 @@ async def read_blog_html(slug: str) -> str | None:
 async def write_article_index(articles: list[ArticleSummary]) -> None:
     """Write the full article index to blob storage.
 
+    The index is the largest blob ingestion writes, so the synchronous
+    upload runs in a worker thread instead of blocking the event loop.
+
     Args:
         articles: Complete list of article summaries to persist.
     """
     client = _get_container_client()
     index_blob = client.get_blob_client(INDEX_BLOB)
-    index_data = json.dumps([a.model_dump(mode="json") for a in articles], indent=2)
-    index_blob.upload_blob(
+    index_data = _ARTICLE_INDEX_ADAPTER.dump_json(articles, indent=2)
+    await asyncio.to_thread(
+        index_blob.upload_blob,
         index_data,
         overwrite=True,
         content_settings=ContentSettings(content_type="application/json"),
     )
+
+
+async def get_analysis_cache() -> dict[str, dict[str, Any]]:
+    """Read the cached article analyses, keyed by ``analysis_cache_key()``.
+
+    The cache only saves LLM calls, so a missing or unreadable blob gives
+    an empty cache rather than an error.
+    """
+    try:
+        client = _get_container_client()
+        blob = client.get_blob_client(ANALYSIS_CACHE_BLOB)
+        cache = orjson.loads(blob.download_blob().readall())
+        return cache if isinstance(cache, dict) else {}
+    except ResourceNotFoundError:
+        return {}
+    except HttpResponseError as e:
+        logger.warning("Azure API error reading analysis cache: %s", e.message)
+        return {}
+    except Exception as e:
+        logger.error("Unexpected error reading analysis cache: %s", e)
+        return {}
+
+
+async def write_analysis_cache(entries: dict[str, dict[str, Any]]) -> None:
+    """Write the article analysis cache to blob storage.
+
+    Like write_article_only(), the synchronous upload runs in a worker
+    thread so it doesn't block the event loop.
+    """
+    client = _get_container_client()
+    blob = client.get_blob_client(ANALYSIS_CACHE_BLOB)
+    await asyncio.to_thread(
+        blob.upload_blob,
+        orjson.dumps(entries),
+        overwrite=True,
+        content_settings=ContentSettings(content_type="application/json"),
+    )
@@ -10,7 +10,12 @@ from typing import Any
 
 from api.config import get_settings
 from api.services.cache import TTLCache
-from api.services.http_client import get_shared_client, github_api_get, github_headers
+from api.services.http_client import (
+    get_shared_client,
+    github_api_get,
+    github_headers,
+    parse_json,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -59,8 +64,7 @@ async def _fetch_project_items(
     Returns None on API error so callers can fall back to stale cache.
     """
     client = get_shared_client()
-    headers = github_headers()
-    headers["Content-Type"] = "application/json"
+    headers = {**github_headers(), "Content-Type": "application/json"}
     url = "https://api.github.com/graphql"
 
     all_items: list[dict[str, Any]] = []
@@ -84,7 +88,7 @@ async def _fetch_project_items(
                 )
                 return None if not all_items else all_items
 
-            data = resp.json()
+            data = parse_json(resp)
             errors = data.get("errors")
             if errors:
                 logger.warning("GraphQL errors: %s", errors)
@@ -118,16 +122,16 @@ async def _fetch_open_issue_numbers(repo: str) -> set[int] | None:
     Returns None on API error so callers can skip the untracked check.
     """
     url = f"https://api.github.com/repos/{repo}/issues"
+    headers = github_headers()
+    params = {"state": "open", "per_page": "100"}
     all_numbers: set[int] = set()
     page = 1
 
     while True:
-        params = {
-            "state": "open",
-            "per_page": "100",
-            "page": str(page),
-        }
-        data = await github_api_get(url, params, context=f"open issues page {page}")
+        params["page"] = str(page)
+        data = await github_api_get(
+            url, params, headers=headers, context=f"open issues page {page}"
+        )
         if data is None:
             return None if not all_numbers else all_numbers
 
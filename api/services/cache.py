@@ -1,7 +1,10 @@
 """Simple TTL cache with optional LRU eviction."""
 
+import asyncio
+import math
 import time
 from collections import OrderedDict
+from collections.abc import Awaitable, Callable
 from typing import Any
 
 
@@ -20,6 +23,10 @@ class TTLCache:
         self._max_size = max_size
         # OrderedDict preserves insertion order for LRU eviction
         self._store: OrderedDict[str, tuple[Any, float]] = OrderedDict()
+        # Per-key TTL overrides set via ``set(..., ttl=...)``
+        self._ttls: dict[str, float] = {}
+        # Refreshes in progress, keyed by cache key (see ``single_flight``)
+        self._inflight: dict[str, asyncio.Task[Any]] = {}
 
     def get(self, key: str) -> Any | None:
         """Return the cached value if present and not expired, else None.
@@ -31,7 +38,7 @@ class TTLCache:
         if entry is None:
             return None
         value, ts = entry
-        if time.time() - ts > self._ttl:
+        if time.time() - ts > self._ttls.get(key, self._ttl):
             return None
         # Move to end (most recently used)
         self._store.move_to_end(key)
@@ -50,11 +57,59 @@ class TTLCache:
         value, _ts = entry
         return value
 
-    def set(self, key: str, value: Any) -> None:
-        """Store a value under *key*, evicting the oldest entry if at capacity."""
+    def get_with_age(self, key: str) -> tuple[Any | None, float]:
+        """Return ``(value, age_seconds)`` for *key*, even if expired.
+
+        Lets callers apply their own soft/hard expiry, e.g. serving a stale
+        value while refreshing it in the background (stale-while-revalidate)
+        up to some maximum age.  Returns ``(None, inf)`` when the key is
+        missing.
+        """
+        entry = self._store.get(key)
+        if entry is None:
+            return None, math.inf
+        value, ts = entry
+        self._store.move_to_end(key)
+        return value, time.time() - ts
+
+    def set(self, key: str, value: Any, ttl: float | None = None) -> None:
+        """Store a value under *key*, evicting the oldest entry if at capacity.
+
+        *ttl* overrides the cache-wide TTL for this key, letting one cache
+        hold entries that go stale at different rates.
+        """
         if key in self._store:
             self._store.move_to_end(key)
         self._store[key] = (value, time.time())
+        if ttl is None:
+            self._ttls.pop(key, None)
+        else:
+            self._ttls[key] = ttl
         # Evict oldest entries if over max_size
         while len(self._store) > self._max_size:
-            self._store.popitem(last=False)
+            evicted, _ = self._store.popitem(last=False)
+            self._ttls.pop(evicted, None)
+
+    def single_flight(
+        self, key: str, refresh: Callable[[], Awaitable[Any]]
+    ) -> asyncio.Task[Any]:
+        """Return the in-flight refresh for *key*, starting one if none is running.
+
+        Concurrent misses on the same key await one shared task instead of
+        each calling *refresh*, so a burst of requests against a cold cache
+        costs a single upstream fetch.  The task is forgotten once it
+        finishes, successfully or not.
+        """
+        task = self._inflight.get(key)
+        if task is not None:
+            return task
+
+        task = asyncio.ensure_future(refresh())
+        self._inflight[key] = task
+
+        def _clear(done: asyncio.Task[Any]) -> None:
+            if self._inflight.get(key) is done:
+                del self._inflight[key]
+
+        task.add_done_callback(_clear)
+        return task
@@ -33,11 +33,14 @@ ACTOR_MAP: dict[str, str] = {
 }
 
 
+# Login -> role for activity attribution: the actor map plus the human
+# maintainer, folded together so agent_role is a single dict lookup.
+_ROLE_BY_LOGIN: dict[str, str] = {**ACTOR_MAP, "fbomb111": "human"}
+
+
 def agent_role(login: str) -> str | None:
     """Map a GitHub login to an agent role, or None if not a known actor."""
-    if login == "fbomb111":
-        return "human"
-    return ACTOR_MAP.get(login)
+    return _ROLE_BY_LOGIN.get(login)
 
 
 # Event types that represent interactive human actions (issues, comments, reviews)
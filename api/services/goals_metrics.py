@@ -11,6 +11,7 @@ Re-exports all public symbols so existing imports from
 
 import asyncio
 import logging
+from collections.abc import Awaitable, Callable
 from datetime import datetime, timedelta, timezone
 from typing import Any
 
@@ -24,6 +25,10 @@ from api.services.github_events import agent_role as _agent_role  # noqa: F401
 # keep working without changes to callers or tests.
 from api.services.goals_metrics_queries import (  # noqa: F401
     _count_commits,
+    _fetch_open_counts,
+    _floor_minute,
+    _iso,
+    _search_closed_issues,
     _search_count,
     _search_items,
 )
@@ -31,90 +36,183 @@ from api.services.goals_metrics_agents import (  # noqa: F401
     _empty_agent_stats,
     _fetch_agent_stats,
     _fetch_commits_by_agent,
+    _fetch_recent_prs,
     _fetch_review_counts,
 )
 from api.services.goals_metrics_windows import (  # noqa: F401
+    WindowCounts,
+    WindowedCounts,
+    _count_windows,
     _enforce_monotonic,
     _fetch_windowed_counts,
 )
-from api.services.http_client import fetch_merged_prs  # noqa: F401
 
 logger = logging.getLogger(__name__)
 
+# Each metrics component is cached under its own key and TTL.  Open
+# counts move minute to minute, per-agent 7d stats every few minutes, and
+# the 24h/7d/30d windows slowly, so one shared TTL would force the whole
+# blob to refresh at the pace of its most volatile part.
+#
+# Values are (soft, hard) TTLs in seconds.  Past the soft TTL the cached
+# value is still served while a background refresh runs; past the hard TTL
+# it is too old to show and callers wait for the refresh instead.
+_COMPONENT_TTLS: dict[str, tuple[float, float]] = {
+    "metrics:open": (60, 900),
+    "metrics:by_agent": (300, 1800),
+    "metrics:windowed": (600, 3600),
+}
+
+# Soft TTLs scale with how busy the repo is, measured as merged PRs plus
+# commits in the last 24h: (minimum activity, multiplier), busiest first.
+# A busy repo refreshes sooner so the dashboard keeps up; a quiet one
+# refreshes less often and spends less GitHub quota.
+_ACTIVITY_TTL_SCALES: tuple[tuple[int, float], ...] = ((20, 0.5), (5, 1.0), (0, 2.0))
+
+_EMPTY_WINDOW: WindowCounts = {"24h": 0, "7d": 0, "30d": 0}
+
 
 async def get_metrics(cache: TTLCache) -> dict[str, Any]:
     """Compute agent metrics with trend windows (24h / 7d / 30d).
 
-    On partial API failures, substitutes stale cached values for the
-    failed components instead of serving zeros (#326).  Mirrors the
-    pattern used by the stats endpoint (#302, #305).
+    Open counts, windowed trends and per-agent stats are cached and
+    refreshed independently (see ``_COMPONENT_TTLS``) and merged here.
+    Each component serves stale-while-revalidate: an entry past its soft
+    TTL is returned immediately while a background task refreshes it, so
+    callers only wait on GitHub for a cold or badly outdated entry.
+    Concurrent refreshes of a component are coalesced into one task.
     """
-    cached = cache.get("metrics")
-    if cached is not None:
-        return cached
-
-    settings = get_settings()
-    repo = settings.github_repo
-
-    empty_window: dict[str, int] = {"24h": 0, "7d": 0, "30d": 0}
+    parts = await asyncio.gather(
+        _get_component(cache, "metrics:open", _refresh_open_counts),
+        _get_component(cache, "metrics:windowed", _refresh_windowed),
+        _get_component(cache, "metrics:by_agent", _refresh_agent_stats),
+        return_exceptions=True,
+    )
     metrics: dict[str, Any] = {
         "open_issues": 0,
         "open_prs": 0,
-        "issues_closed": {**empty_window},
-        "prs_merged": {**empty_window},
-        "commits": {**empty_window},
+        "issues_closed": {**_EMPTY_WINDOW},
+        "prs_merged": {**_EMPTY_WINDOW},
+        "commits": {**_EMPTY_WINDOW},
         "by_agent": {},
     }
+    for part in parts:
+        if isinstance(part, BaseException):
+            logger.error("metrics component failed: %s", part)
+            continue
+        metrics.update(part)
+    return metrics
+
 
+async def _get_component(
+    cache: TTLCache,
+    key: str,
+    refresh: Callable[[TTLCache], Awaitable[dict[str, Any]]],
+) -> dict[str, Any]:
+    """Return one cached metrics component, refreshing it when expired."""
+    # Fresh within the soft TTL the entry was stored with (see _soft_ttl)
+    fresh = cache.get(key)
+    if fresh is not None:
+        return fresh
+
+    cached, age = cache.get_with_age(key)
+    task = cache.single_flight(key, lambda: refresh(cache))
+    if cached is not None and age <= _COMPONENT_TTLS[key][1]:
+        return cached
+
+    # Shield so a cancelled caller doesn't cancel the refresh for the others
+    return await asyncio.shield(task)
+
+
+def _soft_ttl(key: str, windowed: dict[str, Any] | None) -> float:
+    """Return the soft TTL for *key*, scaled by recent repo activity.
+
+    *windowed* is the latest windowed metrics component, if any.  The
+    result never exceeds the component's hard TTL.
+    """
+    soft_ttl, hard_ttl = _COMPONENT_TTLS[key]
+    if windowed is None:
+        return soft_ttl
+    activity = sum(
+        (windowed.get(name) or {}).get("24h") or 0 for name in ("prs_merged", "commits")
+    )
+    for min_activity, scale in _ACTIVITY_TTL_SCALES:
+        if activity >= min_activity:
+            return min(soft_ttl * scale, hard_ttl)
+    return soft_ttl
+
+
+async def _refresh_open_counts(cache: TTLCache) -> dict[str, Any]:
+    """Fetch open issue and PR counts and cache them."""
+    repo = get_settings().github_repo
     try:
-        now = datetime.now(timezone.utc)
-        since_7d = (now - timedelta(days=7)).strftime("%Y-%m-%dT%H:%M:%SZ")
-
-        # Fetch open issues/PRs counts, windowed metrics, and agent stats in parallel
-        open_issues_task = _search_count(f"repo:{repo} is:issue is:open")
-        open_prs_task = _search_count(f"repo:{repo} is:pr is:open")
-        windowed_task = _fetch_windowed_counts(repo, now)
-        agent_stats_task = _fetch_agent_stats(repo, since_7d)
-
-        open_issues, open_prs, windowed, agent_stats = await asyncio.gather(
-            open_issues_task, open_prs_task, windowed_task, agent_stats_task
-        )
-
-        metrics["open_issues"] = open_issues if open_issues is not None else 0
-        metrics["open_prs"] = open_prs if open_prs is not None else 0
-        metrics["issues_closed"] = windowed["issues_closed"]
-        metrics["by_agent"] = agent_stats
-
-        # Detect partial failures: _fetch_windowed_counts returns None
-        # values when the underlying API call failed (#326).  Substitute
-        # stale cached values for failed components instead of zeros.
-        prs_failed = any(v is None for v in windowed["prs_merged"].values())
-        commits_failed = any(v is None for v in windowed["commits"].values())
-
-        if prs_failed or commits_failed:
-            stale = cache.get_stale("metrics")
-            if stale is not None:
-                if prs_failed:
-                    metrics["prs_merged"] = stale.get("prs_merged", {**empty_window})
-                else:
-                    metrics["prs_merged"] = windowed["prs_merged"]
-                if commits_failed:
-                    metrics["commits"] = stale.get("commits", {**empty_window})
-                else:
-                    metrics["commits"] = windowed["commits"]
-            else:
-                # No stale data — use zeros rather than None
-                metrics["prs_merged"] = {**empty_window}
-                metrics["commits"] = {**empty_window}
+        open_issues, open_prs = await _fetch_open_counts(repo)
+    except Exception:
+        logger.exception("open counts fetch failed")
+        stale = cache.get_stale("metrics:open")
+        if stale is not None:
+            return stale
+        open_issues = open_prs = None
+
+    counts = {
+        "open_issues": open_issues if open_issues is not None else 0,
+        "open_prs": open_prs if open_prs is not None else 0,
+    }
+    ttl = _soft_ttl("metrics:open", cache.get_stale("metrics:windowed"))
+    cache.set("metrics:open", counts, ttl=ttl)
+    return counts
+
+
+async def _refresh_windowed(cache: TTLCache) -> dict[str, Any]:
+    """Fetch 24h/7d/30d trend windows and cache them.
+
+    On partial API failures, substitutes stale cached values for the
+    failed components instead of serving zeros (#326).  Mirrors the
+    pattern used by the stats endpoint (#302, #305).
+    """
+    repo = get_settings().github_repo
+    stale = cache.get_stale("metrics:windowed")
+    try:
+        windowed = await _fetch_windowed_counts(repo, datetime.now(timezone.utc))
+    except Exception:
+        logger.exception("windowed metrics fetch failed")
+        if stale is not None:
+            return stale
+        windowed = {
+            "issues_closed": {**_EMPTY_WINDOW},
+            "prs_merged": {**_EMPTY_WINDOW},
+            "commits": {**_EMPTY_WINDOW},
+        }
+
+    result: dict[str, Any] = {"issues_closed": windowed["issues_closed"]}
+
+    # _fetch_windowed_counts returns None values when the underlying API
+    # call failed (#326).  Use the stale value, or zeros if there is none.
+    for name in ("prs_merged", "commits"):
+        if any(v is None for v in windowed[name].values()):
+            fallback = stale.get(name) if stale is not None else None
+            result[name] = fallback or {**_EMPTY_WINDOW}
         else:
-            metrics["prs_merged"] = windowed["prs_merged"]
-            metrics["commits"] = windowed["commits"]
+            result[name] = windowed[name]
 
+    cache.set("metrics:windowed", result, ttl=_soft_ttl("metrics:windowed", result))
+    return result
+
+
+async def _refresh_agent_stats(cache: TTLCache) -> dict[str, Any]:
+    """Fetch per-agent 7-day activity stats and cache them."""
+    repo = get_settings().github_repo
+    since_7d = _iso(_floor_minute(datetime.now(timezone.utc) - timedelta(days=7)))
+    try:
+        agent_stats = await _fetch_agent_stats(repo, since_7d)
     except Exception:
-        logger.exception("metrics fetch failed")
-        stale = cache.get_stale("metrics")
+        logger.exception("agent stats fetch failed")
+        stale = cache.get_stale("metrics:by_agent")
         if stale is not None:
             return stale
+        agent_stats = {}
 
-    cache.set("metrics", metrics)
-    return metrics
+    result = {"by_agent": agent_stats}
+    ttl = _soft_ttl("metrics:by_agent", cache.get_stale("metrics:windowed"))
+    cache.set("metrics:by_agent", result, ttl=ttl)
+    return result
@@ -5,20 +5,62 @@ Review counting, commit attribution, and per-agent stats assembly.
 
 import asyncio
 import logging
+from collections import Counter, defaultdict
 from typing import Any
 
 from api.services.github_events import agent_role as _agent_role
 from api.services.http_client import (
-    fetch_merged_prs,
+    _PR_FIELDS,
+    _SEARCH_RESULT_LIMIT,
     get_shared_client,
-    github_api_get,
     github_headers,
+    last_page_number,
+    paginated_rest_api,
+    parse_json,
 )
 
-from .goals_metrics_queries import _search_items
+from .goals_metrics_queries import (
+    Q_ISSUES_OPENED_SINCE,
+    Q_PRS_UPDATED_SINCE,
+    _search_closed_issues,
+    _search_items,
+    _since_iso,
+)
 
 logger = logging.getLogger(__name__)
 
+# Most commit pages fetched at once when the Link header reveals the rest
+_COMMIT_PAGE_CONCURRENCY = 8
+
+# PRs matching a search query with their reviews.  Reviews come back
+# oldest first, so ``last`` keeps the most recent ones for PRs that have
+# more than a page of them.  GraphQL reports app logins without the
+# "[bot]" suffix REST uses, hence ``__typename``.
+_PR_REVIEWS_QUERY = """
+query($q: String!, $cursor: String) {
+  search(query: $q, type: ISSUE, first: 100, after: $cursor) {
+    issueCount
+    pageInfo {
+      hasNextPage
+      endCursor
+    }
+    nodes {
+      ... on PullRequest {
+        reviews(last: 100) {
+          nodes {
+            submittedAt
+            author {
+              __typename
+              login
+            }
+          }
+        }
+      }
+    }
+  }
+}
+"""
+
 
 def _empty_agent_stats() -> dict[str, int]:
     """Return a fresh per-agent stats dict."""
@@ -32,206 +74,284 @@ def _empty_agent_stats() -> dict[str, int]:
     }
 
 
-async def _fetch_review_counts(repo: str, since_str: str) -> dict[str, int]:
-    """Count PR reviews per agent role within the time window.
+def _item_login(item: dict[str, Any]) -> str:
+    """Return an item's author login, or "" if missing (e.g. deleted user)."""
+    try:
+        return item["user"]["login"]
+    except (KeyError, TypeError):
+        return ""
+
 
-    Fetches recently updated PRs (open and closed), then fetches reviews
-    for each and counts those submitted on or after since_str.
+def _closer_login(issue: dict[str, Any]) -> str:
+    """Return the login credited with closing an issue.
+
+    Uses the first assignee (more accurate for agent work), falling back
+    to the issue author.
     """
-    # Fetch recently updated PRs (both open and closed) to find review activity
-    client = get_shared_client()
-    headers = github_headers()
-    pr_numbers: list[int] = []
-
-    if "T" not in since_str:
-        since_iso = since_str + "T00:00:00Z"
-    else:
-        since_iso = since_str
-
-    for state in ("open", "closed"):
-        page = 1
-        while True:
-            url = f"https://api.github.com/repos/{repo}/pulls"
-            params = {
-                "state": state,
-                "sort": "updated",
-                "direction": "desc",
-                "per_page": "100",
-                "page": str(page),
-            }
-            try:
-                resp = await client.get(url, headers=headers, params=params)
-                if resp.status_code != 200:
-                    break
-                items = resp.json()
-                if not items:
-                    break
-                for pr in items:
-                    pr_numbers.append(pr["number"])
-                # Stop if oldest item on this page was updated before our window
-                oldest_updated = items[-1].get("updated_at", "")
-                if oldest_updated and oldest_updated < since_iso:
-                    break
-                if len(items) < 100:
-                    break
-                page += 1
-            except Exception:
-                logger.exception("PR list error (state=%s, page=%d)", state, page)
-                break
+    assignees = issue.get("assignees", [])
+    login = assignees[0].get("login", "") if assignees else ""
+    return login or _item_login(issue)
+
+
+def _counts_by_role(login_counts: Counter[str]) -> dict[str, int]:
+    """Collapse per-login counts into per-role counts, dropping unknowns."""
+    counts: defaultdict[str, int] = defaultdict(int)
+    for login, count in login_counts.items():
+        role = _agent_role(login)
+        if role:
+            counts[role] += count
+    return dict(counts)
+
+
+def _add_role_counts(
+    agent_stats: defaultdict[str, dict[str, int]],
+    role_counts: dict[str, int],
+    field: str,
+) -> None:
+    """Add per-role counts to ``agent_stats[role][field]``."""
+    for role, count in role_counts.items():
+        agent_stats[role][field] += count
+
+
+def _add_login_counts(
+    agent_stats: defaultdict[str, dict[str, int]],
+    login_counts: Counter[str],
+    field: str,
+) -> None:
+    """Add per-login counts to ``agent_stats[role][field]``.
+
+    Counting by login first means each distinct login is resolved to a
+    role once per batch rather than once per item.
+    """
+    _add_role_counts(agent_stats, _counts_by_role(login_counts), field)
+
+
+async def _fetch_recent_prs(
+    repo: str, since_str: str, *, headers: dict[str, str] | None = None
+) -> list[dict[str, Any]] | None:
+    """Fetch PRs opened or merged since a date in one Pulls REST traversal.
 
-    if not pr_numbers:
-        return {}
+    Any PR opened or merged in the window was also updated in it, so a
+    single ``state=all`` listing sorted by ``updated`` covers both the
+    prs_opened and prs_merged stats (replacing a Search API query plus a
+    separate merged-PR fetch).
 
-    # Fetch reviews for each PR in parallel
-    async def _get_reviews(pr_number: int) -> list[dict[str, Any]]:
-        result = await github_api_get(
-            f"https://api.github.com/repos/{repo}/pulls/{pr_number}/reviews",
-            context=f"reviews for PR #{pr_number}",
+    Returns None if the first page fails so callers can skip the category.
+    """
+
+    def opened_or_merged(pr: dict[str, Any], since_iso: str) -> bool:
+        return any(
+            (pr.get(key) or "") >= since_iso for key in ("created_at", "merged_at")
         )
-        return result if isinstance(result, list) else []
 
-    all_reviews = await asyncio.gather(*[_get_reviews(n) for n in pr_numbers])
+    return await paginated_rest_api(
+        f"https://api.github.com/repos/{repo}/pulls",
+        since_str,
+        filter_fn=opened_or_merged,
+        state="all",
+        fields=_PR_FIELDS,
+        headers=headers,
+        context="recent PRs",
+    )
+
+
+async def _fetch_review_counts(
+    repo: str, since_str: str, *, headers: dict[str, str] | None = None
+) -> dict[str, int] | None:
+    """Count PR reviews per agent role within the time window.
+
+    One GraphQL search returns every PR updated in the window together with
+    its reviews, 100 PRs per page, instead of listing PRs over REST and then
+    fetching each PR's reviews separately.  Reviews submitted on or after
+    since_str are counted.  Like the search it runs on, the count covers at
+    most 1000 PRs.
+
+    Returns None when no token is configured (GraphQL requires one) or the
+    first page fails, so callers can skip the category; after a later page
+    fails, returns whatever was counted before it.
+    """
+    since_iso = _since_iso(since_str)
+
+    client = get_shared_client()
+    if headers is None:
+        headers = github_headers()
+    if "Authorization" not in headers:
+        logger.warning("No GitHub token; skipping PR review counts")
+        return None
+    query = Q_PRS_UPDATED_SINCE.format(repo=repo, since=since_iso)
+    reviewers: Counter[str] = Counter()
+    cursor = None
+    first_page = True
+
+    while True:
+        variables: dict[str, Any] = {"q": query}
+        if cursor:
+            variables["cursor"] = cursor
+        try:
+            resp = await client.post(
+                "https://api.github.com/graphql",
+                headers=headers,
+                json={"query": _PR_REVIEWS_QUERY, "variables": variables},
+            )
+            if resp.status_code != 200:
+                logger.warning(
+                    "GraphQL API returned %d for PR reviews", resp.status_code
+                )
+                break
+            data = parse_json(resp)
+            if data.get("errors"):
+                logger.warning("GraphQL errors: %s", data["errors"])
+                break
+            search = data.get("data", {}).get("search") or {}
+        except Exception:
+            logger.exception("GraphQL error fetching PR reviews")
+            break
 
-    # Count reviews per agent role, filtering by submission date
-    counts: dict[str, int] = {}
-    for reviews in all_reviews:
-        for review in reviews:
-            submitted_at = review.get("submitted_at", "")
-            if not submitted_at or submitted_at < since_iso:
-                continue
-            login = review.get("user", {}).get("login", "")
-            role = _agent_role(login)
-            if not role:
-                continue
-            counts[role] = counts.get(role, 0) + 1
+        if first_page:
+            first_page = False
+            if search.get("issueCount", 0) > _SEARCH_RESULT_LIMIT:
+                logger.warning(
+                    "%d PRs updated since %s; review counts cover only the first %d",
+                    search["issueCount"],
+                    since_iso,
+                    _SEARCH_RESULT_LIMIT,
+                )
+
+        # Tally in-window reviews per login; each distinct reviewer is
+        # resolved to a role once at the end
+        for pr in search.get("nodes") or ():
+            for review in ((pr or {}).get("reviews") or {}).get("nodes") or ():
+                submitted_at = review.get("submittedAt") or ""
+                author = review.get("author") or {}
+                login = author.get("login")
+                if not login or submitted_at < since_iso:
+                    continue
+                if author.get("__typename") == "Bot":
+                    login += "[bot]"
+                reviewers[login] += 1
+
+        page_info = search.get("pageInfo") or {}
+        if not page_info.get("hasNextPage"):
+            break
+        cursor = page_info.get("endCursor")
 
-    return counts
+    if first_page:
+        return None
+    return _counts_by_role(reviewers)
 
 
-async def _fetch_commits_by_agent(repo: str, since_str: str) -> dict[str, int]:
+async def _fetch_commits_by_agent(
+    repo: str, since_str: str, *, headers: dict[str, str] | None = None
+) -> dict[str, int]:
     """Count commits per agent role within the time window.
 
     Fetches all commits in the window and attributes them client-side
     using commit.author.login. The GitHub Commits API author parameter
     does not work for bot accounts, so we fetch all and filter locally.
     """
-    if "T" not in since_str:
-        since_iso = since_str + "T00:00:00Z"
-    else:
-        since_iso = since_str
+    since_iso = _since_iso(since_str)
 
     client = get_shared_client()
-    headers = github_headers()
-    all_commits: list[dict[str, Any]] = []
-    page = 1
+    if headers is None:
+        headers = github_headers()
+    url = f"https://api.github.com/repos/{repo}/commits"
 
-    while True:
-        url = f"https://api.github.com/repos/{repo}/commits"
+    semaphore = asyncio.Semaphore(_COMMIT_PAGE_CONCURRENCY)
+
+    async def fetch_page(
+        page: int,
+    ) -> tuple[list[dict[str, Any]], int | None] | None:
+        """Return a page of commits and the Link header's last page, or None."""
         params = {"since": since_iso, "per_page": "100", "page": str(page)}
         try:
-            resp = await client.get(url, headers=headers, params=params)
+            async with semaphore:
+                resp = await client.get(url, headers=headers, params=params)
             if resp.status_code != 200:
-                break
-            items = resp.json()
-            if not items:
-                break
-            all_commits.extend(items)
-            if len(items) < 100:
-                break
-            page += 1
+                return None
+            return parse_json(resp), last_page_number(resp)
         except Exception:
             logger.exception("Commits fetch error (page=%d)", page)
+            return None
+
+    all_commits: list[dict[str, Any]] = []
+    page = 1
+    while (result := await fetch_page(page)) is not None:
+        items, last_page = result
+        all_commits.extend(items)
+        if len(items) < 100:
             break
+        if last_page is not None and last_page > page:
+            # The Link header gives the page count, so fetch the rest
+            # concurrently (fetch_page caps how many run at once)
+            rest = await asyncio.gather(
+                *(fetch_page(p) for p in range(page + 1, last_page + 1)),
+                return_exceptions=True,
+            )
+            for other in rest:
+                if other is None or isinstance(other, BaseException):
+                    break
+                all_commits.extend(other[0])
+            break
+        page += 1
 
-    counts: dict[str, int] = {}
-    for commit in all_commits:
-        login = (commit.get("author") or {}).get("login", "")
-        role = _agent_role(login)
-        if not role:
-            continue
-        counts[role] = counts.get(role, 0) + 1
-    return counts
+    authors = Counter(
+        (commit.get("author") or {}).get("login", "") for commit in all_commits
+    )
+    return _counts_by_role(authors)
 
 
 async def _fetch_agent_stats(repo: str, since_str: str) -> dict[str, dict[str, int]]:
     """Fetch per-agent activity stats for the last 7 days."""
-    issues_closed_query = f"repo:{repo} is:issue is:closed closed:>={since_str}"
-    issues_opened_query = f"repo:{repo} is:issue created:>={since_str}"
-    prs_opened_query = f"repo:{repo} is:pr created:>={since_str}"
+    issues_opened_query = Q_ISSUES_OPENED_SINCE.format(repo=repo, since=since_str)
+
+    since_iso = _since_iso(since_str)
+
+    # Resolved once so every fetch in the fan-out sends the same token
+    headers = github_headers()
 
     (
         issues_closed_items,
         issues_opened_items,
-        prs_opened_items,
-        prs_merged_items,
+        recent_prs,
         review_counts,
         commit_counts,
     ) = await asyncio.gather(
-        _search_items(issues_closed_query),
-        _search_items(issues_opened_query),
-        _search_items(prs_opened_query),
-        fetch_merged_prs(repo, since_str),
-        _fetch_review_counts(repo, since_str),
-        _fetch_commits_by_agent(repo, since_str),
+        # Filtered from the 30-day search shared with the windowed trends
+        _search_closed_issues(repo, since_iso, headers=headers),
+        _search_items(issues_opened_query, headers=headers),
+        _fetch_recent_prs(repo, since_str, headers=headers),
+        _fetch_review_counts(repo, since_str, headers=headers),
+        _fetch_commits_by_agent(repo, since_str, headers=headers),
     )
 
-    agent_stats: dict[str, dict[str, int]] = {}
+    agent_stats: defaultdict[str, dict[str, int]] = defaultdict(_empty_agent_stats)
 
     # Only process each category if its API call succeeded (not None).
     # Skipping failed categories avoids overwriting real data with zeros.
     if issues_closed_items is not None:
-        for item in issues_closed_items:
-            # Use assignee as closer (more accurate for agent work)
-            assignees = item.get("assignees", [])
-            login = assignees[0].get("login", "") if assignees else ""
-            if not login:
-                login = item.get("user", {}).get("login", "")
-            role = _agent_role(login)
-            if not role:
-                continue
-            if role not in agent_stats:
-                agent_stats[role] = _empty_agent_stats()
-            agent_stats[role]["issues_closed"] += 1
+        closers = Counter(map(_closer_login, issues_closed_items))
+        _add_login_counts(agent_stats, closers, "issues_closed")
 
     if issues_opened_items is not None:
-        for item in issues_opened_items:
-            login = item.get("user", {}).get("login", "")
-            role = _agent_role(login)
-            if not role:
-                continue
-            if role not in agent_stats:
-                agent_stats[role] = _empty_agent_stats()
-            agent_stats[role]["issues_opened"] += 1
-
-    if prs_opened_items is not None:
-        for item in prs_opened_items:
-            login = item.get("user", {}).get("login", "")
-            role = _agent_role(login)
-            if not role:
-                continue
-            if role not in agent_stats:
-                agent_stats[role] = _empty_agent_stats()
-            agent_stats[role]["prs_opened"] += 1
-
-    for item in prs_merged_items or []:
-        login = item.get("user", {}).get("login", "")
-        role = _agent_role(login)
-        if not role:
-            continue
-        if role not in agent_stats:
-            agent_stats[role] = _empty_agent_stats()
-        agent_stats[role]["prs_merged"] += 1
-
-    # Merge review counts into agent stats
-    for role, count in review_counts.items():
-        if role not in agent_stats:
-            agent_stats[role] = _empty_agent_stats()
-        agent_stats[role]["reviews"] = count
-
-    # Merge commit counts into agent stats
-    for role, count in commit_counts.items():
-        if role not in agent_stats:
-            agent_stats[role] = _empty_agent_stats()
-        agent_stats[role]["commits"] = count
-
-    return agent_stats
+        openers = Counter(map(_item_login, issues_opened_items))
+        _add_login_counts(agent_stats, openers, "issues_opened")
+
+    # prs_opened and prs_merged both come from one pass over the PR listing
+    if recent_prs is not None:
+        prs_opened: Counter[str] = Counter()
+        prs_merged: Counter[str] = Counter()
+        for pr in recent_prs:
+            login = _item_login(pr)
+            if pr.get("created_at", "") >= since_iso:
+                prs_opened[login] += 1
+            if (pr.get("merged_at") or "") >= since_iso:
+                prs_merged[login] += 1
+        _add_login_counts(agent_stats, prs_opened, "prs_opened")
+        _add_login_counts(agent_stats, prs_merged, "prs_merged")
+
+    # Review and commit counts arrive already resolved to roles
+    if review_counts is not None:
+        _add_role_counts(agent_stats, review_counts, "reviews")
+    _add_role_counts(agent_stats, commit_counts, "commits")
+
+    return dict(agent_stats)
@@ -3,82 +3,257 @@
 Generic paginated search/count wrappers used by the metrics pipeline.
 """
 
+import asyncio
 import logging
-from typing import Any
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timedelta, timezone
+from typing import Any, TypeVar
 
+from api.services.cache import TTLCache
 from api.services.http_client import (
+    _SEARCH_RESULT_LIMIT,
     get_shared_client,
     github_api_get,
     github_headers,
+    last_page_number,
     paginated_github_search,
+    parse_json,
 )
 
 logger = logging.getLogger(__name__)
 
+# Search API query templates.  Keeping them in one place guarantees that
+# every caller issues byte-identical queries for the same repo and cutoff,
+# so they share _query_cache keys with each other.
+Q_ISSUES_CLOSED_SINCE = "repo:{repo} is:issue is:closed closed:>={since}"
+Q_ISSUES_OPENED_SINCE = "repo:{repo} is:issue created:>={since}"
+Q_PRS_UPDATED_SINCE = "repo:{repo} is:pr updated:>={since}"
 
-async def _search_count(query: str) -> int | None:
+# GitHub's timestamp format.  Cutoffs rendered with it compare correctly
+# against API timestamps as plain strings, with no parsing.
+_ISO_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+
+# The 30-day closed-issue search behind both the windowed trends and the
+# per-agent stats.  Entries are (cutoff, items); kept briefly so that
+# refreshes running together share one paginated search.
+_CLOSED_ISSUES_WINDOW = timedelta(days=30)
+_closed_issues_cache = TTLCache(ttl=60, max_size=4)
+
+# Results of _search_count, _search_items and _count_commits, keyed by
+# query.  Callers floor their cutoffs to the minute (see _floor_minute), so
+# refreshes and retries within the TTL repeat the same queries and are
+# served from here instead of spending Search API quota.
+_QUERY_CACHE_TTL = 60
+_query_cache = TTLCache(ttl=_QUERY_CACHE_TTL, max_size=64)
+
+_T = TypeVar("_T")
+
+
+def _iso(dt: datetime) -> str:
+    """Render a UTC datetime in GitHub's timestamp format."""
+    return dt.strftime(_ISO_FORMAT)
+
+
+def _floor_minute(dt: datetime) -> datetime:
+    """Drop seconds so cutoffs computed within a minute of each other match."""
+    return dt.replace(second=0, microsecond=0)
+
+
+async def _cached_query(
+    key: str, fetch: Callable[[], Awaitable[_T | None]]
+) -> _T | None:
+    """Return ``fetch()``'s result for *key* from ``_query_cache`` or fetch it.
+
+    Concurrent misses share one fetch.  None (an API error) is not cached,
+    so the next caller retries.
+    """
+    cached = _query_cache.get(key)
+    if cached is not None:
+        return cached
+
+    async def refresh() -> _T | None:
+        result = await fetch()
+        if result is not None:
+            _query_cache.set(key, result)
+        return result
+
+    return await asyncio.shield(_query_cache.single_flight(key, refresh))
+
+
+def _since_iso(since: str) -> str:
+    """Widen a date-only *since* to midnight UTC; timestamps pass through."""
+    return since if "T" in since else since + "T00:00:00Z"
+
+
+async def _search_count(
+    query: str, *, headers: dict[str, str] | None = None
+) -> int | None:
     """Run a GitHub search and return the total_count.
 
     Returns None on API errors so callers can distinguish "zero results"
-    from "request failed".
+    from "request failed".  Results are cached briefly (``_query_cache``).
     """
-    data = await github_api_get(
-        "https://api.github.com/search/issues",
-        params={"q": query, "per_page": "1"},
-        context=f"search count: {query}",
-    )
-    if data is None:
-        return None
-    return data.get("total_count", 0) if isinstance(data, dict) else 0
+
+    async def fetch() -> int | None:
+        data = await github_api_get(
+            "https://api.github.com/search/issues",
+            params={"q": query, "per_page": "1"},
+            headers=headers,
+            context=f"search count: {query}",
+        )
+        if data is None:
+            return None
+        return data.get("total_count", 0) if isinstance(data, dict) else 0
+
+    return await _cached_query(f"count:{query}", fetch)
 
 
-async def _search_items(query: str) -> list[dict[str, Any]] | None:
+async def _search_items(
+    query: str, *, headers: dict[str, str] | None = None
+) -> list[dict[str, Any]] | None:
     """Run a GitHub search and return all items, paginating if needed.
 
     The GitHub Search API returns at most 100 items per page (max 1000 total).
     This function fetches successive pages until all results are collected.
 
     Returns None on API errors so callers can distinguish "no results"
-    from "request failed".
+    from "request failed".  Results are cached briefly (``_query_cache``)
+    and shared between callers, so they must not be mutated.
     """
-    return await paginated_github_search(
-        "https://api.github.com/search/issues",
-        {"q": query},
-        context=f"search: {query}",
+    return await _cached_query(
+        f"search:{query}",
+        lambda: paginated_github_search(
+            "https://api.github.com/search/issues",
+            {"q": query},
+            headers=headers,
+            context=f"search: {query}",
+        ),
     )
 
 
-async def _count_commits(repo: str, since: str) -> int | None:
-    """Count commits on default branch since a given ISO date.
+async def _search_closed_issues(
+    repo: str, since: str, *, headers: dict[str, str] | None = None
+) -> list[dict[str, Any]] | None:
+    """Return the issues in *repo* closed at or after *since*.
 
-    Returns None on API errors so callers can distinguish "zero commits"
+    Serves from one shared search covering the last 30 days (cutoff
+    floored to the minute, so callers computing their own cutoff a moment
+    earlier still fall inside it), filtered client-side by ``closed_at``.
+    Falls back to a dedicated search when *since* predates the shared
+    window or the shared result hit the Search API's 1000-item cap.
+
+    Returns None on API errors, like ``_search_items``.
+    """
+    key = f"closed:{repo}"
+    cached = _closed_issues_cache.get(key)
+    if cached is None:
+
+        async def refresh() -> tuple[str, list[dict[str, Any]] | None]:
+            cutoff = _iso(
+                _floor_minute(datetime.now(timezone.utc) - _CLOSED_ISSUES_WINDOW)
+            )
+            items = await _search_items(
+                Q_ISSUES_CLOSED_SINCE.format(repo=repo, since=cutoff), headers=headers
+            )
+            # Failures are not cached, so the next caller retries
+            if items is not None:
+                _closed_issues_cache.set(key, (cutoff, items))
+            return cutoff, items
+
+        cached = await asyncio.shield(_closed_issues_cache.single_flight(key, refresh))
+
+    cutoff, items = cached
+    if since < cutoff or (items is not None and len(items) >= _SEARCH_RESULT_LIMIT):
+        return await _search_items(
+            Q_ISSUES_CLOSED_SINCE.format(repo=repo, since=since), headers=headers
+        )
+    if items is None:
+        return None
+    # Fixed-width ISO timestamps compare correctly as strings
+    return [item for item in items if (item.get("closed_at") or "") >= since]
+
+
+async def _count_listing(
+    url: str,
+    params: dict[str, str],
+    *,
+    headers: dict[str, str] | None = None,
+    context: str = "",
+) -> int | None:
+    """Count the items in a REST listing from a single ``per_page=1`` request.
+
+    With one item per page, the Link header's last page number is the
+    total, so nothing beyond the first item is transferred.
+
+    Returns None on API errors so callers can distinguish "zero items"
     from "request failed".
 
     Uses raw httpx instead of github_api_get because it needs the Link
-    response header to extract the total page count without fetching all
-    commits. github_api_get only returns parsed JSON bodies.
+    response header, and github_api_get only returns parsed JSON bodies.
     """
-    url = f"https://api.github.com/repos/{repo}/commits"
-    params = {"since": since, "per_page": "1"}
     client = get_shared_client()
-    headers = github_headers()
+    if headers is None:
+        headers = github_headers()
     try:
-        resp = await client.get(url, headers=headers, params=params)
+        resp = await client.get(
+            url, headers=headers, params={**params, "per_page": "1"}
+        )
         if resp.status_code != 200:
             return None
-        # Use the Link header to get total count if available
-        # Otherwise fall back to fetching all and counting
-        link = resp.headers.get("Link", "")
-        if 'rel="last"' in link:
-            # Parse last page number from Link header
-            for part in link.split(","):
-                if 'rel="last"' in part:
-                    url_part = part.split(";")[0].strip().strip("<>")
-                    for param in url_part.split("?")[1].split("&"):
-                        if param.startswith("page="):
-                            return int(param.split("=")[1])
+        last_page = last_page_number(resp)
+        if last_page is not None:
+            return last_page
         # If no Link header, the result fits in one page
-        return len(resp.json())
+        return len(parse_json(resp))
     except Exception:
-        logger.exception("Commits count error")
+        logger.exception("%s count error", context or "Listing")
         return None
+
+
+async def _count_commits(
+    repo: str, since: str, *, headers: dict[str, str] | None = None
+) -> int | None:
+    """Count commits on default branch since a given ISO date.
+
+    Returns None on API errors so callers can distinguish "zero commits"
+    from "request failed".  Results are cached briefly (``_query_cache``).
+    """
+    return await _cached_query(
+        f"commits:{repo}:{since}",
+        lambda: _count_listing(
+            f"https://api.github.com/repos/{repo}/commits",
+            {"since": since},
+            headers=headers,
+            context="Commits",
+        ),
+    )
+
+
+async def _fetch_open_counts(repo: str) -> tuple[int | None, int | None]:
+    """Return ``(open_issues, open_prs)`` without spending Search API quota.
+
+    The Search API allows only 30 requests a minute, so the open counts
+    come from the core REST API instead: the repo's ``open_issues_count``
+    (which includes PRs) and a count of the open PR listing.  Either value
+    is None if the requests it depends on failed.
+    """
+    headers = github_headers()
+    repo_info, open_prs = await asyncio.gather(
+        github_api_get(
+            f"https://api.github.com/repos/{repo}",
+            headers=headers,
+            context="repo info",
+        ),
+        _count_listing(
+            f"https://api.github.com/repos/{repo}/pulls",
+            {"state": "open"},
+            headers=headers,
+            context="Open PRs",
+        ),
+    )
+    open_total = (
+        repo_info.get("open_issues_count") if isinstance(repo_info, dict) else None
+    )
+    if open_total is None or open_prs is None:
+        return None, open_prs
+    return max(open_total - open_prs, 0), open_prs
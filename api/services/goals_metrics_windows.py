@@ -6,14 +6,38 @@ and commits.
 
 import asyncio
 import logging
+from collections.abc import Iterable
 from datetime import datetime, timedelta
+from typing import TypedDict
 
-from api.services.http_client import fetch_merged_prs
+from api.services.http_client import fetch_merged_prs, github_headers
 
-from .goals_metrics_queries import _count_commits, _search_count
+from .goals_metrics_queries import (
+    _count_commits,
+    _floor_minute,
+    _iso,
+    _search_closed_issues,
+)
 
 logger = logging.getLogger(__name__)
 
+# Cumulative count per trend window (the keys aren't identifiers, hence
+# the functional TypedDict syntax)
+WindowCounts = TypedDict("WindowCounts", {"24h": int, "7d": int, "30d": int})
+
+# As WindowCounts, with None for windows whose API call failed (#326)
+PartialWindowCounts = TypedDict(
+    "PartialWindowCounts", {"24h": int | None, "7d": int | None, "30d": int | None}
+)
+
+
+class WindowedCounts(TypedDict):
+    """Trend windows returned by _fetch_windowed_counts()."""
+
+    issues_closed: WindowCounts
+    prs_merged: PartialWindowCounts
+    commits: PartialWindowCounts
+
 
 def _enforce_monotonic(values: list[int | None]) -> list[int]:
     """Ensure cumulative window values satisfy 24h <= 7d <= 30d.
@@ -39,74 +63,91 @@ def _enforce_monotonic(values: list[int | None]) -> list[int]:
     return [v24, v7, v30]
 
 
-async def _fetch_windowed_counts(
-    repo: str, now: datetime
-) -> dict[str, dict[str, int | None]]:
+def _count_windows(
+    timestamps: Iterable[str | None], cutoffs: dict[str, str]
+) -> WindowCounts:
+    """Count ISO-8601 UTC timestamps falling in each cumulative window.
+
+    The windows nest (24h within 7d within 30d), so each timestamp is
+    checked against the widest cutoff first and only compared with the
+    narrower ones when it passes — one pass, no per-window loop.  Empty
+    timestamps are skipped.
+
+    GitHub timestamps and *cutoffs* share the fixed-width
+    ``YYYY-MM-DDTHH:MM:SSZ`` format, so string order is time order and
+    the comparisons need no parsing.
+    """
+    c24, c7, c30 = cutoffs["24h"], cutoffs["7d"], cutoffs["30d"]
+    n24 = n7 = n30 = 0
+    for ts in timestamps:
+        if ts and ts >= c30:
+            n30 += 1
+            if ts >= c7:
+                n7 += 1
+                if ts >= c24:
+                    n24 += 1
+    return {"24h": n24, "7d": n7, "30d": n30}
+
+
+async def _fetch_windowed_counts(repo: str, now: datetime) -> WindowedCounts:
     """Fetch cumulative issue/PR/commit counts for 24h, 7d, and 30d windows.
 
     Returns ``None`` for ``prs_merged`` or ``commits`` windows when the
     underlying API call failed, so callers can fall back to stale cache
     for the failed component instead of serving zeros (#326).
     """
+    # Same format as GitHub's timestamps so _count_windows can compare
+    # strings, floored to the minute so repeat queries hit _query_cache
+    now = _floor_minute(now)
     cutoffs = {
-        "24h": (now - timedelta(hours=24)).strftime("%Y-%m-%dT%H:%M:%SZ"),
-        "7d": (now - timedelta(days=7)).strftime("%Y-%m-%dT%H:%M:%SZ"),
-        "30d": (now - timedelta(days=30)).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "24h": _iso(now - timedelta(hours=24)),
+        "7d": _iso(now - timedelta(days=7)),
+        "30d": _iso(now - timedelta(days=30)),
     }
 
-    # Issue counts via Search API (is:closed works reliably)
-    # Use full ISO timestamps to avoid date-only rounding (#239)
-    # Merged PR counts via Pulls REST API (is:merged has indexing issues — #187)
-    # Fetch merged PRs for the widest window (30d) and filter client-side
-    issue_tasks = [
-        _search_count(f"repo:{repo} is:issue is:closed closed:>={cutoffs[window]}")
-        for window in ("24h", "7d", "30d")
-    ]
+    # One request per source for the widest (30d) window, bucketed
+    # client-side: merged PRs via the Pulls REST API (the search's is:merged
+    # has indexing issues — #187) and closed issues via the search shared
+    # with _fetch_agent_stats.  Commits are counted per window.  All five
+    # run concurrently with one set of headers; the cutoffs are full ISO
+    # timestamps to avoid date-only rounding (#239).
+    headers = github_headers()
     commit_tasks = [
-        _count_commits(repo, cutoffs[window]) for window in ("24h", "7d", "30d")
+        _count_commits(repo, cutoffs[window], headers=headers)
+        for window in ("24h", "7d", "30d")
     ]
 
-    all_merged_prs, *rest = await asyncio.gather(
-        fetch_merged_prs(repo, cutoffs["30d"]),
-        *issue_tasks,
+    all_merged_prs, closed_issues, *raw_commits = await asyncio.gather(
+        fetch_merged_prs(repo, cutoffs["30d"], headers=headers),
+        _search_closed_issues(repo, cutoffs["30d"], headers=headers),
         *commit_tasks,
     )
 
-    raw_issues = [rest[0], rest[1], rest[2]]
-    raw_commits = [rest[3], rest[4], rest[5]]
+    # A failed issue search counts as zero, as the monotonic fill-in of
+    # three failed count queries did
+    issues = _count_windows(
+        (issue.get("closed_at") for issue in closed_issues or ()), cutoffs
+    )
 
+    # Track whether all commit API calls failed (#326)
+    commits_failed = all(c is None for c in raw_commits)
     # Enforce monotonicity: 24h <= 7d <= 30d.  When an API call fails
     # (returns None), fill it from its neighbours so the response is
     # never internally contradictory.
-    issues = _enforce_monotonic(raw_issues)
-
-    # Track whether all commit API calls failed (#326)
-    commits_failed = all(c is None for c in raw_commits)
     commits = _enforce_monotonic(raw_commits)
 
     # Count merged PRs per window from the single fetch.
     # When fetch_merged_prs returned None (API failure), signal with
     # None values so callers can substitute stale cache (#326).
-    prs_failed = all_merged_prs is None
-    pr_counts: dict[str, int | None]
-    if prs_failed:
+    pr_counts: PartialWindowCounts
+    if all_merged_prs is None:
         pr_counts = {"24h": None, "7d": None, "30d": None}
     else:
-        pr_counts = {"24h": 0, "7d": 0, "30d": 0}
-        for pr in all_merged_prs:
-            merged_at = pr.get("merged_at", "")
-            if not merged_at:
-                continue
-            for window in ("24h", "7d", "30d"):
-                if merged_at >= cutoffs[window]:
-                    pr_counts[window] += 1
+        merged_ats = (pr.get("merged_at") for pr in all_merged_prs)
+        pr_counts = {**_count_windows(merged_ats, cutoffs)}
 
     return {
-        "issues_closed": {
-            "24h": issues[0],
-            "7d": issues[1],
-            "30d": issues[2],
-        },
+        "issues_closed": issues,
         "prs_merged": pr_counts,
         "commits": {
             "24h": None if commits_failed else commits[0],
@@ -1,7 +1,8 @@
 """Goals file parser — reads and caches config/goals.md.
 
 Parses the markdown into structured data: mission, goals, and constraints.
-Results are cached based on file mtime so the file is only re-read when changed.
+Results are cached based on file mtime and size so the file is only re-read
+when changed.
 """
 
 import logging
@@ -12,9 +13,16 @@ from typing import Any, TypedDict
 
 logger = logging.getLogger(__name__)
 
-# File-based cache for goals.md (keyed by mtime)
+# File-based cache for goals.md, keyed by (st_mtime_ns, st_size): integer
+# nanoseconds compare exactly, and the size catches edits within the
+# filesystem's timestamp granularity
 _goals_file_cache: dict[str, Any] | None = None
-_goals_file_mtime: float = 0.0
+_goals_file_cachekey: tuple[int, int] | None = None
+
+# Patterns compiled once at import rather than on every parse
+_SECTION_RE = re.compile(r"^## (.*)$", re.MULTILINE)
+_GOAL_HEADING_RE = re.compile(r"Goal (\d+): (.+)")
+_BOLD_RE = re.compile(r"- \*\*(.+?)\*\*")
 
 
 class GoalsFileData(TypedDict):
@@ -45,24 +53,40 @@ def _find_goals_file() -> str:
     return os.path.join("config", "goals.md")
 
 
+def _split_sections(content: str) -> list[tuple[str, str]]:
+    """Split markdown into (heading, body) pairs at each ``## `` heading.
+
+    One scan over the file finds every section boundary, so each section
+    is sliced out directly instead of searched for from the top.  Headings
+    and bodies are stripped; text before the first heading is dropped.
+    """
+    headings = list(_SECTION_RE.finditer(content))
+    bounds = [m.start() for m in headings] + [len(content)]
+    return [
+        (m.group(1).strip(), content[m.end() : end].strip())
+        for m, end in zip(headings, bounds[1:], strict=True)
+    ]
+
+
 def parse_goals_file() -> GoalsFileData:
     """Parse config/goals.md into structured data.
 
-    Results are cached based on file modification time so the file is only
-    read and parsed once unless it changes on disk.
+    Results are cached based on file modification time and size so the file
+    is only read and parsed once unless it changes on disk.
     """
-    global _goals_file_cache, _goals_file_mtime
+    global _goals_file_cache, _goals_file_cachekey
 
     path = _find_goals_file()
 
-    # Check mtime to avoid re-reading an unchanged file
+    # One stat call decides whether the cached parse is still current
     try:
-        current_mtime = os.path.getmtime(path)
+        st = os.stat(path)
     except OSError:
         logger.warning("goals.md not found at %s", path)
         return {"mission": "", "goals": [], "constraints": []}
 
-    if _goals_file_cache is not None and current_mtime == _goals_file_mtime:
+    cachekey = (st.st_mtime_ns, st.st_size)
+    if _goals_file_cache is not None and cachekey == _goals_file_cachekey:
         return _goals_file_cache
 
     try:
@@ -72,17 +96,19 @@ def parse_goals_file() -> GoalsFileData:
         logger.warning("goals.md not readable at %s", path)
         return {"mission": "", "goals": [], "constraints": []}
 
+    sections = _split_sections(content)
+
     # Extract mission (text between ## Mission and next ##)
-    mission_match = re.search(r"## Mission\s*\n(.*?)(?=\n## |\Z)", content, re.DOTALL)
-    mission = mission_match.group(1).strip() if mission_match else ""
+    mission = next((body for heading, body in sections if heading == "Mission"), "")
 
     # Extract goals (## Goal N: Title)
     goals: list[dict[str, Any]] = []
-    goal_pattern = re.compile(r"## Goal (\d+): (.+?)\s*\n(.*?)(?=\n## |\Z)", re.DOTALL)
-    for match in goal_pattern.finditer(content):
-        number = int(match.group(1))
-        title = match.group(2).strip()
-        body = match.group(3).strip()
+    for heading, body in sections:
+        goal_match = _GOAL_HEADING_RE.fullmatch(heading)
+        if not goal_match:
+            continue
+        number = int(goal_match.group(1))
+        title = goal_match.group(2).strip()
 
         # Split body into summary (paragraphs before bullet list) and examples (bullets)
         lines = body.split("\n")
@@ -125,15 +151,15 @@ def parse_goals_file() -> GoalsFileData:
 
     # Extract constraints
     constraints: list[str] = []
-    constraints_match = re.search(
-        r"## Constraints\s*\n(.*?)(?=\n## |\Z)", content, re.DOTALL
+    constraints_body = next(
+        (body for heading, body in sections if heading == "Constraints"), ""
     )
-    if constraints_match:
-        for line in constraints_match.group(1).strip().split("\n"):
+    if constraints_body:
+        for line in constraints_body.split("\n"):
             stripped = line.strip()
             if stripped.startswith("- **"):
                 # Extract bold text as the constraint name
-                bold_match = re.match(r"- \*\*(.+?)\*\*", stripped)
+                bold_match = _BOLD_RE.match(stripped)
                 if bold_match:
                     constraints.append(bold_match.group(1).rstrip("."))
 
@@ -143,5 +169,5 @@ def parse_goals_file() -> GoalsFileData:
         "constraints": constraints,
     }
     _goals_file_cache = result
-    _goals_file_mtime = current_mtime
+    _goals_file_cachekey = cachekey
     return result
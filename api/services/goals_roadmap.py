@@ -11,16 +11,19 @@ from typing import Any
 
 from api.config import get_settings
 from api.services.cache import TTLCache
-from api.services.http_client import get_shared_client, github_headers
+from api.services.http_client import get_shared_client, github_headers, parse_json
 
 logger = logging.getLogger(__name__)
 
-# GraphQL query to fetch ProjectV2 items with their field values.
+# GraphQL query to fetch ProjectV2 items with their field values, one page
+# of 100 (the API maximum) per request.  ProjectV2 items can't be filtered
+# by field value server-side, so every page is fetched and bucketed here.
 _PROJECT_ITEMS_QUERY = """
-query($owner: String!, $number: Int!) {
+query($owner: String!, $number: Int!, $cursor: String) {
   organization(login: $owner) {
     projectV2(number: $number) {
-      items(first: 50) {
+      items(first: 100, after: $cursor) {
+        pageInfo { hasNextPage endCursor }
         nodes {
           content {
             ... on Issue { title }
@@ -46,6 +49,9 @@ query($owner: String!, $number: Int!) {
 }
 """
 
+# Upper bound on item pages per snapshot, so a runaway cursor can't loop
+_MAX_ITEM_PAGES = 20
+
 
 @dataclass
 class RoadmapItem:
@@ -57,21 +63,20 @@ class RoadmapItem:
     status: str = ""
 
 
-def _extract_field(field_values: list[dict[str, Any]], field_name: str) -> str:
-    """Extract a named field value from a ProjectV2 item's fieldValues nodes."""
+def _field_values(field_values: list[dict[str, Any]]) -> dict[str, str]:
+    """Map lowercased field names to values for a ProjectV2 item.
+
+    Built in one pass over the item's fieldValues nodes so each field is
+    then a dict lookup.  The first node for a name wins.
+    """
+    values: dict[str, str] = {}
     for node in field_values:
-        name = ""
-        value = ""
-        if "field" in node:
-            field = node["field"]
-            name = field.get("name", "")
-        if "name" in node:
-            value = node["name"]
-        elif "text" in node:
-            value = node["text"]
-        if name.lower() == field_name.lower():
-            return value
-    return ""
+        name = (node.get("field") or {}).get("name", "")
+        if not name:
+            continue
+        value = node["name"] if "name" in node else node.get("text", "")
+        values.setdefault(name.lower(), value)
+    return values
 
 
 async def get_roadmap_snapshot(cache: TTLCache) -> dict[str, Any]:
@@ -97,35 +102,55 @@ async def get_roadmap_snapshot(cache: TTLCache) -> dict[str, Any]:
     try:
         client = get_shared_client()
         headers = github_headers()
-        resp = await client.post(
-            "https://api.github.com/graphql",
-            headers=headers,
-            json={
-                "query": _PROJECT_ITEMS_QUERY,
-                "variables": {"owner": owner, "number": 1},
-            },
-            timeout=15.0,
-        )
-
-        if resp.status_code != 200:
-            logger.error("GraphQL roadmap request failed (HTTP %d)", resp.status_code)
-            return empty
-
-        data = resp.json()
-
-        errors = data.get("errors")
-        if errors:
-            logger.error("GraphQL roadmap errors: %s", errors)
-            return empty
-
-        project = data.get("data", {}).get("organization", {}).get("projectV2")
-        if project is None:
+        items: list[dict[str, Any]] = []
+        cursor: str | None = None
+
+        # Page through every item; earlier versions read only the first 50
+        # and silently dropped the rest
+        for _ in range(_MAX_ITEM_PAGES):
+            resp = await client.post(
+                "https://api.github.com/graphql",
+                headers=headers,
+                json={
+                    "query": _PROJECT_ITEMS_QUERY,
+                    "variables": {"owner": owner, "number": 1, "cursor": cursor},
+                },
+                timeout=15.0,
+            )
+
+            if resp.status_code != 200:
+                logger.error(
+                    "GraphQL roadmap request failed (HTTP %d)", resp.status_code
+                )
+                return empty
+
+            data = parse_json(resp)
+
+            errors = data.get("errors")
+            if errors:
+                logger.error("GraphQL roadmap errors: %s", errors)
+                return empty
+
+            project = data.get("data", {}).get("organization", {}).get("projectV2")
+            if project is None:
+                logger.warning(
+                    "GraphQL returned no projectV2 data — "
+                    "token may lack read:project scope"
+                )
+                return empty
+
+            page = project.get("items", {})
+            items.extend(page.get("nodes", []))
+            page_info = page.get("pageInfo") or {}
+            if not page_info.get("hasNextPage"):
+                break
+            cursor = page_info.get("endCursor")
+        else:
             logger.warning(
-                "GraphQL returned no projectV2 data — token may lack read:project scope"
+                "roadmap has more than %d pages of items; the rest are not counted",
+                _MAX_ITEM_PAGES,
             )
-            return empty
 
-        items = project.get("items", {}).get("nodes", [])
         active_items: list[dict[str, Any]] = []
         counts: dict[str, int] = {
             "proposed": 0,
@@ -137,9 +162,9 @@ async def get_roadmap_snapshot(cache: TTLCache) -> dict[str, Any]:
         for item in items:
             content = item.get("content") or {}
             title = content.get("title", "")
-            field_nodes = item.get("fieldValues", {}).get("nodes", [])
+            fields = _field_values(item.get("fieldValues", {}).get("nodes", []))
 
-            status = _extract_field(field_nodes, "Roadmap Status").lower()
+            status = fields.get("roadmap status", "").lower()
 
             if status in counts:
                 counts[status] += 1
@@ -148,9 +173,9 @@ async def get_roadmap_snapshot(cache: TTLCache) -> dict[str, Any]:
                 active_items.append(
                     {
                         "title": title,
-                        "priority": _extract_field(field_nodes, "Priority"),
-                        "goal": _extract_field(field_nodes, "Goal"),
-                        "phase": _extract_field(field_nodes, "Phase"),
+                        "priority": fields.get("priority", ""),
+                        "goal": fields.get("goal", ""),
+                        "phase": fields.get("phase", ""),
                     }
                 )
 
@@ -1,57 +1,373 @@
 """Shared HTTP client utilities — reusable httpx client."""
 
+import asyncio
+import functools
 import logging
+import math
+import random
+import time
+from collections import OrderedDict
 from collections.abc import Callable
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Any
 
 import httpx
+import orjson
 
 from api.config import get_settings
 
 logger = logging.getLogger(__name__)
 
+# The Search API returns at most this many results for any query
+_SEARCH_RESULT_LIMIT = 1000
+
+# Fields kept from REST issue and PR listings.  Full objects carry bodies,
+# label/milestone detail and (for PRs) entire head/base repository objects,
+# none of which the stats or metrics read.
+_ISSUE_FIELDS = (
+    "number",
+    "title",
+    "html_url",
+    "user",
+    "assignees",
+    "labels",
+    "created_at",
+    "updated_at",
+    "closed_at",
+)
+_PR_FIELDS = (
+    "number",
+    "title",
+    "html_url",
+    "user",
+    "created_at",
+    "updated_at",
+    "closed_at",
+    "merged_at",
+)
+
 # Module-level shared client (created lazily, lives for the process lifetime)
 _client: httpx.AsyncClient | None = None
 
+# Connection pool sizing.  Nearly all traffic goes to api.github.com, and
+# the metrics refresh fans out dozens of small requests at once, so keep
+# enough warm keep-alive connections that the fan-out isn't serialized
+# behind new TLS handshakes.  With HTTP/2 those requests are multiplexed
+# over a single connection per host anyway; the pool covers HTTP/1.1 hosts.
+_POOL_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=50,
+    keepalive_expiry=60.0,
+)
+
+
+# Most GitHub API requests in flight at once, across every caller of the
+# shared client.  The individual fan-outs are each bounded, but several can
+# run together (metrics components, stats, activity), and bursts of
+# concurrent requests are what trip GitHub's secondary rate limits.
+_GITHUB_MAX_CONCURRENCY = 20
+
+# Fail fast on unreachable hosts while still allowing slow responses
+_TIMEOUT = httpx.Timeout(15.0, connect=5.0)
+
+# GitHub rate-limit retries: attempts after the first, the base delay for
+# jittered exponential backoff, and the longest wait worth sitting through
+# (beyond it the limited response is returned so callers fall back).
+_RATE_LIMIT_RETRIES = 3
+_RATE_LIMIT_BACKOFF_BASE = 1.0
+_RATE_LIMIT_MAX_WAIT = 30.0
+# Random spread (seconds) added to server-advertised waits, so requests
+# limited together don't all retry at the same instant
+_RATE_LIMIT_JITTER = 1.0
+
+# Responses kept for conditional GitHub GETs.  Revalidation keeps replayed
+# bodies correct however old they are, so the TTL only ages out URLs that
+# stop being requested; the byte budget bounds the raw bodies held.
+_ETAG_CACHE_TTL = 3600
+_ETAG_CACHE_MAX_BYTES = 16 * 1024 * 1024
+
+
+def _rate_limit_delay(resp: httpx.Response, attempt: int) -> float | None:
+    """Return seconds to wait before retrying a rate-limited GitHub response.
+
+    Honours ``Retry-After`` (secondary limits) and ``X-RateLimit-Reset``
+    when the primary quota is exhausted, plus up to ``_RATE_LIMIT_JITTER``
+    seconds of spread; otherwise backs off exponentially with full jitter.
+    Returns None if the response isn't rate limited.
+    """
+    if resp.status_code not in (403, 429):
+        return None
+    spread = random.uniform(0, _RATE_LIMIT_JITTER)  # noqa: S311
+    retry_after = resp.headers.get("Retry-After", "")
+    if retry_after.isdigit():
+        return float(retry_after) + spread
+    if resp.headers.get("X-RateLimit-Remaining") == "0":
+        reset = resp.headers.get("X-RateLimit-Reset", "")
+        if reset.isdigit():
+            return max(0.0, int(reset) - time.time()) + spread
+    elif resp.status_code == 403:
+        # A plain 403 (e.g. missing permissions) is not worth retrying
+        return None
+    return random.uniform(0, _RATE_LIMIT_BACKOFF_BASE * 2**attempt)  # noqa: S311
+
+
+class _ConcurrencyLimitTransport(httpx.AsyncBaseTransport):
+    """Transport that caps concurrent requests to the GitHub API.
+
+    Sits beneath the retry transport, so a request waiting out a rate
+    limit backoff does not hold a slot.  The slot covers sending the
+    request and receiving the response headers.
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, limit: int) -> None:
+        self._transport = transport
+        self._semaphore = asyncio.Semaphore(limit)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if request.url.host != "api.github.com":
+            return await self._transport.handle_async_request(request)
+        async with self._semaphore:
+            return await self._transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+class _RateLimitRetryTransport(httpx.AsyncBaseTransport):
+    """Transport that retries GitHub API GETs rejected by rate limiting.
+
+    Wraps the real transport so every caller of the shared client gets the
+    same backoff without changing how it issues requests.
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport) -> None:
+        self._transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        resp = await self._transport.handle_async_request(request)
+        if request.method != "GET" or request.url.host != "api.github.com":
+            return resp
+        for attempt in range(_RATE_LIMIT_RETRIES):
+            delay = _rate_limit_delay(resp, attempt)
+            if delay is None or delay > _RATE_LIMIT_MAX_WAIT:
+                return resp
+            logger.warning(
+                "GitHub rate limited (%d) for %s; retrying in %.1fs",
+                resp.status_code,
+                request.url.path,
+                delay,
+            )
+            await resp.aclose()
+            await asyncio.sleep(delay)
+            resp = await self._transport.handle_async_request(request)
+        return resp
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+class _ConditionalGetTransport(httpx.AsyncBaseTransport):
+    """Transport that revalidates repeated GitHub API GETs with ETags.
+
+    A 200 response carrying an ETag is remembered per URL and token.  The
+    next GET for it sends ``If-None-Match``; GitHub answers an unchanged
+    resource with an empty 304, which doesn't count against the rate
+    limit, and the remembered response is replayed to the caller as a 200.
+
+    Searches and ``since``/``until`` listings aren't remembered: their
+    queries carry a cutoff that moves with the current time, so a URL
+    recurs only briefly, and goals_metrics_queries caches those results
+    itself (``_query_cache``).  Entries are evicted least recently used
+    once their bodies exceed ``_ETAG_CACHE_MAX_BYTES``.
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport) -> None:
+        self._transport = transport
+        # key -> (etag, headers, raw body, stored at), least recently used first
+        self._cache: OrderedDict[str, tuple[str, httpx.Headers, bytes, float]] = (
+            OrderedDict()
+        )
+        self._cached_bytes = 0
+
+    @staticmethod
+    def _revalidatable(url: httpx.URL) -> bool:
+        """Whether GETs for *url* recur, so remembering the response pays off."""
+        return not url.path.startswith("/search/") and not (
+            "since" in url.params or "until" in url.params
+        )
+
+    def _get(self, key: str) -> tuple[str, httpx.Headers, bytes, float] | None:
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        if time.monotonic() - entry[3] > _ETAG_CACHE_TTL:
+            self._discard(key)
+            return None
+        return entry
+
+    def _set(self, key: str, etag: str, headers: httpx.Headers, raw: bytes) -> None:
+        self._discard(key)
+        if len(raw) > _ETAG_CACHE_MAX_BYTES:
+            return
+        self._cache[key] = (etag, headers, raw, time.monotonic())
+        self._cached_bytes += len(raw)
+        while self._cached_bytes > _ETAG_CACHE_MAX_BYTES:
+            self._discard(next(iter(self._cache)))
+
+    def _discard(self, key: str) -> None:
+        entry = self._cache.pop(key, None)
+        if entry is not None:
+            self._cached_bytes -= len(entry[2])
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if (
+            request.method != "GET"
+            or request.url.host != "api.github.com"
+            or not self._revalidatable(request.url)
+        ):
+            return await self._transport.handle_async_request(request)
+
+        key = f"{request.headers.get('Authorization', '')} {request.url}"
+        cached = self._get(key)
+        if cached is not None and "If-None-Match" not in request.headers:
+            request.headers["If-None-Match"] = cached[0]
+
+        resp = await self._transport.handle_async_request(request)
+        if resp.status_code == 304 and cached is not None:
+            await resp.aclose()
+            etag, headers, raw, _stored_at = cached
+            self._set(key, etag, headers, raw)
+            return httpx.Response(200, headers=headers, content=raw, request=request)
+
+        etag = resp.headers.get("ETag")
+        if resp.status_code != 200 or not etag:
+            return resp
+        # Keep the raw (still content-encoded) bytes so a replay decodes
+        # exactly like the original response
+        raw = b"".join([chunk async for chunk in resp.stream])
+        await resp.aclose()
+        self._set(key, etag, resp.headers, raw)
+        return httpx.Response(
+            200,
+            headers=resp.headers,
+            content=raw,
+            request=request,
+            extensions=resp.extensions,
+        )
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
 
 def get_shared_client() -> httpx.AsyncClient:
     """Return a shared httpx.AsyncClient, creating it on first call."""
     global _client
     if _client is None or _client.is_closed:
-        _client = httpx.AsyncClient(timeout=15.0)
+        transport = _ConditionalGetTransport(
+            _RateLimitRetryTransport(
+                _ConcurrencyLimitTransport(
+                    httpx.AsyncHTTPTransport(http2=True, limits=_POOL_LIMITS),
+                    _GITHUB_MAX_CONCURRENCY,
+                )
+            )
+        )
+        _client = httpx.AsyncClient(timeout=_TIMEOUT, transport=transport)
     return _client
 
 
-def github_headers() -> dict[str, str]:
-    """Build standard GitHub API request headers.
+async def prewarm_shared_client() -> None:
+    """Open the pooled connection to api.github.com ahead of real traffic.
 
-    Includes the Authorization header only when a token is configured.
+    Run in the background at startup so the first user-facing request
+    doesn't pay for DNS, TCP, TLS and HTTP/2 setup.  ``/rate_limit`` does
+    not count against the quota.  Failures are logged and otherwise
+    ignored; the connection is simply made on first use instead.
     """
-    settings = get_settings()
+    try:
+        await get_shared_client().get(
+            "https://api.github.com/rate_limit", headers=github_headers()
+        )
+    except httpx.HTTPError:
+        logger.warning("GitHub connection prewarm failed", exc_info=True)
+
+
+async def close_shared_client() -> None:
+    """Close the shared client's pooled connections, if it was ever created.
+
+    Called on application shutdown.  A later get_shared_client() call
+    builds a fresh client.
+    """
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+@functools.lru_cache(maxsize=4)
+def _headers_for_token(token: str | None) -> dict[str, str]:
+    """Build the GitHub headers for *token*, once per distinct token."""
     headers: dict[str, str] = {
         "Accept": "application/vnd.github+json",
         "X-GitHub-Api-Version": "2022-11-28",
     }
-    if settings.github_token:
-        headers["Authorization"] = f"Bearer {settings.github_token}"
+    if token:
+        headers["Authorization"] = f"Bearer {token}"
     return headers
 
 
+def github_headers() -> dict[str, str]:
+    """Return standard GitHub API request headers.
+
+    Includes the Authorization header only when a token is configured.
+    The dict is cached per token and shared between callers, so it must not
+    be mutated; build a new one (``{**github_headers(), ...}``) to add
+    headers.
+    """
+    return _headers_for_token(get_settings().github_token)
+
+
+def parse_json(resp: httpx.Response) -> Any:
+    """Decode a response body with orjson.
+
+    Faster than ``resp.json()`` on the multi-KB PR, review and search pages
+    the metrics refresh parses, and reads the raw bytes without a text
+    decode step.  Raises ValueError on malformed JSON, like ``resp.json()``.
+    """
+    return orjson.loads(resp.content)
+
+
+def last_page_number(resp: httpx.Response) -> int | None:
+    """Return the page number of the Link header's ``rel="last"`` URL.
+
+    Returns None when the response has no last link (a single page) or the
+    URL carries no page parameter.
+    """
+    last_url = resp.links.get("last", {}).get("url")
+    if not last_url:
+        return None
+    page = httpx.URL(last_url).params.get("page")
+    return int(page) if page and page.isdigit() else None
+
+
 async def github_api_get(
     url: str,
     params: dict[str, str] | None = None,
     *,
     response_key: str | None = None,
+    headers: dict[str, str] | None = None,
     context: str = "",
 ) -> list[Any] | dict[str, Any] | None:
     """Fetch a GitHub API endpoint with standard error handling.
 
     Returns parsed JSON (or the value at response_key if specified).
     Returns None on any error so callers can apply their own fallback.
+
+    Fan-out callers can pass ``headers`` built once with github_headers()
+    instead of rebuilding them for every request.
     """
     client = get_shared_client()
-    headers = github_headers()
+    if headers is None:
+        headers = github_headers()
     try:
         resp = await client.get(url, headers=headers, params=params)
         if resp.status_code != 200:
@@ -62,7 +378,7 @@ async def github_api_get(
                 f" ({context})" if context else "",
             )
             return None
-        data = resp.json()
+        data = parse_json(resp)
         return data.get(response_key, []) if response_key else data
     except Exception:
         logger.exception(
@@ -78,6 +394,7 @@ async def paginated_github_search(
     items_key: str = "items",
     total_key: str = "total_count",
     per_page: int = 100,
+    headers: dict[str, str] | None = None,
     context: str = "",
 ) -> list[dict[str, Any]] | None:
     """Paginate through a GitHub Search API endpoint, returning all items.
@@ -91,15 +408,19 @@ async def paginated_github_search(
         items_key: Key in the response JSON containing the result list.
         total_key: Key in the response JSON containing the total result count.
         per_page: Number of results per page (max 100 for Search API).
+        headers: Request headers built once by a fan-out caller; defaults
+            to github_headers().
         context: Description for log messages.
     """
     client = get_shared_client()
-    headers = github_headers()
-    all_items: list[dict[str, Any]] = []
-    page = 1
-
-    while True:
-        page_params = {**params, "per_page": str(per_page), "page": str(page)}
+    if headers is None:
+        headers = github_headers()
+    # Pages run concurrently, so each needs its own dict, but only the page
+    # number varies
+    base_params = {**params, "per_page": str(per_page)}
+
+    async def fetch_page(page: int) -> dict[str, Any] | None:
+        page_params = {**base_params, "page": str(page)}
         try:
             resp = await client.get(url, headers=headers, params=page_params)
             if resp.status_code != 200:
@@ -110,14 +431,8 @@ async def paginated_github_search(
                     page,
                     f" ({context})" if context else "",
                 )
-                return None if not all_items else all_items
-            data = resp.json()
-            items = data.get(items_key, [])
-            all_items.extend(items)
-            total_count = data.get(total_key, 0)
-            if len(all_items) >= total_count or len(items) < per_page:
-                break
-            page += 1
+                return None
+            return parse_json(resp)
         except Exception:
             logger.exception(
                 "GitHub API error for %s (page %d)%s",
@@ -125,7 +440,30 @@ async def paginated_github_search(
                 page,
                 f" ({context})" if context else "",
             )
-            return None if not all_items else all_items
+            return None
+
+    first = await fetch_page(1)
+    if first is None:
+        return None
+    all_items: list[dict[str, Any]] = list(first.get(items_key, []))
+    total_count = min(first.get(total_key, 0), _SEARCH_RESULT_LIMIT)
+    if len(all_items) >= total_count or len(all_items) < per_page:
+        return all_items
+
+    # total_count fixes the page count up front, so fetch the rest concurrently
+    last_page = math.ceil(total_count / per_page)
+    pages = await asyncio.gather(
+        *(fetch_page(page) for page in range(2, last_page + 1)),
+        return_exceptions=True,
+    )
+    for data in pages:
+        # Keep only the contiguous run of pages before any failure
+        if data is None or isinstance(data, BaseException):
+            break
+        items = data.get(items_key, [])
+        all_items.extend(items)
+        if len(items) < per_page:
+            break
 
     return all_items
 
@@ -134,14 +472,18 @@ async def paginated_rest_api(
     url: str,
     since: str,
     *,
-    filter_fn: Callable[[dict[str, Any], datetime], bool],
+    filter_fn: Callable[[dict[str, Any], str], bool],
+    state: str = "closed",
+    fields: tuple[str, ...] | None = None,
+    headers: dict[str, str] | None = None,
     context: str = "",
 ) -> list[dict[str, Any]] | None:
     """Paginate through a GitHub REST API endpoint with date filtering.
 
     This helper handles the common pagination pattern used by /repos/{repo}/issues
     and /repos/{repo}/pulls endpoints. It fetches all pages sorted by updated_at desc,
-    filtering items by a custom filter function, and stops when items are too old.
+    filtering items by a custom filter function, and stops when items are too old
+    or the Link header has no ``rel="next"`` page.
 
     Returns None on first-page failure so callers can fall back to stale cache.
     Partial results from later-page failures are returned as-is.
@@ -149,27 +491,39 @@ async def paginated_rest_api(
     Args:
         url: The API endpoint URL
         since: ISO date string (e.g. "2026-02-13") for date filtering
-        filter_fn: Callback that receives (item, since_dt) and returns True to include
+        filter_fn: Callback that receives (item, since_iso) and returns True to
+            include.  since_iso is in GitHub's ``YYYY-MM-DDTHH:MM:SSZ`` form,
+            so item timestamps can be compared with it as plain strings
+        state: Value for the ``state`` query parameter (open, closed, or all)
+        fields: Keys to keep from each matching item (applied after
+            filter_fn), so only what callers read outlives the page; None
+            keeps whole items
+        headers: Request headers built once by a fan-out caller; defaults
+            to github_headers()
         context: Description for log messages
     """
     client = get_shared_client()
-    headers = github_headers()
+    if headers is None:
+        headers = github_headers()
     results: list[dict[str, Any]] = []
     page = 1
 
+    # Normalize the cutoff once to GitHub's fixed-width UTC format; string
+    # order is then time order, so no item timestamp needs parsing
     if "T" not in since:
         since_dt = datetime.fromisoformat(since + "T00:00:00+00:00")
     else:
-        since_dt = datetime.fromisoformat(since.replace("Z", "+00:00"))
-
+        since_dt = datetime.fromisoformat(since)
+    since_iso = since_dt.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+    params = {
+        "state": state,
+        "sort": "updated",
+        "direction": "desc",
+        "per_page": "100",
+    }
     while True:
-        params = {
-            "state": "closed",
-            "sort": "updated",
-            "direction": "desc",
-            "per_page": "100",
-            "page": str(page),
-        }
+        params["page"] = str(page)
         try:
             resp = await client.get(url, headers=headers, params=params)
             if resp.status_code != 200:
@@ -180,24 +534,26 @@ async def paginated_rest_api(
                     f" ({context})" if context else "",
                 )
                 return None if page == 1 else results
-            items = resp.json()
+            items = parse_json(resp)
             if not items:
                 break
 
             for item in items:
-                if filter_fn(item, since_dt):
+                if not filter_fn(item, since_iso):
+                    continue
+                if fields is None:
                     results.append(item)
+                else:
+                    results.append({key: item[key] for key in fields if key in item})
 
             # Stop if the oldest item on this page was updated before our window
             oldest_updated = items[-1].get("updated_at", "")
-            if oldest_updated:
-                oldest_dt = datetime.fromisoformat(
-                    oldest_updated.replace("Z", "+00:00")
-                )
-                if oldest_dt < since_dt:
-                    break
+            if oldest_updated and oldest_updated < since_iso:
+                break
 
-            if len(items) < 100:
+            # The Link header says definitively whether another page exists,
+            # so a final page of exactly 100 items costs no extra request
+            if "next" not in resp.links:
                 break
             page += 1
         except Exception:
@@ -228,7 +584,7 @@ async def fetch_closed_issues(repo: str, since: str) -> list[dict[str, Any]] | N
     """
     url = f"https://api.github.com/repos/{repo}/issues"
 
-    def filter_issue(issue: dict[str, Any], since_dt: datetime) -> bool:
+    def filter_issue(issue: dict[str, Any], since_iso: str) -> bool:
         """Filter out PRs and check if issue was closed in our window."""
         # Filter out PRs (Issues API includes them)
         if "pull_request" in issue:
@@ -237,16 +593,20 @@ async def fetch_closed_issues(repo: str, since: str) -> list[dict[str, Any]] | N
         closed_at = issue.get("closed_at")
         if not closed_at:
             return False
-
-        issue_closed_dt = datetime.fromisoformat(closed_at.replace("Z", "+00:00"))
-        return issue_closed_dt >= since_dt
+        return closed_at >= since_iso
 
     return await paginated_rest_api(
-        url, since, filter_fn=filter_issue, context="closed issues"
+        url,
+        since,
+        filter_fn=filter_issue,
+        fields=_ISSUE_FIELDS,
+        context="closed issues",
     )
 
 
-async def fetch_merged_prs(repo: str, since: str) -> list[dict[str, Any]] | None:
+async def fetch_merged_prs(
+    repo: str, since: str, *, headers: dict[str, str] | None = None
+) -> list[dict[str, Any]] | None:
     """Fetch merged PRs since a date using the Pulls REST API.
 
     Uses /repos/{owner}/{repo}/pulls?state=closed instead of the Search API
@@ -258,18 +618,22 @@ async def fetch_merged_prs(repo: str, since: str) -> list[dict[str, Any]] | None
     Args:
         repo: Owner/repo string (e.g. "YourMoveLabs/agent-fishbowl")
         since: ISO date string (e.g. "2026-02-13") — PRs merged on or after
+        headers: Request headers, as for paginated_rest_api
     """
     url = f"https://api.github.com/repos/{repo}/pulls"
 
-    def filter_merged_pr(pr: dict[str, Any], since_dt: datetime) -> bool:
+    def filter_merged_pr(pr: dict[str, Any], since_iso: str) -> bool:
         """Check if PR was merged in our window."""
         merged_at = pr.get("merged_at")
         if not merged_at:
             return False
-
-        pr_merged_dt = datetime.fromisoformat(merged_at.replace("Z", "+00:00"))
-        return pr_merged_dt >= since_dt
+        return merged_at >= since_iso
 
     return await paginated_rest_api(
-        url, since, filter_fn=filter_merged_pr, context="merged PRs"
+        url,
+        since,
+        filter_fn=filter_merged_pr,
+        fields=_PR_FIELDS,
+        headers=headers,
+        context="merged PRs",
     )
@@ -1,9 +1,12 @@
 """AI-powered article analysis — extracts actionable insights using Foundry GPT-4.1."""
 
-import json
+import asyncio
+import hashlib
 import logging
+import random
 from dataclasses import dataclass, field
 
+import orjson
 from openai import APIError, RateLimitError
 
 from api.services.llm import chat_completion
@@ -30,7 +33,7 @@ ANALYSIS_PROMPT = (
     "Article Title: {title}\n"
     "\n"
     "Article Content:\n"
-    "{content}\n"
+    "{content}{ellipsis}\n"
     "\n"
     "Respond with valid JSON in this exact format:\n"
     "{{\n"
@@ -64,6 +67,29 @@ ANALYSIS_PROMPT = (
 )
 
 
+def _split_prompt(template: str) -> tuple[str, str, str]:
+    """Split *template* around its title and content placeholders.
+
+    Returns the literal text before the title, between the title and the
+    content, and after the content, with ``{{``/``}}`` escapes undone.
+    """
+    head, _, rest = template.partition("{title}")
+    middle, _, tail = rest.partition("{content}{ellipsis}")
+
+    def unescape(part: str) -> str:
+        return part.replace("{{", "{").replace("}}", "}")
+
+    return unescape(head), unescape(middle), unescape(tail)
+
+
+# The prompt is rebuilt for every article, so split the template once and
+# join the pieces rather than re-parsing it with str.format each time
+_PROMPT_HEAD, _PROMPT_MIDDLE, _PROMPT_TAIL = _split_prompt(ANALYSIS_PROMPT)
+
+# Seeds every analysis cache key, so editing the prompt invalidates them
+_PROMPT_DIGEST = hashlib.sha256(ANALYSIS_PROMPT.encode())
+
+
 @dataclass
 class AnalysisResult:
     """Result of article analysis."""
@@ -75,6 +101,11 @@ class AnalysisResult:
 
 MAX_CONTENT_LENGTH = 12000
 
+# Waits between rate-limited attempts: the server's Retry-After when sent,
+# otherwise full jitter over an exponentially growing window, capped
+_RATE_LIMIT_BACKOFF_BASE = 0.5
+_RATE_LIMIT_MAX_WAIT = 8.0
+
 
 class AnalysisError(Exception):
     """Error during article analysis."""
@@ -85,17 +116,13 @@ class AnalysisError(Exception):
 def _parse_response(response_text: str) -> AnalysisResult:
     """Parse the JSON response from the LLM."""
     try:
-        data = json.loads(response_text)
-
-        insights = []
-        for item in data.get("insights", []):
-            if isinstance(item, dict) and "text" in item:
-                insights.append(
-                    {
-                        "text": item["text"],
-                        "category": item.get("category", "concept"),
-                    }
-                )
+        data = orjson.loads(response_text)
+
+        insights = [
+            {"text": item["text"], "category": item.get("category", "concept")}
+            for item in data.get("insights", ())
+            if isinstance(item, dict) and "text" in item
+        ]
 
         ai_summary = data.get("ai_summary")
         if ai_summary and len(ai_summary.strip()) < 20:
@@ -110,12 +137,55 @@ def _parse_response(response_text: str) -> AnalysisResult:
             insights=insights, ai_summary=ai_summary, relevance_score=relevance_score
         )
 
-    except json.JSONDecodeError as e:
+    except orjson.JSONDecodeError as e:
         raise AnalysisError(f"Invalid JSON response: {e}") from e
     except Exception as e:
         raise AnalysisError(f"Failed to parse response: {e}") from e
 
 
+def _build_prompt(title: str, content: str) -> str:
+    """Fill the analysis prompt, truncating *content* to MAX_CONTENT_LENGTH."""
+    # The template appends the ellipsis, so truncation is a single slice
+    # rather than a slice plus a concatenated copy of the article body
+    ellipsis = "..." if len(content) > MAX_CONTENT_LENGTH else ""
+    return "".join(
+        (
+            _PROMPT_HEAD,
+            title,
+            _PROMPT_MIDDLE,
+            content[:MAX_CONTENT_LENGTH],
+            ellipsis,
+            _PROMPT_TAIL,
+        )
+    )
+
+
+def analysis_cache_key(title: str, content: str) -> str:
+    """Return the cache key for analyzing *title* and *content*.
+
+    The key hashes the prompt template together with exactly the parts of
+    *title* and *content* that _build_prompt() uses, so two articles share
+    it only when the model would see the same prompt, without building the
+    prompt itself.
+    """
+    truncated = len(content) > MAX_CONTENT_LENGTH
+    digest = _PROMPT_DIGEST.copy()
+    # The title's length and the truncation flag keep the fields unambiguous
+    digest.update(f"{len(title)}:{int(truncated)}:".encode())
+    digest.update(title.encode())
+    digest.update(content[:MAX_CONTENT_LENGTH].encode())
+    return digest.hexdigest()
+
+
+def _rate_limit_delay(error: RateLimitError, attempt: int) -> float:
+    """Return seconds to wait before retrying after *error*."""
+    try:
+        delay = float(error.response.headers.get("retry-after", ""))
+    except ValueError:
+        delay = random.uniform(0, _RATE_LIMIT_BACKOFF_BASE * 2**attempt)  # noqa: S311
+    return min(max(delay, 0.0), _RATE_LIMIT_MAX_WAIT)
+
+
 async def analyze_article(
     title: str,
     content: str,
@@ -134,10 +204,7 @@ async def analyze_article(
     Raises:
         AnalysisError: If analysis fails after retries.
     """
-    if len(content) > MAX_CONTENT_LENGTH:
-        content = content[:MAX_CONTENT_LENGTH] + "..."
-
-    prompt = ANALYSIS_PROMPT.format(title=title, content=content)
+    prompt = _build_prompt(title, content)
 
     for attempt in range(max_retries + 1):
         try:
@@ -150,12 +217,15 @@ async def analyze_article(
 
         except RateLimitError as e:
             if attempt < max_retries:
+                delay = _rate_limit_delay(e, attempt)
                 logger.warning(
-                    "Rate limited, attempt %d/%d: %s",
+                    "Rate limited, attempt %d/%d; retrying in %.1fs: %s",
                     attempt + 1,
                     max_retries + 1,
+                    delay,
                     e,
                 )
+                await asyncio.sleep(delay)
                 continue
             raise AnalysisError(f"Rate limited after {max_retries + 1} attempts") from e
 
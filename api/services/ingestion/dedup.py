@@ -1,6 +1,8 @@
 """Article deduplication — detect duplicate coverage across sources."""
 
 import logging
+from collections.abc import Iterator
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from difflib import SequenceMatcher
 
@@ -24,38 +26,81 @@ def _normalize(text: str) -> str:
     return text.strip().lower()
 
 
-def _title_similarity(a: str, b: str) -> float:
-    """Compute similarity ratio between two titles."""
-    return SequenceMatcher(None, _normalize(a), _normalize(b)).ratio()
+@dataclass
+class _Reference:
+    """An article that candidates are compared against.
+
+    SequenceMatcher caches its analysis of the second sequence, so each
+    reference keeps one matcher per text with that text as the second
+    sequence.  Comparing a candidate then only sets the first sequence,
+    instead of re-indexing the reference for every pair.
+    """
+
+    title: str
+    title_matcher: SequenceMatcher
+    summary_matcher: SequenceMatcher | None
+
+
+def _reference(title: str, summary: str) -> _Reference:
+    """Build a _Reference for an existing or already-accepted article."""
+    return _Reference(
+        title=title,
+        title_matcher=SequenceMatcher(None, b=_normalize(title)),
+        summary_matcher=(
+            SequenceMatcher(None, b=_normalize(summary)) if summary else None
+        ),
+    )
 
 
-def _summary_similarity(a: str, b: str) -> float:
-    """Compute similarity ratio between two summaries."""
-    if not a or not b:
-        return 0.0
-    return SequenceMatcher(None, _normalize(a), _normalize(b)).ratio()
+def _upper_bounds(matcher: SequenceMatcher) -> Iterator[float]:
+    """Yield cheap, successively tighter upper bounds on ``matcher.ratio()``.
 
+    ratio() is quadratic pure Python, so callers check these first and
+    skip it for pairs that cannot reach a threshold.
+    """
+    yield matcher.real_quick_ratio()
+    yield matcher.quick_ratio()
+
+
+def _combined(title_sim: float, summary_sim: float) -> float:
+    """Weighted title + summary similarity for borderline title matches."""
+    return (title_sim * 0.7) + (summary_sim * 0.3)
 
-def _is_duplicate(
-    candidate_title: str,
-    candidate_summary: str,
-    existing_title: str,
-    existing_summary: str,
-) -> bool:
-    """Check if a candidate article is a duplicate of an existing one.
+
+def _matches(title: str, summary: str | None, reference: _Reference) -> bool:
+    """Check if a candidate duplicates *reference*.
 
     Uses a combination of title and summary similarity.
+
+    *title* and *summary* are the candidate's normalized title and summary,
+    normalized once per candidate rather than once per pair; *summary* is
+    None when the candidate has none.  Both scores only grow the combined
+    score, so an upper bound that fails the thresholds settles the answer
+    without computing the full ratio.
     """
-    title_sim = _title_similarity(candidate_title, existing_title)
+    matcher = reference.title_matcher
+    matcher.set_seq1(title)
+    for bound in _upper_bounds(matcher):
+        if (
+            bound < TITLE_SIMILARITY_THRESHOLD
+            and _combined(bound, 1.0) < COMBINED_SIMILARITY_THRESHOLD
+        ):
+            return False
+    title_sim = matcher.ratio()
 
     # High title similarity alone is enough
     if title_sim >= TITLE_SIMILARITY_THRESHOLD:
         return True
 
     # Check combined similarity for borderline title matches
-    summary_sim = _summary_similarity(candidate_summary, existing_summary)
-    combined = (title_sim * 0.7) + (summary_sim * 0.3)
-    return combined >= COMBINED_SIMILARITY_THRESHOLD
+    if summary is None or reference.summary_matcher is None:
+        return _combined(title_sim, 0.0) >= COMBINED_SIMILARITY_THRESHOLD
+    matcher = reference.summary_matcher
+    matcher.set_seq1(summary)
+    for bound in _upper_bounds(matcher):
+        if _combined(title_sim, bound) < COMBINED_SIMILARITY_THRESHOLD:
+            return False
+    return _combined(title_sim, matcher.ratio()) >= COMBINED_SIMILARITY_THRESHOLD
 
 
 def deduplicate_candidates(
@@ -80,37 +125,27 @@ def deduplicate_candidates(
     """
     cutoff = datetime.now(timezone.utc) - timedelta(hours=DEDUP_WINDOW_HOURS)
 
-    # Filter existing articles to the dedup window
-    recent_existing = [a for a in existing_articles if a.published_at >= cutoff]
+    # Recent existing articles first, then candidates as they're accepted
+    references = [
+        _reference(a.title, a.description)
+        for a in existing_articles
+        if a.published_at >= cutoff
+    ]
 
     unique: list[ParsedArticle] = []
     skipped: list[tuple[str, str]] = []
 
     for candidate in candidates:
-        matched_title: str | None = None
-
-        # Check against recent existing articles
-        for existing in recent_existing:
-            if _is_duplicate(
-                candidate["title"],
-                candidate["summary"],
-                existing.title,
-                existing.description,
-            ):
-                matched_title = existing.title
-                break
-
-        # Check against already-accepted candidates in this batch
-        if matched_title is None:
-            for accepted in unique:
-                if _is_duplicate(
-                    candidate["title"],
-                    candidate["summary"],
-                    accepted["title"],
-                    accepted["summary"],
-                ):
-                    matched_title = accepted["title"]
-                    break
+        title = _normalize(candidate["title"])
+        summary = _normalize(candidate["summary"]) if candidate["summary"] else None
+        matched_title = next(
+            (
+                reference.title
+                for reference in references
+                if _matches(title, summary, reference)
+            ),
+            None,
+        )
 
         if matched_title is not None:
             skipped.append((candidate["title"], matched_title))
@@ -121,5 +156,6 @@ def deduplicate_candidates(
             )
         else:
             unique.append(candidate)
+            references.append(_reference(candidate["title"], candidate["summary"]))
 
     return unique, skipped
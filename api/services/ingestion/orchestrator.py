@@ -6,18 +6,27 @@ Ties fetch, dedup, scrape, analyze, and write together.
 import asyncio
 import logging
 import os
-from dataclasses import dataclass
+import time
+from dataclasses import asdict, dataclass
 from datetime import datetime, timezone
+from typing import Any
 
 from api.models.article import Article, ArticleSummary
 from api.services.blob_storage import (
+    get_analysis_cache,
     get_article_index,
+    write_analysis_cache,
     write_article_index,
     write_article_only,
 )
-from api.services.ingestion.analyzer import AnalysisError, analyze_article
+from api.services.ingestion.analyzer import (
+    AnalysisError,
+    AnalysisResult,
+    analysis_cache_key,
+    analyze_article,
+)
 from api.services.ingestion.dedup import deduplicate_candidates
-from api.services.ingestion.rss import fetch_all_sources, load_sources
+from api.services.ingestion.rss import ParsedArticle, fetch_all_sources, load_sources
 from api.services.ingestion.scraper import scrape_article
 
 logger = logging.getLogger(__name__)
@@ -25,9 +34,19 @@ logger = logging.getLogger(__name__)
 # Cap new articles per run to limit AI API costs
 MAX_NEW_ARTICLES_PER_RUN = 20
 
-# Delay between articles to respect rate limits
+# Minimum spacing between LLM analysis calls to respect rate limits
 INTER_ARTICLE_DELAY = 1.5
 
+# Most articles scraped and analyzed at once
+ARTICLE_CONCURRENCY = 5
+
+# Cached analyses of filtered articles unused for this long are dropped
+ANALYSIS_CACHE_TTL = 30 * 24 * 3600
+
+# A reused entry's last-used time is refreshed at most this often, so runs
+# that only hit the cache don't rewrite it
+ANALYSIS_CACHE_REFRESH = 24 * 3600
+
 # Minimum relevance score to include an article
 # (configurable via RELEVANCE_THRESHOLD env var)
 RELEVANCE_THRESHOLD = int(os.environ.get("RELEVANCE_THRESHOLD", "4"))
@@ -59,6 +78,41 @@ class IngestionStats:
         }
 
 
+def _is_timestamp(value: Any) -> bool:
+    """Whether *value* is a usable ``used_at`` time."""
+    return isinstance(value, int | float) and not isinstance(value, bool)
+
+
+def _cached_analysis(entry: Any) -> AnalysisResult | None:
+    """Rebuild an AnalysisResult from an analysis cache entry.
+
+    Returns None for entries that don't have the expected shape (written by
+    an older version, or truncated), so the article is analyzed again and
+    the entry replaced.
+    """
+    if not isinstance(entry, dict) or not _is_timestamp(entry.get("used_at", 0)):
+        return None
+    insights = entry.get("insights")
+    ai_summary = entry.get("ai_summary")
+    relevance_score = entry.get("relevance_score")
+    if (
+        not isinstance(insights, list)
+        or not all(
+            isinstance(insight, dict)
+            and isinstance(insight.get("text"), str)
+            and isinstance(insight.get("category"), str)
+            for insight in insights
+        )
+        or not (ai_summary is None or isinstance(ai_summary, str))
+        or not isinstance(relevance_score, int)
+        or isinstance(relevance_score, bool)
+    ):
+        return None
+    return AnalysisResult(
+        insights=insights, ai_summary=ai_summary, relevance_score=relevance_score
+    )
+
+
 async def run_ingestion(max_new: int = MAX_NEW_ARTICLES_PER_RUN) -> IngestionStats:
     """Run a full ingestion cycle: fetch -> dedup -> scrape -> analyze -> write.
 
@@ -81,16 +135,13 @@ async def run_ingestion(max_new: int = MAX_NEW_ARTICLES_PER_RUN) -> IngestionSta
     existing_ids = {a.id for a in index.articles}
     logger.info("Existing index has %d articles", len(existing_ids))
 
-    # Keep a mutable copy of the index articles for batch update
-    index_articles = list(index.articles)
-
     # 3. Filter to new articles only (URL-based dedup)
     new_parsed = [a for a in all_parsed if a["id"] not in existing_ids]
     skipped = fetched_count - len(new_parsed)
     logger.info("%d new articles, %d already indexed", len(new_parsed), skipped)
 
     # 3b. Topic-based dedup — remove articles covering the same story
-    new_parsed, dedup_skipped = deduplicate_candidates(new_parsed, list(index.articles))
+    new_parsed, dedup_skipped = deduplicate_candidates(new_parsed, index.articles)
     duplicates_removed = len(dedup_skipped)
     if duplicates_removed > 0:
         logger.info(
@@ -126,93 +177,161 @@ async def run_ingestion(max_new: int = MAX_NEW_ARTICLES_PER_RUN) -> IngestionSta
                 hours_since_newest,
             )
 
-    # 5. Scrape, analyze, and write each new article
+    # Articles below the relevance threshold never reach the index, so they
+    # reappear as new on every run while their feed lists them; keep their
+    # analysis and reuse it instead of paying for the same LLM call again
+    previous_analyses = await get_analysis_cache() if new_parsed else {}
+    analysis_cache = dict(previous_analyses)
+
+    # 5. Scrape, analyze, and write the new articles concurrently.  Calls to
+    # the LLM are still spaced INTER_ARTICLE_DELAY apart however long the
+    # scrapes take, so it never sees more than a sequential run's request
+    # rate, but one article's scrape no longer waits for another's analysis.
     new_count = 0
     scraped_count = 0
     failed_count = 0
     filtered_count = 0
-
-    for i, parsed in enumerate(new_parsed):
-        try:
-            # Rate limiting between articles
-            if i > 0:
-                await asyncio.sleep(INTER_ARTICLE_DELAY)
-
-            # RSS description is always available for preview
-            description = parsed["summary"]
-
-            # Try scraping full article text
-            scraped = await scrape_article(parsed["original_url"])
-            has_full_text = scraped is not None
-            if has_full_text:
-                scraped_count += 1
-                logger.info(
-                    "Scraped %d words from: %s",
-                    scraped.word_count,
-                    parsed["title"][:60],
+    cached_count = 0
+    semaphore = asyncio.Semaphore(ARTICLE_CONCURRENCY)
+    pacer = asyncio.Lock()
+    last_analysis = float("-inf")
+
+    async def pace_analysis() -> None:
+        """Wait until INTER_ARTICLE_DELAY has passed since the last LLM call."""
+        nonlocal last_analysis
+        async with pacer:
+            wait = last_analysis + INTER_ARTICLE_DELAY - time.monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            last_analysis = time.monotonic()
+
+    async def process(parsed: ParsedArticle) -> Article | None:
+        """Ingest one article; return it, or None if filtered or failed."""
+        nonlocal new_count, scraped_count, failed_count, filtered_count, cached_count
+        async with semaphore:
+            try:
+                # RSS description is always available for preview
+                description = parsed["summary"]
+
+                # Try scraping full article text
+                scraped = await scrape_article(parsed["original_url"])
+                has_full_text = scraped is not None
+                if has_full_text:
+                    scraped_count += 1
+                    logger.info(
+                        "Scraped %d words from: %s",
+                        scraped.word_count,
+                        parsed["title"][:60],
+                    )
+
+                # Analyze with AI — full text if available, RSS description as fallback
+                content_for_ai = scraped.text if has_full_text else description
+                cache_key = analysis_cache_key(parsed["title"], content_for_ai)
+                cached = previous_analyses.get(cache_key)
+                analysis = _cached_analysis(cached)
+                if analysis is not None:
+                    cached_count += 1
+                else:
+                    if cached is not None:
+                        # Malformed entry: analyze again and drop or replace it
+                        logger.warning(
+                            "Ignoring malformed cached analysis for: %s",
+                            parsed["title"][:60],
+                        )
+                        cached = None
+                        analysis_cache.pop(cache_key, None)
+                    await pace_analysis()
+                    analysis = await analyze_article(
+                        title=parsed["title"],
+                        content=content_for_ai,
+                    )
+
+                # Filter out low-relevance articles
+                if analysis.relevance_score < RELEVANCE_THRESHOLD:
+                    filtered_count += 1
+                    now = time.time()
+                    if (
+                        cached is None
+                        or cached.get("used_at", 0) < now - ANALYSIS_CACHE_REFRESH
+                    ):
+                        analysis_cache[cache_key] = {
+                            **asdict(analysis),
+                            "used_at": now,
+                        }
+                    logger.info(
+                        "Filtered (score %d/%d): %s",
+                        analysis.relevance_score,
+                        RELEVANCE_THRESHOLD,
+                        parsed["title"][:60],
+                    )
+                    return None
+
+                article = Article(
+                    id=parsed["id"],
+                    title=parsed["title"],
+                    source=parsed["source"],
+                    source_url=parsed["source_url"],
+                    original_url=parsed["original_url"],
+                    published_at=parsed["published_at"],
+                    description=description,
+                    categories=parsed["categories"],
+                    image_url=parsed["image_url"],
+                    insights=[
+                        {"text": ins["text"], "category": ins["category"]}
+                        for ins in analysis.insights
+                    ],
+                    ai_summary=analysis.ai_summary,
+                    has_full_text=has_full_text,
+                    relevance_score=analysis.relevance_score,
+                    ingested_at=datetime.now(timezone.utc),
                 )
 
-            # Analyze with AI — full text if available, RSS description as fallback
-            content_for_ai = scraped.text if has_full_text else description
-            analysis = await analyze_article(
-                title=parsed["title"],
-                content=content_for_ai,
-            )
+                # Write article JSON only (no index update per article)
+                await write_article_only(article)
+                new_count += 1
 
-            # Filter out low-relevance articles
-            if analysis.relevance_score < RELEVANCE_THRESHOLD:
-                filtered_count += 1
+                insight_count = len(analysis.insights)
                 logger.info(
-                    "Filtered (score %d/%d): %s",
-                    analysis.relevance_score,
-                    RELEVANCE_THRESHOLD,
+                    "Ingested: %s (score %d, %d insights, %s)",
                     parsed["title"][:60],
+                    analysis.relevance_score,
+                    insight_count,
+                    "full text" if has_full_text else "RSS only",
                 )
-                continue
-
-            article = Article(
-                id=parsed["id"],
-                title=parsed["title"],
-                source=parsed["source"],
-                source_url=parsed["source_url"],
-                original_url=parsed["original_url"],
-                published_at=parsed["published_at"],
-                description=description,
-                categories=parsed["categories"],
-                image_url=parsed["image_url"],
-                insights=[
-                    {"text": ins["text"], "category": ins["category"]}
-                    for ins in analysis.insights
-                ],
-                ai_summary=analysis.ai_summary,
-                has_full_text=has_full_text,
-                relevance_score=analysis.relevance_score,
-                ingested_at=datetime.now(timezone.utc),
-            )
+                return article
+            except AnalysisError as e:
+                failed_count += 1
+                logger.error("Analysis failed for '%s': %s", parsed["title"][:60], e)
+            except Exception as e:
+                failed_count += 1
+                logger.error("Failed to ingest '%s': %s", parsed["title"][:60], e)
+            return None
 
-            # Write article JSON only (no index update per article)
-            await write_article_only(article)
-            new_count += 1
-
-            # Update in-memory index
-            summary = ArticleSummary(**article.model_dump())
-            index_articles.insert(0, summary)
-
-            insight_count = len(analysis.insights)
-            logger.info(
-                "Ingested: %s (score %d, %d insights, %s)",
-                parsed["title"][:60],
-                analysis.relevance_score,
-                insight_count,
-                "full text" if has_full_text else "RSS only",
-            )
+    ingested = await asyncio.gather(*(process(parsed) for parsed in new_parsed))
 
-        except AnalysisError as e:
-            failed_count += 1
-            logger.error("Analysis failed for '%s': %s", parsed["title"][:60], e)
-        except Exception as e:
-            failed_count += 1
-            logger.error("Failed to ingest '%s': %s", parsed["title"][:60], e)
+    if new_parsed:
+        cutoff = time.time() - ANALYSIS_CACHE_TTL
+        analysis_cache = {
+            key: entry
+            for key, entry in analysis_cache.items()
+            if _cached_analysis(entry) is not None and entry.get("used_at", 0) >= cutoff
+        }
+        # Only upload when an entry was added, refreshed, expired or malformed
+        if analysis_cache != previous_analyses:
+            try:
+                await write_analysis_cache(analysis_cache)
+            except Exception as e:
+                logger.warning("Failed to write analysis cache: %s", e)
+        if cached_count:
+            logger.info("Reused %d cached analyses", cached_count)
+
+    # New articles go first, the last processed at the top as before
+    index_articles = [
+        ArticleSummary(**article.model_dump())
+        for article in reversed(ingested)
+        if article is not None
+    ]
+    index_articles.extend(index.articles)
 
     # 6. Flush index once after all articles are processed
     if new_count > 0:
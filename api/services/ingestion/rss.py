@@ -12,6 +12,7 @@ import feedparser
 import httpx
 import yaml
 
+from api.services.cache import TTLCache
 from api.services.http_client import get_shared_client
 
 logger = logging.getLogger(__name__)
@@ -22,6 +23,20 @@ REQUEST_TIMEOUT = 30.0
 # Maximum length for article summaries before truncation
 MAX_SUMMARY_LENGTH = 500
 
+# HTML tags in feed summaries (feedparser often returns HTML)
+_HTML_TAG_RE = re.compile(r"<[^>]+>")
+
+# How long a feed's last body (and its parse) is kept for reuse when the
+# feed hasn't changed.  Runs are hours apart, so this spans several.
+_FEED_CACHE_TTL = 24 * 3600
+
+# url -> (request headers that revalidate it, body) for feeds that sent an
+# ETag or Last-Modified, so unchanged feeds come back as an empty 304
+_feed_bodies = TTLCache(ttl=_FEED_CACHE_TTL, max_size=64)
+
+# url -> (source, body, articles) from the last parse of each feed
+_parsed_feeds = TTLCache(ttl=_FEED_CACHE_TTL, max_size=64)
+
 
 class SourceConfig(TypedDict):
     """RSS source configuration from sources.yaml."""
@@ -135,7 +150,8 @@ def _extract_summary(entry: feedparser.FeedParserDict) -> str:
     # Basic HTML stripping - feedparser often returns HTML
     # A more robust solution would use a proper HTML parser
     if summary:
-        summary = re.sub(r"<[^>]+>", "", summary)
+        if "<" in summary:
+            summary = _HTML_TAG_RE.sub("", summary)
         summary = summary.strip()
 
         # Truncate to reasonable length
@@ -203,11 +219,13 @@ async def fetch_feed(url: str, timeout: float = REQUEST_TIMEOUT) -> str:
         timeout: Request timeout in seconds.
 
     Returns:
-        Feed content as string.
+        Feed content as string.  A feed that answers a conditional GET
+        with 304 Not Modified returns the body cached from its last fetch.
 
     Raises:
         httpx.HTTPError: On network or HTTP errors.
     """
+    cached = _feed_bodies.get(url)
     client = get_shared_client()
     response = await client.get(
         url,
@@ -218,9 +236,21 @@ async def fetch_feed(url: str, timeout: float = REQUEST_TIMEOUT) -> str:
             "Accept": (
                 "application/rss+xml, application/atom+xml, application/xml, text/xml"
             ),
+            **(cached[0] if cached is not None else {}),
         },
     )
+    if response.status_code == 304 and cached is not None:
+        _feed_bodies.set(url, cached)
+        return cached[1]
     response.raise_for_status()
+
+    validators = {}
+    if etag := response.headers.get("ETag"):
+        validators["If-None-Match"] = etag
+    if last_modified := response.headers.get("Last-Modified"):
+        validators["If-Modified-Since"] = last_modified
+    if validators:
+        _feed_bodies.set(url, (validators, response.text))
     return response.text
 
 
@@ -236,7 +266,18 @@ async def fetch_and_parse_source(source: SourceConfig) -> list[ParsedArticle]:
     """
     try:
         feed_data = await fetch_feed(source["url"])
-        articles = parse_feed_entries(feed_data, source)
+        # An unchanged body (a 304 replay, or a server without validators
+        # sending the same feed) parses to the same articles
+        cached = _parsed_feeds.get(source["url"])
+        if cached is not None and cached[0] == source and cached[1] == feed_data:
+            articles = list(cached[2])
+        else:
+            # feedparser is pure Python and takes tens of milliseconds on a
+            # large feed; parse in a worker thread so the other sources'
+            # fetches keep progressing meanwhile
+            articles = await asyncio.to_thread(parse_feed_entries, feed_data, source)
+            _parsed_feeds.set(source["url"], (source, feed_data, articles))
+            articles = list(articles)
         logger.info(
             "Fetched %d articles from %s",
             len(articles),
@@ -23,8 +23,8 @@ def _compute_pr_cycle_hours(pr: dict[str, Any]) -> float | None:
     if not created or not merged:
         return None
     try:
-        t_created = datetime.fromisoformat(created.replace("Z", "+00:00"))
-        t_merged = datetime.fromisoformat(merged.replace("Z", "+00:00"))
+        t_created = datetime.fromisoformat(created)
+        t_merged = datetime.fromisoformat(merged)
         return (t_merged - t_created).total_seconds() / 3600
     except (ValueError, TypeError):
         return None
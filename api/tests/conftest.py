@@ -30,7 +30,7 @@ def _reset_global_state():
     import api.services.goals_parser as goals_parser_mod
 
     goals_parser_mod._goals_file_cache = None
-    goals_parser_mod._goals_file_mtime = 0.0
+    goals_parser_mod._goals_file_cachekey = None
     goals_mod._cache = TTLCache(ttl=300, max_size=10)
 
     # 5. Rate limiter state
@@ -63,6 +63,20 @@ def _reset_global_state():
     usage_mod._usage_client = None
     usage_mod._usage_cache.clear()
 
+    # 11. Shared closed-issue search and query results for goals metrics
+    import api.services.goals_metrics_queries as gm_queries_mod
+
+    gm_queries_mod._closed_issues_cache = TTLCache(ttl=60, max_size=4)
+    gm_queries_mod._query_cache = TTLCache(
+        ttl=gm_queries_mod._QUERY_CACHE_TTL, max_size=64
+    )
+
+    # 12. RSS feed bodies and parses
+    import api.services.ingestion.rss as rss_mod
+
+    rss_mod._feed_bodies = TTLCache(ttl=rss_mod._FEED_CACHE_TTL, max_size=64)
+    rss_mod._parsed_feeds = TTLCache(ttl=rss_mod._FEED_CACHE_TTL, max_size=64)
+
 
 @pytest.fixture
 def mock_settings(monkeypatch):
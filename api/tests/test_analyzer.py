@@ -1,10 +1,20 @@
 """Tests for LLM response parsing in the article analyzer."""
 
 import json
+from unittest.mock import AsyncMock, patch
 
+import httpx
 import pytest
+from openai import RateLimitError
 
-from api.services.ingestion.analyzer import AnalysisError, _parse_response
+from api.services.ingestion.analyzer import (
+    ANALYSIS_PROMPT,
+    MAX_CONTENT_LENGTH,
+    AnalysisError,
+    _parse_response,
+    analysis_cache_key,
+    analyze_article,
+)
 
 
 def test_parse_response_valid_json():
@@ -44,3 +54,115 @@ def test_parse_response_short_summary_becomes_none():
 def test_parse_response_invalid_json_raises():
     with pytest.raises(AnalysisError, match="Invalid JSON"):
         _parse_response("This is not JSON at all")
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("length", "truncated"),
+    [(MAX_CONTENT_LENGTH, False), (MAX_CONTENT_LENGTH + 1, True)],
+)
+async def test_analyze_article_truncates_long_content(length, truncated):
+    content = "x" * length
+    with patch(
+        "api.services.ingestion.analyzer.chat_completion",
+        new_callable=AsyncMock,
+        return_value=json.dumps({"insights": []}),
+    ) as mock_chat:
+        await analyze_article("Title", content)
+
+    prompt = mock_chat.call_args.kwargs["prompt"]
+    expected = "x" * MAX_CONTENT_LENGTH + ("..." if truncated else "") + "\n"
+    assert expected in prompt
+    assert "x" * (MAX_CONTENT_LENGTH + 1) not in prompt
+
+
+@pytest.mark.asyncio
+async def test_analyze_article_prompt_matches_template():
+    with patch(
+        "api.services.ingestion.analyzer.chat_completion",
+        new_callable=AsyncMock,
+        return_value=json.dumps({"insights": []}),
+    ) as mock_chat:
+        await analyze_article("A {title}", "Body with {braces}")
+
+    assert mock_chat.call_args.kwargs["prompt"] == ANALYSIS_PROMPT.format(
+        title="A {title}", content="Body with {braces}", ellipsis=""
+    )
+
+
+def _rate_limit_error(headers=None):
+    return RateLimitError(
+        "Too many requests",
+        response=httpx.Response(
+            429,
+            headers=headers,
+            request=httpx.Request("POST", "https://example.com/chat/completions"),
+        ),
+        body=None,
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("headers", "expected_max"),
+    [({"retry-after": "2"}, 2.0), (None, 0.5)],
+)
+async def test_analyze_article_backs_off_when_rate_limited(headers, expected_max):
+    sleep = AsyncMock()
+    with (
+        patch(
+            "api.services.ingestion.analyzer.chat_completion",
+            new_callable=AsyncMock,
+            side_effect=[
+                _rate_limit_error(headers),
+                json.dumps({"insights": [], "relevance_score": 6}),
+            ],
+        ),
+        patch("api.services.ingestion.analyzer.asyncio.sleep", sleep),
+    ):
+        result = await analyze_article("Title", "Body")
+
+    assert result.relevance_score == 6
+    (delay,) = sleep.call_args.args
+    assert 0 <= delay <= expected_max
+    if headers:
+        assert delay == expected_max
+
+
+@pytest.mark.asyncio
+async def test_analyze_article_gives_up_after_retries():
+    with (
+        patch(
+            "api.services.ingestion.analyzer.chat_completion",
+            new_callable=AsyncMock,
+            side_effect=_rate_limit_error(),
+        ) as mock_chat,
+        patch("api.services.ingestion.analyzer.asyncio.sleep", new_callable=AsyncMock),
+    ):
+        with pytest.raises(AnalysisError, match="Rate limited after 3 attempts"):
+            await analyze_article("Title", "Body", max_retries=2)
+
+    assert mock_chat.call_count == 3
+
+
+def test_analysis_cache_key_ignores_content_past_truncation():
+    prefix = "x" * MAX_CONTENT_LENGTH
+    assert analysis_cache_key("Title", prefix + "a") == analysis_cache_key(
+        "Title", prefix + "b"
+    )
+
+
+@pytest.mark.parametrize(
+    ("first", "second"),
+    [
+        # The prompt gains an ellipsis once content is truncated
+        (
+            ("Title", "x" * MAX_CONTENT_LENGTH),
+            ("Title", "x" * (MAX_CONTENT_LENGTH + 1)),
+        ),
+        # Moving text between the fields changes the prompt
+        (("Title A", "Body"), ("Title", " ABody")),
+    ],
+)
+def test_analysis_cache_key_differs_when_prompt_differs(first, second):
+    assert analysis_cache_key(*first) != analysis_cache_key(*second)
@@ -1,16 +1,20 @@
 """Tests for blob_storage service — article/blog index read/write, error handling."""
 
 import json
+import threading
 from unittest.mock import MagicMock
 
 import pytest
 from azure.core.exceptions import HttpResponseError, ResourceNotFoundError
 
 from api.services.blob_storage import (
+    get_analysis_cache,
     get_article,
     get_article_index,
     get_blog_index,
     validate_blob_path_segment,
+    write_analysis_cache,
+    write_article_index,
     write_article_only,
 )
 
@@ -295,6 +299,99 @@ class TestWriteArticleOnly:
         mock_container.get_blob_client.assert_called_with("solo-1.json")
 
 
+class TestWriteArticleIndex:
+    """Tests for write_article_index()."""
+
+    @pytest.mark.asyncio
+    async def test_written_index_reads_back(self, mock_settings, monkeypatch):
+        from api.models.article import ArticleSummary
+
+        articles = [
+            ArticleSummary(**_make_article_summary("a1", title="Café ✓")),
+            ArticleSummary(**_make_article_summary("a2")),
+        ]
+        mock_blob = MagicMock()
+        mock_container = MagicMock()
+        mock_container.get_blob_client.return_value = mock_blob
+        monkeypatch.setattr(
+            "api.services.blob_storage._get_container_client",
+            lambda: mock_container,
+        )
+
+        await write_article_index(articles)
+
+        written = mock_blob.upload_blob.call_args[0][0]
+        assert json.loads(written) == [a.model_dump(mode="json") for a in articles]
+
+    @pytest.mark.asyncio
+    async def test_uploads_off_the_event_loop(self, mock_settings, monkeypatch):
+        upload_threads = []
+        mock_blob = MagicMock()
+        mock_blob.upload_blob.side_effect = lambda *args, **kwargs: (
+            upload_threads.append(threading.get_ident())
+        )
+        mock_container = MagicMock()
+        mock_container.get_blob_client.return_value = mock_blob
+        monkeypatch.setattr(
+            "api.services.blob_storage._get_container_client",
+            lambda: mock_container,
+        )
+
+        await write_article_index([])
+
+        assert upload_threads
+        assert upload_threads[0] != threading.get_ident()
+
+
+class TestGetAnalysisCache:
+    """Tests for get_analysis_cache()."""
+
+    @pytest.mark.asyncio
+    async def test_reads_cache(self, mock_settings, monkeypatch):
+        entries = {"abc": {"insights": [], "ai_summary": None, "relevance_score": 3}}
+        mock_container = MagicMock()
+        mock_container.get_blob_client.return_value = _mock_blob_download(entries)
+        monkeypatch.setattr(
+            "api.services.blob_storage._get_container_client",
+            lambda: mock_container,
+        )
+
+        assert await get_analysis_cache() == entries
+
+    @pytest.mark.asyncio
+    async def test_missing_blob_returns_empty(self, mock_settings, monkeypatch):
+        mock_blob = MagicMock()
+        mock_blob.download_blob.side_effect = ResourceNotFoundError("not found")
+        mock_container = MagicMock()
+        mock_container.get_blob_client.return_value = mock_blob
+        monkeypatch.setattr(
+            "api.services.blob_storage._get_container_client",
+            lambda: mock_container,
+        )
+
+        assert await get_analysis_cache() == {}
+
+
+class TestWriteAnalysisCache:
+    """Tests for write_analysis_cache()."""
+
+    @pytest.mark.asyncio
+    async def test_uploads_entries(self, mock_settings, monkeypatch):
+        entries = {"abc": {"insights": [], "ai_summary": None, "relevance_score": 3}}
+        mock_blob = MagicMock()
+        mock_container = MagicMock()
+        mock_container.get_blob_client.return_value = mock_blob
+        monkeypatch.setattr(
+            "api.services.blob_storage._get_container_client",
+            lambda: mock_container,
+        )
+
+        await write_analysis_cache(entries)
+
+        mock_container.get_blob_client.assert_called_with("analysis-cache.json")
+        assert json.loads(mock_blob.upload_blob.call_args[0][0]) == entries
+
+
 class TestGetBlogIndex:
     """Tests for get_blog_index()."""
 
@@ -1,7 +1,11 @@
 """Tests for TTLCache — pure logic, no mocks needed."""
 
+import asyncio
+import math
 import time
 
+import pytest
+
 from api.services.cache import TTLCache
 
 
@@ -37,3 +41,76 @@ def test_get_refreshes_lru_order():
     assert cache.get("a") == 1
     assert cache.get("b") is None  # evicted
     assert cache.get("c") == 3
+
+
+def test_get_with_age_reports_age():
+    cache = TTLCache(ttl=60)
+    cache.set("k", "v")
+    value, age = cache.get_with_age("k")
+    assert value == "v"
+    assert 0 <= age < 1
+
+
+def test_get_with_age_returns_expired_value():
+    cache = TTLCache(ttl=0.01)
+    cache.set("k", "v")
+    time.sleep(0.02)
+    value, age = cache.get_with_age("k")
+    assert value == "v"
+    assert age > 0.01
+
+
+def test_get_with_age_missing_key():
+    cache = TTLCache(ttl=60)
+    assert cache.get_with_age("missing") == (None, math.inf)
+
+
+def test_per_key_ttl_overrides_default():
+    cache = TTLCache(ttl=60)
+    cache.set("short", "s", ttl=0.01)
+    cache.set("default", "d")
+    time.sleep(0.02)
+    assert cache.get("short") is None
+    assert cache.get_stale("short") == "s"
+    assert cache.get("default") == "d"
+
+
+def test_set_without_ttl_clears_override():
+    cache = TTLCache(ttl=60)
+    cache.set("k", "v1", ttl=0.01)
+    cache.set("k", "v2")
+    time.sleep(0.02)
+    assert cache.get("k") == "v2"
+
+
+@pytest.mark.asyncio
+async def test_single_flight_shares_one_task():
+    cache = TTLCache(ttl=60)
+    calls = 0
+    release = asyncio.Event()
+
+    async def refresh():
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return "fresh"
+
+    first = cache.single_flight("k", refresh)
+    second = cache.single_flight("k", refresh)
+    assert first is second
+
+    release.set()
+    assert await asyncio.gather(first, second) == ["fresh", "fresh"]
+    assert calls == 1
+
+
+@pytest.mark.asyncio
+async def test_single_flight_forgets_finished_task():
+    cache = TTLCache(ttl=60)
+
+    async def fail():
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        await cache.single_flight("k", fail)
+    assert "k" not in cache._inflight
@@ -4,9 +4,10 @@ from datetime import datetime, timedelta, timezone
 
 from api.models.article import ArticleSummary
 from api.services.ingestion.dedup import (
+    _matches,
+    _normalize,
+    _reference,
     deduplicate_candidates,
-    _is_duplicate,
-    _title_similarity,
 )
 from api.services.ingestion.rss import ParsedArticle
 
@@ -43,6 +44,25 @@ def _make_existing(
     )
 
 
+def _is_duplicate(
+    candidate_title: str,
+    candidate_summary: str,
+    existing_title: str,
+    existing_summary: str,
+) -> bool:
+    return _matches(
+        _normalize(candidate_title),
+        _normalize(candidate_summary) if candidate_summary else None,
+        _reference(existing_title, existing_summary),
+    )
+
+
+def _title_similarity(a: str, b: str) -> float:
+    matcher = _reference(b, "").title_matcher
+    matcher.set_seq1(_normalize(a))
+    return matcher.ratio()
+
+
 def test_identical_titles_are_duplicates():
     assert _is_duplicate("OpenAI launches GPT-5", "", "OpenAI launches GPT-5", "")
 
@@ -65,8 +85,19 @@ def test_completely_different_titles_are_not_duplicates():
     )
 
 
+def test_borderline_titles_decided_by_summary():
+    title_a = "Google Gemini gets longer context"
+    title_b = "Gemini update extends context window"
+    summary = "Gemini now accepts up to two million tokens of input per request."
+    assert _is_duplicate(title_a, summary, title_b, summary)
+    assert not _is_duplicate(
+        title_a, summary, title_b, "Unrelated coverage of quarterly earnings."
+    )
+    assert not _is_duplicate(title_a, summary, title_b, "")
+
+
 def test_title_similarity_identical():
-    assert _title_similarity("hello world", "hello world") == 1.0
+    assert _title_similarity("Hello World ", "hello world") == 1.0
 
 
 def test_title_similarity_different():
@@ -1,5 +1,7 @@
 """Tests for GitHub activity feed — orchestration and caching."""
 
+import json
+
 import pytest
 
 
@@ -42,7 +44,7 @@ class TestGetActivityEventsCaching:
 
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = raw_events
+        mock_response.content = json.dumps(raw_events).encode()
 
         mock_client = AsyncMock()
         mock_client.get.return_value = mock_response
@@ -70,7 +72,7 @@ class TestGetActivityEventsCaching:
 
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = []
+        mock_response.content = b"[]"
 
         mock_client = AsyncMock()
         mock_client.get.return_value = mock_response
@@ -243,7 +243,7 @@ class TestBackfillPrTitles:
 
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {"title": "Remove orphaned avatars"}
+        mock_response.content = b'{"title": "Remove orphaned avatars"}'
 
         mock_client = AsyncMock()
         mock_client.get.return_value = mock_response
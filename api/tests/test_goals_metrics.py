@@ -1,23 +1,36 @@
 """Tests for goals_metrics service — Search API counts, commit counting, agent stats."""
 
-from datetime import datetime, timezone
+import asyncio
+import time
+from datetime import datetime, timedelta, timezone
 from unittest.mock import AsyncMock, patch
 
 import httpx
 import pytest
 
+import api.services.goals_metrics as goals_metrics_mod
+import api.services.goals_metrics_agents as goals_metrics_agents_mod
 from api.services.cache import TTLCache
 from api.services.goals_metrics import (
     _agent_role,
     _count_commits,
+    _count_windows,
     _enforce_monotonic,
     _fetch_agent_stats,
     _fetch_commits_by_agent,
+    _fetch_open_counts,
+    _fetch_recent_prs,
     _fetch_review_counts,
     _fetch_windowed_counts,
+    _floor_minute,
+    _refresh_open_counts,
+    _refresh_windowed,
+    _search_closed_issues,
     _search_count,
+    _soft_ttl,
     get_metrics,
 )
+from api.services.goals_metrics_queries import _iso, _since_iso
 
 
 class TestAgentRole:
@@ -36,6 +49,24 @@ class TestAgentRole:
         assert _agent_role("YourMoveLabs") == "org"
 
 
+class TestIsoHelpers:
+    """Tests for _iso() and _since_iso()."""
+
+    def test_iso_matches_github_format(self):
+        dt = datetime(2026, 3, 4, 5, 6, 7, 890, tzinfo=timezone.utc)
+        assert _iso(dt) == "2026-03-04T05:06:07Z"
+
+    def test_since_iso_widens_date(self):
+        assert _since_iso("2026-03-04") == "2026-03-04T00:00:00Z"
+
+    def test_since_iso_keeps_timestamp(self):
+        assert _since_iso("2026-03-04T05:06:07Z") == "2026-03-04T05:06:07Z"
+
+    def test_floor_minute_drops_seconds(self):
+        dt = datetime(2026, 3, 4, 5, 6, 7, 890, tzinfo=timezone.utc)
+        assert _floor_minute(dt) == datetime(2026, 3, 4, 5, 6, tzinfo=timezone.utc)
+
+
 class TestSearchCount:
     """Tests for _search_count()."""
 
@@ -69,6 +100,36 @@ class TestSearchCount:
             result = await _search_count("repo:test is:issue is:open")
         assert result == 0
 
+    @pytest.mark.asyncio
+    async def test_repeated_query_served_from_cache(self):
+        """The same query within the cache TTL costs one request."""
+        with patch(
+            "api.services.goals_metrics_queries.github_api_get",
+            new_callable=AsyncMock,
+            return_value={"total_count": 42},
+        ) as mock_get:
+            first, second = await asyncio.gather(
+                _search_count("repo:test is:issue is:open"),
+                _search_count("repo:test is:issue is:open"),
+            )
+            third = await _search_count("repo:test is:issue is:open")
+
+        mock_get.assert_called_once()
+        assert first == second == third == 42
+
+    @pytest.mark.asyncio
+    async def test_failure_not_cached(self):
+        """A failed search returns None and the next call retries."""
+        with patch(
+            "api.services.goals_metrics_queries.github_api_get",
+            new_callable=AsyncMock,
+            side_effect=[None, {"total_count": 3}],
+        ) as mock_get:
+            assert await _search_count("repo:test is:issue is:open") is None
+            assert await _search_count("repo:test is:issue is:open") == 3
+
+        assert mock_get.call_count == 2
+
 
 class TestCountCommits:
     """Tests for _count_commits()."""
@@ -89,6 +150,22 @@ class TestCountCommits:
         result = await _count_commits("test/repo", "2026-01-01T00:00:00Z")
         assert result == 37
 
+    @pytest.mark.asyncio
+    async def test_repeated_cutoff_served_from_cache(self, monkeypatch):
+        """Counting from the same cutoff again reuses the cached count."""
+        calls = []
+
+        async def mock_get(self, url, **kwargs):
+            calls.append(kwargs["params"]["since"])
+            return httpx.Response(200, json=[{"sha": "a"}])
+
+        monkeypatch.setattr(httpx.AsyncClient, "get", mock_get)
+        await _count_commits("test/repo", "2026-01-01T00:00:00Z")
+        await _count_commits("test/repo", "2026-01-01T00:00:00Z")
+        await _count_commits("test/repo", "2026-01-02T00:00:00Z")
+
+        assert calls == ["2026-01-01T00:00:00Z", "2026-01-02T00:00:00Z"]
+
     @pytest.mark.asyncio
     async def test_no_link_header_counts_items(self, monkeypatch):
         """When no Link header, falls back to counting response items."""
@@ -120,6 +197,122 @@ class TestCountCommits:
         assert result is None
 
 
+class TestFetchOpenCounts:
+    """Tests for _fetch_open_counts()."""
+
+    @staticmethod
+    def _mock_get(repo_response, pulls_response):
+        async def mock_get(self, url, **kwargs):
+            if url.endswith("/pulls"):
+                assert kwargs["params"] == {"state": "open", "per_page": "1"}
+                return pulls_response
+            return repo_response
+
+        return mock_get
+
+    @pytest.mark.asyncio
+    async def test_subtracts_open_prs_from_repo_count(self, monkeypatch):
+        link = (
+            "<https://api.github.com/repositories/1/pulls"
+            '?state=open&per_page=1&page=4>; rel="last"'
+        )
+        mock_get = self._mock_get(
+            httpx.Response(200, json={"open_issues_count": 11}),
+            httpx.Response(200, json=[{}], headers={"Link": link}),
+        )
+        monkeypatch.setattr(httpx.AsyncClient, "get", mock_get)
+        assert await _fetch_open_counts("test/repo") == (7, 4)
+
+    @pytest.mark.asyncio
+    async def test_repo_failure_leaves_pr_count(self, monkeypatch):
+        mock_get = self._mock_get(
+            httpx.Response(500, json={"message": "error"}),
+            httpx.Response(200, json=[]),
+        )
+        monkeypatch.setattr(httpx.AsyncClient, "get", mock_get)
+        assert await _fetch_open_counts("test/repo") == (None, 0)
+
+    @pytest.mark.asyncio
+    async def test_pr_failure_loses_both_counts(self, monkeypatch):
+        """Without the PR count, open issues can't be separated from PRs."""
+        mock_get = self._mock_get(
+            httpx.Response(200, json={"open_issues_count": 11}),
+            httpx.Response(502),
+        )
+        monkeypatch.setattr(httpx.AsyncClient, "get", mock_get)
+        assert await _fetch_open_counts("test/repo") == (None, None)
+
+
+class TestSearchClosedIssues:
+    """Tests for _search_closed_issues() — the shared 30-day closed-issue search."""
+
+    @staticmethod
+    def _ago(days: int) -> str:
+        return (datetime.now(timezone.utc) - timedelta(days=days)).strftime(
+            "%Y-%m-%dT%H:%M:%SZ"
+        )
+
+    @pytest.mark.asyncio
+    async def test_narrower_window_filtered_from_shared_search(self):
+        """A 7d and a 30d caller share one search, each seeing its own window."""
+        items = [{"closed_at": self._ago(2)}, {"closed_at": self._ago(20)}]
+
+        with patch(
+            "api.services.goals_metrics_queries._search_items",
+            new_callable=AsyncMock,
+            return_value=items,
+        ) as mock_search:
+            wide, narrow = await asyncio.gather(
+                _search_closed_issues("test/repo", self._ago(30)),
+                _search_closed_issues("test/repo", self._ago(7)),
+            )
+
+        mock_search.assert_called_once()
+        assert wide == items
+        assert narrow == items[:1]
+
+    @pytest.mark.asyncio
+    async def test_failure_not_cached(self):
+        """A failed search returns None and the next call retries."""
+        with patch(
+            "api.services.goals_metrics_queries._search_items",
+            new_callable=AsyncMock,
+            side_effect=[None, []],
+        ) as mock_search:
+            assert await _search_closed_issues("test/repo", self._ago(7)) is None
+            assert await _search_closed_issues("test/repo", self._ago(7)) == []
+
+        assert mock_search.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_older_cutoff_uses_dedicated_search(self):
+        """A cutoff before the shared 30-day window gets its own search."""
+        with patch(
+            "api.services.goals_metrics_queries._search_items",
+            new_callable=AsyncMock,
+            side_effect=[[], [{"closed_at": self._ago(40)}]],
+        ) as mock_search:
+            result = await _search_closed_issues("test/repo", self._ago(45))
+
+        assert mock_search.call_count == 2
+        assert result == [{"closed_at": self._ago(40)}]
+
+    @pytest.mark.asyncio
+    async def test_capped_result_uses_dedicated_search(self):
+        """A shared result at the 1000-item cap may be missing recent issues."""
+        capped = [{"closed_at": self._ago(20)}] * 1000
+
+        with patch(
+            "api.services.goals_metrics_queries._search_items",
+            new_callable=AsyncMock,
+            side_effect=[capped, []],
+        ) as mock_search:
+            result = await _search_closed_issues("test/repo", self._ago(7))
+
+        assert mock_search.call_count == 2
+        assert result == []
+
+
 class TestEnforceMonotonic:
     """Tests for _enforce_monotonic()."""
 
@@ -153,6 +346,38 @@ class TestEnforceMonotonic:
         assert _enforce_monotonic([None, None, 100]) == [0, 100, 100]
 
 
+class TestCountWindows:
+    """Tests for _count_windows()."""
+
+    CUTOFFS = {
+        "24h": "2026-01-30T00:00:00Z",
+        "7d": "2026-01-24T00:00:00Z",
+        "30d": "2026-01-01T00:00:00Z",
+    }
+
+    def test_buckets_into_nested_windows(self):
+        timestamps = [
+            "2026-01-30T12:00:00Z",  # all three
+            "2026-01-25T00:00:00Z",  # 7d + 30d
+            "2026-01-24T00:00:00Z",  # exactly on the 7d cutoff
+            "2026-01-10T00:00:00Z",  # 30d only
+            "2025-12-31T23:59:59Z",  # outside
+        ]
+        assert _count_windows(timestamps, self.CUTOFFS) == {
+            "24h": 1,
+            "7d": 3,
+            "30d": 4,
+        }
+
+    def test_skips_missing_timestamps(self):
+        timestamps = [None, "", "2026-01-30T12:00:00Z"]
+        assert _count_windows(timestamps, self.CUTOFFS) == {
+            "24h": 1,
+            "7d": 1,
+            "30d": 1,
+        }
+
+
 class TestFetchWindowedCounts:
     """Tests for _fetch_windowed_counts()."""
 
@@ -161,17 +386,27 @@ class TestFetchWindowedCounts:
         """All three windows and three metrics are returned."""
         now = datetime.now(timezone.utc)
 
+        def ago(**delta):
+            return (now - timedelta(**delta)).strftime("%Y-%m-%dT%H:%M:%SZ")
+
         # Merged PRs with timestamps spanning multiple windows
         merged_prs = [
-            {"merged_at": now.strftime("%Y-%m-%dT%H:%M:%SZ")},  # within 24h
+            {"merged_at": ago(hours=1)},  # within 24h
+        ]
+        # Closed issues from the single 30d search, bucketed by closed_at
+        closed_issues = [
+            {"closed_at": ago(hours=2)},  # 24h
+            {"closed_at": ago(days=3)},  # 7d
+            {"closed_at": ago(days=20)},  # 30d
+            {"closed_at": ago(days=25)},  # 30d
         ]
 
         with (
             patch(
-                "api.services.goals_metrics_windows._search_count",
+                "api.services.goals_metrics_windows._search_closed_issues",
                 new_callable=AsyncMock,
-                side_effect=[3, 10, 25],  # issues_closed: 24h, 7d, 30d
-            ),
+                return_value=closed_issues,
+            ) as mock_search_closed,
             patch(
                 "api.services.goals_metrics_windows._count_commits",
                 new_callable=AsyncMock,
@@ -185,9 +420,10 @@ class TestFetchWindowedCounts:
         ):
             result = await _fetch_windowed_counts("test/repo", now)
 
-        assert result["issues_closed"]["24h"] == 3
-        assert result["issues_closed"]["7d"] == 10
-        assert result["issues_closed"]["30d"] == 25
+        mock_search_closed.assert_called_once()
+        assert result["issues_closed"]["24h"] == 1
+        assert result["issues_closed"]["7d"] == 2
+        assert result["issues_closed"]["30d"] == 4
         assert result["prs_merged"]["24h"] == 1
         assert result["prs_merged"]["7d"] == 1
         assert result["prs_merged"]["30d"] == 1
@@ -195,25 +431,62 @@ class TestFetchWindowedCounts:
         assert result["commits"]["7d"] == 8
         assert result["commits"]["30d"] == 25
 
+    @pytest.mark.asyncio
+    async def test_issue_search_failure_counts_zero(self):
+        """A failed closed-issue search yields zero counts, not an error."""
+        now = datetime.now(timezone.utc)
+
+        with (
+            patch(
+                "api.services.goals_metrics_windows._search_closed_issues",
+                new_callable=AsyncMock,
+                return_value=None,
+            ),
+            patch(
+                "api.services.goals_metrics_windows._count_commits",
+                new_callable=AsyncMock,
+                side_effect=[3, 8, 25],
+            ),
+            patch(
+                "api.services.goals_metrics_windows.fetch_merged_prs",
+                new_callable=AsyncMock,
+                return_value=[],
+            ),
+        ):
+            result = await _fetch_windowed_counts("test/repo", now)
+
+        assert result["issues_closed"] == {"24h": 0, "7d": 0, "30d": 0}
+        assert result["commits"]["30d"] == 25
+
     @pytest.mark.asyncio
     async def test_returns_all_windows_directly(self):
-        """Verify correct index mapping by mocking at asyncio.gather level."""
+        """Verify each gathered result lands in the right window."""
         now = datetime.now(timezone.utc)
 
-        # The function creates 7 tasks via asyncio.gather:
-        # [0]: fetch_merged_prs (list of PRs)
-        # [1..3]: _search_count for issues_closed (24h, 7d, 30d)
-        # [4..6]: _count_commits (24h, 7d, 30d)
-        mock_results = [[], 2, 5, 10, 3, 8, 20]
+        # The function gathers 5 calls: fetch_merged_prs, _search_closed_issues
+        # for the last 30d, and _count_commits for 24h, 7d, 30d
+        closed_at = (now - timedelta(days=3)).strftime("%Y-%m-%dT%H:%M:%SZ")
 
-        with patch(
-            "api.services.goals_metrics_windows.asyncio.gather",
-            new_callable=AsyncMock,
-            return_value=mock_results,
+        with (
+            patch(
+                "api.services.goals_metrics_windows.fetch_merged_prs",
+                new_callable=AsyncMock,
+                return_value=[],
+            ),
+            patch(
+                "api.services.goals_metrics_windows._search_closed_issues",
+                new_callable=AsyncMock,
+                return_value=[{"closed_at": closed_at}],
+            ),
+            patch(
+                "api.services.goals_metrics_windows._count_commits",
+                new_callable=AsyncMock,
+                side_effect=[3, 8, 20],
+            ),
         ):
             result = await _fetch_windowed_counts("test/repo", now)
 
-        assert result["issues_closed"] == {"24h": 2, "7d": 5, "30d": 10}
+        assert result["issues_closed"] == {"24h": 0, "7d": 1, "30d": 1}
         assert result["prs_merged"] == {"24h": 0, "7d": 0, "30d": 0}
         assert result["commits"] == {"24h": 3, "7d": 8, "30d": 20}
 
@@ -224,10 +497,10 @@ class TestFetchWindowedCounts:
 
         with (
             patch(
-                "api.services.goals_metrics_windows._search_count",
+                "api.services.goals_metrics_windows._search_closed_issues",
                 new_callable=AsyncMock,
-                side_effect=[3, 10, 25],
-            ) as mock_search_count,
+                return_value=[],
+            ) as mock_search_closed,
             patch(
                 "api.services.goals_metrics_windows._count_commits",
                 new_callable=AsyncMock,
@@ -242,7 +515,7 @@ class TestFetchWindowedCounts:
             result = await _fetch_windowed_counts("test/repo", now)
 
             # Verify mocks were called as expected (inside context manager)
-            assert mock_search_count.call_count == 3  # 24h, 7d, 30d
+            mock_search_closed.assert_called_once()  # 30d superset
             assert mock_count_commits.call_count == 3  # 24h, 7d, 30d
             mock_fetch_prs.assert_called_once()
 
@@ -256,10 +529,10 @@ class TestFetchWindowedCounts:
 
         with (
             patch(
-                "api.services.goals_metrics_windows._search_count",
+                "api.services.goals_metrics_windows._search_closed_issues",
                 new_callable=AsyncMock,
-                side_effect=[3, 10, 25],
-            ) as mock_search_count,
+                return_value=[],
+            ) as mock_search_closed,
             patch(
                 "api.services.goals_metrics_windows._count_commits",
                 new_callable=AsyncMock,
@@ -274,7 +547,7 @@ class TestFetchWindowedCounts:
             result = await _fetch_windowed_counts("test/repo", now)
 
             # Verify mocks were called as expected (inside context manager)
-            assert mock_search_count.call_count == 3  # 24h, 7d, 30d
+            mock_search_closed.assert_called_once()  # 30d superset
             assert mock_count_commits.call_count == 3  # 24h, 7d, 30d
             mock_fetch_prs.assert_called_once()
 
@@ -282,107 +555,177 @@ class TestFetchWindowedCounts:
         assert result["prs_merged"] == {"24h": 0, "7d": 0, "30d": 0}
 
 
+def _reviews_page(prs, has_next=False, cursor=None):
+    """Build a GraphQL search response holding PRs with their reviews."""
+    return {
+        "data": {
+            "search": {
+                "pageInfo": {"hasNextPage": has_next, "endCursor": cursor},
+                "nodes": [{"reviews": {"nodes": reviews}} for reviews in prs],
+            }
+        }
+    }
+
+
+def _review(login, submitted_at="2026-01-05T12:00:00Z"):
+    """Build a GraphQL review node; "[bot]" logins become Bot authors."""
+    if login.endswith("[bot]"):
+        author = {"__typename": "Bot", "login": login.removesuffix("[bot]")}
+    else:
+        author = {"__typename": "User", "login": login}
+    return {"submittedAt": submitted_at, "author": author}
+
+
 class TestFetchReviewCounts:
     """Tests for _fetch_review_counts()."""
 
     @pytest.mark.asyncio
-    async def test_counts_reviews_by_agent(self, monkeypatch):
+    async def test_counts_reviews_by_agent(self, monkeypatch, mock_settings):
         """Reviews are counted per agent role within the time window."""
-        prs_response = [{"number": 10}]
-        reviews_response = [
-            {
-                "user": {"login": "fishbowl-reviewer[bot]"},
-                "submitted_at": "2026-01-05T12:00:00Z",
-            },
-            {
-                "user": {"login": "fishbowl-reviewer[bot]"},
-                "submitted_at": "2026-01-06T12:00:00Z",
-            },
-        ]
-
-        call_count = 0
+        page = _reviews_page(
+            [
+                [_review("fishbowl-reviewer[bot]")],
+                [_review("fishbowl-reviewer[bot]", "2026-01-06T12:00:00Z")],
+            ]
+        )
 
-        async def mock_get(self, url, **kwargs):
-            nonlocal call_count
-            call_count += 1
-            if "/pulls" in url and "/reviews" in url:
-                return httpx.Response(200, json=reviews_response)
-            if "/pulls" in url:
-                # Return PRs only for "open" state, empty for "closed"
-                params = kwargs.get("params", {})
-                if params.get("state") == "open":
-                    return httpx.Response(200, json=prs_response)
-                return httpx.Response(200, json=[])
-            return httpx.Response(200, json=[])
+        async def mock_post(self, url, **kwargs):
+            return httpx.Response(200, json=page)
 
-        monkeypatch.setattr(httpx.AsyncClient, "get", mock_get)
+        monkeypatch.setattr(httpx.AsyncClient, "post", mock_post)
         result = await _fetch_review_counts("test/repo", "2026-01-01")
         assert result["reviewer"] == 2
 
     @pytest.mark.asyncio
-    async def test_filters_by_date(self, monkeypatch):
+    async def test_searches_prs_updated_in_window(self, monkeypatch, mock_settings):
+        """One search covers every PR updated since the window start."""
+        payloads = []
+
+        async def mock_post(self, url, **kwargs):
+            payloads.append(kwargs["json"])
+            return httpx.Response(200, json=_reviews_page([]))
+
+        monkeypatch.setattr(httpx.AsyncClient, "post", mock_post)
+        await _fetch_review_counts("test/repo", "2026-01-01")
+        assert len(payloads) == 1
+        assert payloads[0]["variables"] == {
+            "q": "repo:test/repo is:pr updated:>=2026-01-01T00:00:00Z"
+        }
+
+    @pytest.mark.asyncio
+    async def test_filters_by_date(self, monkeypatch, mock_settings):
         """Reviews before the since date are excluded."""
-        prs_response = [{"number": 10, "updated_at": "2026-01-10T00:00:00Z"}]
-        reviews_response = [
-            {
-                "user": {"login": "fishbowl-reviewer[bot]"},
-                "submitted_at": "2025-12-25T12:00:00Z",
-            },
-            {
-                "user": {"login": "fishbowl-reviewer[bot]"},
-                "submitted_at": "2026-01-05T12:00:00Z",
-            },
-        ]
+        page = _reviews_page(
+            [
+                [
+                    _review("fishbowl-reviewer[bot]", "2025-12-25T12:00:00Z"),
+                    _review("fishbowl-reviewer[bot]", "2026-01-05T12:00:00Z"),
+                    _review("fishbowl-reviewer[bot]", None),  # pending review
+                ]
+            ]
+        )
 
-        async def mock_get(self, url, **kwargs):
-            if "/pulls" in url and "/reviews" in url:
-                return httpx.Response(200, json=reviews_response)
-            if "/pulls" in url:
-                params = kwargs.get("params", {})
-                if params.get("state") == "open":
-                    return httpx.Response(200, json=prs_response)
-                return httpx.Response(200, json=[])
-            return httpx.Response(200, json=[])
+        async def mock_post(self, url, **kwargs):
+            return httpx.Response(200, json=page)
 
-        monkeypatch.setattr(httpx.AsyncClient, "get", mock_get)
+        monkeypatch.setattr(httpx.AsyncClient, "post", mock_post)
         result = await _fetch_review_counts("test/repo", "2026-01-01")
         assert result["reviewer"] == 1
 
     @pytest.mark.asyncio
-    async def test_skips_unknown_reviewers(self, monkeypatch):
+    async def test_skips_unknown_reviewers(self, monkeypatch, mock_settings):
         """Reviews from non-agent users are not counted."""
-        prs_response = [{"number": 10, "updated_at": "2026-01-10T00:00:00Z"}]
-        reviews_response = [
-            {
-                "user": {"login": "random-user"},
-                "submitted_at": "2026-01-05T12:00:00Z",
-            },
-        ]
+        page = _reviews_page(
+            [
+                [
+                    _review("random-user"),
+                    {"submittedAt": "2026-01-05T12:00:00Z", "author": None},
+                ],
+                [],
+            ]
+        )
+        # Search results that aren't PRs come back as empty nodes
+        page["data"]["search"]["nodes"].append({})
 
-        async def mock_get(self, url, **kwargs):
-            if "/pulls" in url and "/reviews" in url:
-                return httpx.Response(200, json=reviews_response)
-            if "/pulls" in url:
-                params = kwargs.get("params", {})
-                if params.get("state") == "open":
-                    return httpx.Response(200, json=prs_response)
-                return httpx.Response(200, json=[])
-            return httpx.Response(200, json=[])
+        async def mock_post(self, url, **kwargs):
+            return httpx.Response(200, json=page)
 
-        monkeypatch.setattr(httpx.AsyncClient, "get", mock_get)
+        monkeypatch.setattr(httpx.AsyncClient, "post", mock_post)
         result = await _fetch_review_counts("test/repo", "2026-01-01")
         assert result == {}
 
     @pytest.mark.asyncio
-    async def test_empty_when_no_prs(self, monkeypatch):
-        """Returns empty dict when no PRs found."""
+    async def test_follows_cursor_across_pages(self, monkeypatch, mock_settings):
+        pages = [
+            _reviews_page([[_review("fishbowl-reviewer[bot]")]], True, "c1"),
+            _reviews_page([[_review("fishbowl-reviewer[bot]")]]),
+        ]
+        cursors = []
 
-        async def mock_get(self, url, **kwargs):
-            return httpx.Response(200, json=[])
+        async def mock_post(self, url, **kwargs):
+            cursors.append(kwargs["json"]["variables"].get("cursor"))
+            return httpx.Response(200, json=pages.pop(0))
 
-        monkeypatch.setattr(httpx.AsyncClient, "get", mock_get)
+        monkeypatch.setattr(httpx.AsyncClient, "post", mock_post)
         result = await _fetch_review_counts("test/repo", "2026-01-01")
-        assert result == {}
+        assert result == {"reviewer": 2}
+        assert cursors == [None, "c1"]
+
+    @pytest.mark.asyncio
+    async def test_keeps_counts_from_pages_before_an_error(
+        self, monkeypatch, mock_settings
+    ):
+        pages = [
+            httpx.Response(
+                200,
+                json=_reviews_page([[_review("fishbowl-reviewer[bot]")]], True, "c1"),
+            ),
+            httpx.Response(200, json={"errors": [{"message": "timeout"}]}),
+        ]
+
+        async def mock_post(self, url, **kwargs):
+            return pages.pop(0)
+
+        monkeypatch.setattr(httpx.AsyncClient, "post", mock_post)
+        result = await _fetch_review_counts("test/repo", "2026-01-01")
+        assert result == {"reviewer": 1}
+
+    @pytest.mark.asyncio
+    async def test_none_on_api_error(self, monkeypatch, mock_settings):
+        """A failed first page means unknown, not zero reviews."""
+
+        async def mock_post(self, url, **kwargs):
+            return httpx.Response(502)
+
+        monkeypatch.setattr(httpx.AsyncClient, "post", mock_post)
+        result = await _fetch_review_counts("test/repo", "2026-01-01")
+        assert result is None
+
+    @pytest.mark.asyncio
+    async def test_none_without_token(self, monkeypatch):
+        """GraphQL rejects anonymous requests, so none is sent."""
+        post = AsyncMock()
+        monkeypatch.setattr(httpx.AsyncClient, "post", post)
+        result = await _fetch_review_counts(
+            "test/repo", "2026-01-01", headers={"Accept": "application/json"}
+        )
+        assert result is None
+        post.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_warns_when_search_is_capped(
+        self, monkeypatch, mock_settings, caplog
+    ):
+        page = _reviews_page([[_review("fishbowl-reviewer[bot]")]])
+        page["data"]["search"]["issueCount"] = 1500
+
+        async def mock_post(self, url, **kwargs):
+            return httpx.Response(200, json=page)
+
+        monkeypatch.setattr(httpx.AsyncClient, "post", mock_post)
+        result = await _fetch_review_counts("test/repo", "2026-01-01")
+        assert result == {"reviewer": 1}
+        assert "1500 PRs updated" in caplog.text
 
 
 class TestFetchCommitsByAgent:
@@ -463,6 +806,112 @@ class TestFetchCommitsByAgent:
         result = await _fetch_commits_by_agent("test/repo", "2026-01-01")
         assert result["engineer"] == 120
 
+    @pytest.mark.asyncio
+    async def test_fetches_linked_pages_concurrently(self, monkeypatch):
+        """With a Link last page, the remaining pages are fetched in parallel."""
+        link = (
+            "<https://api.github.com/repos/test/repo/commits"
+            '?since=2026-01-01&per_page=100&page=3>; rel="last"'
+        )
+        full_page = [{"author": {"login": "fishbowl-engineer[bot]"}}] * 100
+        last_page = [{"author": {"login": "fishbowl-engineer[bot]"}}] * 5
+        requested_pages = []
+        in_flight = 0
+        peak = 0
+
+        async def mock_get(self, url, **kwargs):
+            nonlocal in_flight, peak
+            page = kwargs["params"]["page"]
+            requested_pages.append(page)
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            if page == "1":
+                return httpx.Response(200, json=full_page, headers={"Link": link})
+            return httpx.Response(200, json=full_page if page == "2" else last_page)
+
+        monkeypatch.setattr(httpx.AsyncClient, "get", mock_get)
+        result = await _fetch_commits_by_agent("test/repo", "2026-01-01")
+        assert result["engineer"] == 205
+        assert sorted(requested_pages) == ["1", "2", "3"]
+        assert peak == 2  # pages 2 and 3 overlapped
+
+    @pytest.mark.asyncio
+    async def test_bounds_concurrent_page_fetches(self, monkeypatch):
+        """No more than _COMMIT_PAGE_CONCURRENCY pages are fetched at once."""
+        monkeypatch.setattr(
+            "api.services.goals_metrics_agents._COMMIT_PAGE_CONCURRENCY", 3
+        )
+        link = (
+            "<https://api.github.com/repos/test/repo/commits"
+            '?since=2026-01-01&per_page=100&page=12>; rel="last"'
+        )
+        full_page = [{"author": {"login": "fishbowl-engineer[bot]"}}] * 100
+        in_flight = 0
+        peak = 0
+
+        async def mock_get(self, url, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return httpx.Response(200, json=full_page, headers={"Link": link})
+
+        monkeypatch.setattr(httpx.AsyncClient, "get", mock_get)
+        result = await _fetch_commits_by_agent("test/repo", "2026-01-01")
+        assert result["engineer"] == 1200
+        assert peak == 3
+
+
+class TestFetchRecentPrs:
+    """Tests for _fetch_recent_prs()."""
+
+    @pytest.mark.asyncio
+    async def test_keeps_prs_opened_or_merged_in_window(self, monkeypatch):
+        """PRs opened or merged since the date are kept; others are dropped."""
+        prs = [
+            {
+                "number": 1,
+                "created_at": "2026-01-05T10:00:00Z",
+                "merged_at": None,
+                "updated_at": "2026-01-05T10:00:00Z",
+            },
+            {
+                "number": 2,
+                "created_at": "2025-12-20T10:00:00Z",
+                "merged_at": "2026-01-03T10:00:00Z",
+                "updated_at": "2026-01-03T10:00:00Z",
+            },
+            {
+                "number": 3,
+                "created_at": "2025-12-20T10:00:00Z",
+                "merged_at": None,
+                "updated_at": "2026-01-02T10:00:00Z",
+            },  # only commented on in the window
+        ]
+        captured_params = []
+
+        async def mock_get(self, url, **kwargs):
+            captured_params.append(kwargs.get("params"))
+            return httpx.Response(200, json=prs)
+
+        monkeypatch.setattr(httpx.AsyncClient, "get", mock_get)
+        result = await _fetch_recent_prs("test/repo", "2026-01-01")
+        assert [pr["number"] for pr in result] == [1, 2]
+        assert captured_params[0]["state"] == "all"
+
+    @pytest.mark.asyncio
+    async def test_returns_none_on_failure(self, monkeypatch):
+        """First-page failure returns None so the category is skipped."""
+
+        async def mock_get(self, url, **kwargs):
+            return httpx.Response(500, json={"message": "error"})
+
+        monkeypatch.setattr(httpx.AsyncClient, "get", mock_get)
+        assert await _fetch_recent_prs("test/repo", "2026-01-01") is None
+
 
 class TestFetchAgentStats:
     """Tests for _fetch_agent_stats()."""
@@ -478,13 +927,18 @@ class TestFetchAgentStats:
         ]
 
         with (
+            patch(
+                "api.services.goals_metrics_agents._search_closed_issues",
+                new_callable=AsyncMock,
+                return_value=closed_issues,
+            ),
             patch(
                 "api.services.goals_metrics_agents._search_items",
                 new_callable=AsyncMock,
-                side_effect=[closed_issues, [], []],
+                return_value=[],
             ),
             patch(
-                "api.services.goals_metrics_agents.fetch_merged_prs",
+                "api.services.goals_metrics_agents._fetch_recent_prs",
                 new_callable=AsyncMock,
                 return_value=[],
             ),
@@ -514,13 +968,18 @@ class TestFetchAgentStats:
         ]
 
         with (
+            patch(
+                "api.services.goals_metrics_agents._search_closed_issues",
+                new_callable=AsyncMock,
+                return_value=closed_issues,
+            ),
             patch(
                 "api.services.goals_metrics_agents._search_items",
                 new_callable=AsyncMock,
-                side_effect=[closed_issues, [], []],
+                return_value=[],
             ),
             patch(
-                "api.services.goals_metrics_agents.fetch_merged_prs",
+                "api.services.goals_metrics_agents._fetch_recent_prs",
                 new_callable=AsyncMock,
                 return_value=[],
             ),
@@ -549,13 +1008,18 @@ class TestFetchAgentStats:
         ]
 
         with (
+            patch(
+                "api.services.goals_metrics_agents._search_closed_issues",
+                new_callable=AsyncMock,
+                return_value=[],
+            ),
             patch(
                 "api.services.goals_metrics_agents._search_items",
                 new_callable=AsyncMock,
-                side_effect=[[], opened_issues, []],
+                return_value=opened_issues,
             ),
             patch(
-                "api.services.goals_metrics_agents.fetch_merged_prs",
+                "api.services.goals_metrics_agents._fetch_recent_prs",
                 new_callable=AsyncMock,
                 return_value=[],
             ),
@@ -578,22 +1042,35 @@ class TestFetchAgentStats:
     @pytest.mark.asyncio
     async def test_counts_prs_opened_by_author(self):
         """Opened PRs are attributed to the PR author."""
-        prs_opened = [
-            {"user": {"login": "fishbowl-engineer[bot]"}},
-            {"user": {"login": "fishbowl-engineer[bot]"}},
+        prs = [
+            {
+                "user": {"login": "fishbowl-engineer[bot]"},
+                "created_at": "2026-01-02T10:00:00Z",
+                "merged_at": None,
+            },
+            {
+                "user": {"login": "fishbowl-engineer[bot]"},
+                "created_at": "2026-01-03T10:00:00Z",
+                "merged_at": None,
+            },
         ]
 
         with (
             patch(
-                "api.services.goals_metrics_agents._search_items",
+                "api.services.goals_metrics_agents._search_closed_issues",
                 new_callable=AsyncMock,
-                side_effect=[[], [], prs_opened],
+                return_value=[],
             ),
             patch(
-                "api.services.goals_metrics_agents.fetch_merged_prs",
+                "api.services.goals_metrics_agents._search_items",
                 new_callable=AsyncMock,
                 return_value=[],
             ),
+            patch(
+                "api.services.goals_metrics_agents._fetch_recent_prs",
+                new_callable=AsyncMock,
+                return_value=prs,
+            ),
             patch(
                 "api.services.goals_metrics_agents._fetch_review_counts",
                 new_callable=AsyncMock,
@@ -608,22 +1085,32 @@ class TestFetchAgentStats:
             result = await _fetch_agent_stats("test/repo", "2026-01-01")
 
         assert result["engineer"]["prs_opened"] == 2
+        assert result["engineer"]["prs_merged"] == 0
 
     @pytest.mark.asyncio
     async def test_counts_prs_merged_by_author(self):
         """Merged PRs are attributed to the PR author's agent role."""
         prs = [
-            {"user": {"login": "fishbowl-engineer[bot]"}},
+            {
+                "user": {"login": "fishbowl-engineer[bot]"},
+                "created_at": "2025-12-20T10:00:00Z",
+                "merged_at": "2026-01-02T10:00:00Z",
+            },
         ]
 
         with (
+            patch(
+                "api.services.goals_metrics_agents._search_closed_issues",
+                new_callable=AsyncMock,
+                return_value=[],
+            ),
             patch(
                 "api.services.goals_metrics_agents._search_items",
                 new_callable=AsyncMock,
-                side_effect=[[], [], []],
+                return_value=[],
             ),
             patch(
-                "api.services.goals_metrics_agents.fetch_merged_prs",
+                "api.services.goals_metrics_agents._fetch_recent_prs",
                 new_callable=AsyncMock,
                 return_value=prs,
             ),
@@ -653,13 +1140,18 @@ class TestFetchAgentStats:
         ]
 
         with (
+            patch(
+                "api.services.goals_metrics_agents._search_closed_issues",
+                new_callable=AsyncMock,
+                return_value=closed_issues,
+            ),
             patch(
                 "api.services.goals_metrics_agents._search_items",
                 new_callable=AsyncMock,
-                side_effect=[closed_issues, [], []],
+                return_value=[],
             ),
             patch(
-                "api.services.goals_metrics_agents.fetch_merged_prs",
+                "api.services.goals_metrics_agents._fetch_recent_prs",
                 new_callable=AsyncMock,
                 return_value=[],
             ),
@@ -688,17 +1180,26 @@ class TestFetchAgentStats:
             },
         ]
         prs = [
-            {"user": {"login": "fishbowl-engineer[bot]"}},
+            {
+                "user": {"login": "fishbowl-engineer[bot]"},
+                "created_at": "2025-12-20T10:00:00Z",
+                "merged_at": "2026-01-02T10:00:00Z",
+            },
         ]
 
         with (
+            patch(
+                "api.services.goals_metrics_agents._search_closed_issues",
+                new_callable=AsyncMock,
+                return_value=closed_issues,
+            ),
             patch(
                 "api.services.goals_metrics_agents._search_items",
                 new_callable=AsyncMock,
-                side_effect=[closed_issues, [], []],
+                return_value=[],
             ),
             patch(
-                "api.services.goals_metrics_agents.fetch_merged_prs",
+                "api.services.goals_metrics_agents._fetch_recent_prs",
                 new_callable=AsyncMock,
                 return_value=prs,
             ),
@@ -719,19 +1220,72 @@ class TestFetchAgentStats:
         assert result["engineer"]["prs_merged"] == 1
         assert result["reviewer"]["reviews"] == 5
 
+    @pytest.mark.asyncio
+    async def test_skips_reviews_when_unavailable(self):
+        """Review counts of None leave the other categories intact."""
+        closed_issues = [
+            {
+                "assignees": [{"login": "fishbowl-engineer[bot]"}],
+                "user": {"login": "fishbowl-engineer[bot]"},
+            },
+        ]
+
+        with (
+            patch(
+                "api.services.goals_metrics_agents._search_closed_issues",
+                new_callable=AsyncMock,
+                return_value=closed_issues,
+            ),
+            patch(
+                "api.services.goals_metrics_agents._search_items",
+                new_callable=AsyncMock,
+                return_value=[],
+            ),
+            patch(
+                "api.services.goals_metrics_agents._fetch_recent_prs",
+                new_callable=AsyncMock,
+                return_value=[],
+            ),
+            patch(
+                "api.services.goals_metrics_agents._fetch_review_counts",
+                new_callable=AsyncMock,
+                return_value=None,
+            ),
+            patch(
+                "api.services.goals_metrics_agents._fetch_commits_by_agent",
+                new_callable=AsyncMock,
+                return_value={},
+            ),
+        ):
+            result = await _fetch_agent_stats("test/repo", "2026-01-01")
+
+        assert result["engineer"]["issues_closed"] == 1
+        assert result["engineer"]["reviews"] == 0
+
     @pytest.mark.asyncio
     async def test_initializes_all_stat_fields(self):
         """Each agent entry has all six stat fields initialized."""
-        prs = [{"user": {"login": "fishbowl-engineer[bot]"}}]
+        prs = [
+            {
+                "user": {"login": "fishbowl-engineer[bot]"},
+                "created_at": "2026-01-02T10:00:00Z",
+                "merged_at": "2026-01-02T12:00:00Z",
+            }
+        ]
 
         with (
+            patch(
+                "api.services.goals_metrics_agents._search_closed_issues",
+                new_callable=AsyncMock,
+                return_value=[],
+            ),
             patch(
                 "api.services.goals_metrics_agents._search_items",
                 new_callable=AsyncMock,
-                side_effect=[[], [], []],
+                return_value=[],
             ),
             patch(
-                "api.services.goals_metrics_agents.fetch_merged_prs",
+                "api.services.goals_metrics_agents._fetch_recent_prs",
                 new_callable=AsyncMock,
                 return_value=prs,
             ),
@@ -762,13 +1316,18 @@ class TestFetchAgentStats:
     async def test_review_counts_merged_into_stats(self):
         """Review counts from _fetch_review_counts are merged into agent stats."""
         with (
+            patch(
+                "api.services.goals_metrics_agents._search_closed_issues",
+                new_callable=AsyncMock,
+                return_value=[],
+            ),
             patch(
                 "api.services.goals_metrics_agents._search_items",
                 new_callable=AsyncMock,
-                side_effect=[[], [], []],
+                return_value=[],
             ),
             patch(
-                "api.services.goals_metrics_agents.fetch_merged_prs",
+                "api.services.goals_metrics_agents._fetch_recent_prs",
                 new_callable=AsyncMock,
                 return_value=[],
             ),
@@ -793,13 +1352,18 @@ class TestFetchAgentStats:
     async def test_commit_counts_merged_into_stats(self):
         """Commit counts from _fetch_commits_by_agent are merged into agent stats."""
         with (
+            patch(
+                "api.services.goals_metrics_agents._search_closed_issues",
+                new_callable=AsyncMock,
+                return_value=[],
+            ),
             patch(
                 "api.services.goals_metrics_agents._search_items",
                 new_callable=AsyncMock,
-                side_effect=[[], [], []],
+                return_value=[],
             ),
             patch(
-                "api.services.goals_metrics_agents.fetch_merged_prs",
+                "api.services.goals_metrics_agents._fetch_recent_prs",
                 new_callable=AsyncMock,
                 return_value=[],
             ),
@@ -819,22 +1383,104 @@ class TestFetchAgentStats:
         assert result["engineer"]["commits"] == 42
         assert result["reviewer"]["commits"] == 3
 
+    @pytest.mark.asyncio
+    async def test_headers_built_once_for_fan_out(self, mock_settings):
+        """Every sub-fetch receives the same headers dict."""
+        targets = {
+            "_search_closed_issues": [],
+            "_search_items": [],
+            "_fetch_recent_prs": [],
+            "_fetch_review_counts": {},
+            "_fetch_commits_by_agent": {},
+        }
+        mocks = {
+            name: patch(
+                f"api.services.goals_metrics_agents.{name}",
+                new_callable=AsyncMock,
+                return_value=value,
+            )
+            for name, value in targets.items()
+        }
+        with (
+            patch(
+                "api.services.goals_metrics_agents.github_headers",
+                wraps=goals_metrics_agents_mod.github_headers,
+            ) as mock_headers,
+            mocks["_search_closed_issues"] as m1,
+            mocks["_search_items"] as m2,
+            mocks["_fetch_recent_prs"] as m3,
+            mocks["_fetch_review_counts"] as m4,
+            mocks["_fetch_commits_by_agent"] as m5,
+        ):
+            await _fetch_agent_stats("test/repo", "2026-01-01")
+
+        mock_headers.assert_called_once()
+        sent = {id(m.call_args.kwargs["headers"]) for m in (m1, m2, m3, m4, m5)}
+        assert len(sent) == 1
+
+
+class TestSoftTtl:
+    """Tests for _soft_ttl()."""
+
+    @staticmethod
+    def _windowed(prs_24h, commits_24h):
+        return {
+            "prs_merged": {"24h": prs_24h, "7d": 0, "30d": 0},
+            "commits": {"24h": commits_24h, "7d": 0, "30d": 0},
+        }
+
+    def test_base_ttl_without_activity_data(self):
+        assert _soft_ttl("metrics:open", None) == 60
+
+    def test_busy_repo_refreshes_sooner(self):
+        assert _soft_ttl("metrics:open", self._windowed(8, 15)) == 30
+
+    def test_moderate_activity_keeps_base_ttl(self):
+        assert _soft_ttl("metrics:by_agent", self._windowed(2, 4)) == 300
+
+    def test_quiet_repo_refreshes_less_often(self):
+        assert _soft_ttl("metrics:windowed", self._windowed(0, 1)) == 1200
+
+    def test_never_exceeds_hard_ttl(self, monkeypatch):
+        monkeypatch.setitem(
+            goals_metrics_mod._COMPONENT_TTLS, "metrics:open", (600, 900)
+        )
+        assert _soft_ttl("metrics:open", self._windowed(0, 0)) == 900
+
+    @pytest.mark.asyncio
+    async def test_refresh_stores_scaled_ttl(self, mock_settings):
+        cache = TTLCache(ttl=300, max_size=10)
+        cache.set("metrics:windowed", self._windowed(10, 30))
+
+        with patch(
+            "api.services.goals_metrics._fetch_open_counts",
+            new_callable=AsyncMock,
+            return_value=(1, 1),
+        ):
+            await _refresh_open_counts(cache)
+
+        assert cache._ttls["metrics:open"] == 30
+
 
 class TestGetMetrics:
-    """Tests for get_metrics()."""
+    """Tests for get_metrics() and the per-component refreshes."""
 
     @pytest.mark.asyncio
     async def test_returns_cached_data(self):
         cache = TTLCache(ttl=300, max_size=10)
-        fake_metrics = {"open_issues": 5}
-        cache.set("metrics", fake_metrics)
+        cache.set("metrics:open", {"open_issues": 5, "open_prs": 1})
+        cache.set("metrics:windowed", {"issues_closed": {"24h": 1}})
+        cache.set("metrics:by_agent", {"by_agent": {"engineer": {}}})
 
         result = await get_metrics(cache)
-        assert result == fake_metrics
+        assert result["open_issues"] == 5
+        assert result["open_prs"] == 1
+        assert result["issues_closed"] == {"24h": 1}
+        assert result["by_agent"] == {"engineer": {}}
 
     @pytest.mark.asyncio
     async def test_computes_from_api(self, mock_settings):
-        """Fetches data via Search API and computes metrics."""
+        """Fetches data from GitHub and computes metrics."""
         windowed = {
             "issues_closed": {"24h": 1, "7d": 5, "30d": 10},
             "prs_merged": {"24h": 0, "7d": 3, "30d": 8},
@@ -844,9 +1490,9 @@ class TestGetMetrics:
 
         with (
             patch(
-                "api.services.goals_metrics._search_count",
+                "api.services.goals_metrics._fetch_open_counts",
                 new_callable=AsyncMock,
-                side_effect=[7, 2],  # open_issues, open_prs
+                return_value=(7, 2),
             ),
             patch(
                 "api.services.goals_metrics._fetch_windowed_counts",
@@ -872,53 +1518,78 @@ class TestGetMetrics:
     @pytest.mark.asyncio
     async def test_exception_returns_empty_metrics(self, mock_settings):
         """Exceptions produce empty metrics (graceful degradation)."""
-        with patch(
-            "api.services.goals_metrics._search_count",
-            new_callable=AsyncMock,
-            side_effect=Exception("connection failed"),
+        error = Exception("connection failed")
+        with (
+            patch(
+                "api.services.goals_metrics._fetch_open_counts",
+                new_callable=AsyncMock,
+                side_effect=error,
+            ),
+            patch(
+                "api.services.goals_metrics._fetch_windowed_counts",
+                new_callable=AsyncMock,
+                side_effect=error,
+            ),
+            patch(
+                "api.services.goals_metrics._fetch_agent_stats",
+                new_callable=AsyncMock,
+                side_effect=error,
+            ),
         ):
             cache = TTLCache(ttl=300, max_size=10)
             result = await get_metrics(cache)
 
         assert result["open_issues"] == 0
         assert result["open_prs"] == 0
+        assert result["commits"] == {"24h": 0, "7d": 0, "30d": 0}
+        assert result["by_agent"] == {}
 
     @pytest.mark.asyncio
     async def test_exception_returns_stale_cache(self, mock_settings):
         """Exceptions return stale cached data when available (#326)."""
-        stale_metrics = {
-            "open_issues": 5,
-            "open_prs": 2,
+        stale_open = {"open_issues": 5, "open_prs": 2}
+        cache = TTLCache(ttl=0, max_size=10)
+        cache._store["metrics:open"] = (stale_open, 0)  # expired
+
+        with patch(
+            "api.services.goals_metrics._fetch_open_counts",
+            new_callable=AsyncMock,
+            side_effect=Exception("connection failed"),
+        ):
+            result = await _refresh_open_counts(cache)
+
+        assert result == stale_open
+
+    @pytest.mark.asyncio
+    async def test_windowed_exception_returns_stale_cache(self, mock_settings):
+        """A failed windowed fetch returns the stale windows (#326)."""
+        stale_windowed = {
             "prs_merged": {"24h": 3, "7d": 10, "30d": 25},
             "commits": {"24h": 5, "7d": 20, "30d": 50},
             "issues_closed": {"24h": 1, "7d": 5, "30d": 10},
-            "by_agent": {"engineer": {"prs_merged": 8}},
         }
         cache = TTLCache(ttl=0, max_size=10)
-        cache._store["metrics"] = (stale_metrics, 0)  # expired
+        cache._store["metrics:windowed"] = (stale_windowed, 0)  # expired
 
         with patch(
-            "api.services.goals_metrics._search_count",
+            "api.services.goals_metrics._fetch_windowed_counts",
             new_callable=AsyncMock,
             side_effect=Exception("connection failed"),
         ):
-            result = await get_metrics(cache)
+            result = await _refresh_windowed(cache)
 
-        assert result == stale_metrics
+        assert result == stale_windowed
 
     @pytest.mark.asyncio
     async def test_partial_failure_preserves_stale_pr_data(self, mock_settings):
         """When PR fetch fails, stale PR data is used (#326)."""
-        stale_metrics = {
-            "open_issues": 5,
-            "open_prs": 2,
+        stale_windowed = {
             "prs_merged": {"24h": 3, "7d": 10, "30d": 25},
             "commits": {"24h": 5, "7d": 20, "30d": 50},
             "issues_closed": {"24h": 1, "7d": 5, "30d": 10},
-            "by_agent": {},
         }
         cache = TTLCache(ttl=0, max_size=10)
-        cache._store["metrics"] = (stale_metrics, 0)  # expired
+        cache._store["metrics:windowed"] = (stale_windowed, 0)  # expired
 
         # PR fetch failed (None values), commits succeeded
         windowed = {
@@ -927,24 +1598,12 @@ class TestGetMetrics:
             "commits": {"24h": 8, "7d": 30, "30d": 60},
         }
 
-        with (
-            patch(
-                "api.services.goals_metrics._search_count",
-                new_callable=AsyncMock,
-                side_effect=[7, 3],
-            ),
-            patch(
-                "api.services.goals_metrics._fetch_windowed_counts",
-                new_callable=AsyncMock,
-                return_value=windowed,
-            ),
-            patch(
-                "api.services.goals_metrics._fetch_agent_stats",
-                new_callable=AsyncMock,
-                return_value={},
-            ),
+        with patch(
+            "api.services.goals_metrics._fetch_windowed_counts",
+            new_callable=AsyncMock,
+            return_value=windowed,
         ):
-            result = await get_metrics(cache)
+            result = await _refresh_windowed(cache)
 
         # PR data from stale cache
         assert result["prs_merged"] == {"24h": 3, "7d": 10, "30d": 25}
@@ -956,16 +1615,13 @@ class TestGetMetrics:
     @pytest.mark.asyncio
     async def test_partial_failure_preserves_stale_commit_data(self, mock_settings):
         """When commit fetch fails, stale commit data is used (#326)."""
-        stale_metrics = {
-            "open_issues": 5,
-            "open_prs": 2,
+        stale_windowed = {
             "prs_merged": {"24h": 3, "7d": 10, "30d": 25},
             "commits": {"24h": 5, "7d": 20, "30d": 50},
             "issues_closed": {"24h": 1, "7d": 5, "30d": 10},
-            "by_agent": {},
         }
         cache = TTLCache(ttl=0, max_size=10)
-        cache._store["metrics"] = (stale_metrics, 0)  # expired
+        cache._store["metrics:windowed"] = (stale_windowed, 0)  # expired
 
         # Commits failed (None values), PRs succeeded
         windowed = {
@@ -974,24 +1630,12 @@ class TestGetMetrics:
             "commits": {"24h": None, "7d": None, "30d": None},
         }
 
-        with (
-            patch(
-                "api.services.goals_metrics._search_count",
-                new_callable=AsyncMock,
-                side_effect=[7, 3],
-            ),
-            patch(
-                "api.services.goals_metrics._fetch_windowed_counts",
-                new_callable=AsyncMock,
-                return_value=windowed,
-            ),
-            patch(
-                "api.services.goals_metrics._fetch_agent_stats",
-                new_callable=AsyncMock,
-                return_value={},
-            ),
+        with patch(
+            "api.services.goals_metrics._fetch_windowed_counts",
+            new_callable=AsyncMock,
+            return_value=windowed,
         ):
-            result = await get_metrics(cache)
+            result = await _refresh_windowed(cache)
 
         # Commits from stale cache
         assert result["commits"] == {"24h": 5, "7d": 20, "30d": 50}
@@ -1009,9 +1653,9 @@ class TestGetMetrics:
 
         with (
             patch(
-                "api.services.goals_metrics._search_count",
+                "api.services.goals_metrics._fetch_open_counts",
                 new_callable=AsyncMock,
-                side_effect=[7, 3],
+                return_value=(7, 3),
             ),
             patch(
                 "api.services.goals_metrics._fetch_windowed_counts",
@@ -1032,7 +1676,7 @@ class TestGetMetrics:
 
     @pytest.mark.asyncio
     async def test_result_is_cached(self, mock_settings):
-        """Computed metrics are stored in cache."""
+        """Each computed component is stored in cache under its own key."""
         windowed = {
             "issues_closed": {"24h": 0, "7d": 0, "30d": 0},
             "prs_merged": {"24h": 0, "7d": 0, "30d": 0},
@@ -1041,9 +1685,9 @@ class TestGetMetrics:
 
         with (
             patch(
-                "api.services.goals_metrics._search_count",
+                "api.services.goals_metrics._fetch_open_counts",
                 new_callable=AsyncMock,
-                return_value=0,
+                return_value=(0, 0),
             ),
             patch(
                 "api.services.goals_metrics._fetch_windowed_counts",
@@ -1059,6 +1703,137 @@ class TestGetMetrics:
             cache = TTLCache(ttl=300, max_size=10)
             await get_metrics(cache)
 
-        cached = cache.get("metrics")
-        assert cached is not None
-        assert "open_issues" in cached
+        assert "open_issues" in cache.get("metrics:open")
+        assert "commits" in cache.get("metrics:windowed")
+        assert "by_agent" in cache.get("metrics:by_agent")
+
+    @pytest.mark.asyncio
+    async def test_components_expire_independently(self, mock_settings):
+        """Only components past their own TTL are refetched."""
+        windowed = {
+            "issues_closed": {"24h": 0, "7d": 0, "30d": 0},
+            "prs_merged": {"24h": 0, "7d": 0, "30d": 0},
+            "commits": {"24h": 0, "7d": 0, "30d": 0},
+        }
+        cache = TTLCache(ttl=300, max_size=10)
+
+        with (
+            patch(
+                "api.services.goals_metrics._fetch_open_counts",
+                new_callable=AsyncMock,
+                return_value=(4, 4),
+            ) as mock_open_counts,
+            patch(
+                "api.services.goals_metrics._fetch_windowed_counts",
+                new_callable=AsyncMock,
+                return_value=windowed,
+            ) as mock_windowed,
+            patch(
+                "api.services.goals_metrics._fetch_agent_stats",
+                new_callable=AsyncMock,
+                return_value={},
+            ) as mock_agent_stats,
+        ):
+            await get_metrics(cache)
+
+            # Age every entry past the open-count TTL only
+            for key, (value, ts) in list(cache._store.items()):
+                cache._store[key] = (value, ts - 200)
+
+            await get_metrics(cache)
+            await asyncio.gather(*cache._inflight.values())
+
+        assert mock_open_counts.call_count == 2
+        assert mock_windowed.call_count == 1
+        assert mock_agent_stats.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_refresh(self, mock_settings):
+        """Concurrent cache misses coalesce into a single GitHub fetch."""
+        windowed = {
+            "issues_closed": {"24h": 0, "7d": 0, "30d": 0},
+            "prs_merged": {"24h": 0, "7d": 0, "30d": 0},
+            "commits": {"24h": 0, "7d": 0, "30d": 0},
+        }
+
+        with (
+            patch(
+                "api.services.goals_metrics._fetch_open_counts",
+                new_callable=AsyncMock,
+                return_value=(4, 4),
+            ) as mock_open_counts,
+            patch(
+                "api.services.goals_metrics._fetch_windowed_counts",
+                new_callable=AsyncMock,
+                return_value=windowed,
+            ) as mock_windowed,
+            patch(
+                "api.services.goals_metrics._fetch_agent_stats",
+                new_callable=AsyncMock,
+                return_value={},
+            ),
+        ):
+            cache = TTLCache(ttl=300, max_size=10)
+            results = await asyncio.gather(*[get_metrics(cache) for _ in range(5)])
+
+        assert mock_windowed.call_count == 1
+        assert mock_open_counts.call_count == 1
+        assert all(r == results[0] for r in results)
+        assert results[0]["open_issues"] == 4
+
+    @pytest.mark.asyncio
+    async def test_expired_entry_served_stale_while_refreshing(self, mock_settings):
+        """An expired entry is returned immediately and refreshed in background."""
+        # Past every component's soft TTL, within every hard TTL
+        stored_at = time.time() - 700
+        cache = TTLCache(ttl=300, max_size=10)
+        cache._store["metrics:open"] = ({"open_issues": 5, "open_prs": 1}, stored_at)
+        cache._store["metrics:windowed"] = ({"issues_closed": {}}, stored_at)
+        cache._store["metrics:by_agent"] = ({"by_agent": {}}, stored_at)
+        windowed = {
+            "issues_closed": {"24h": 0, "7d": 0, "30d": 0},
+            "prs_merged": {"24h": 0, "7d": 0, "30d": 0},
+            "commits": {"24h": 0, "7d": 0, "30d": 0},
+        }
+
+        with (
+            patch(
+                "api.services.goals_metrics._fetch_open_counts",
+                new_callable=AsyncMock,
+                return_value=(9, 9),
+            ),
+            patch(
+                "api.services.goals_metrics._fetch_windowed_counts",
+                new_callable=AsyncMock,
+                return_value=windowed,
+            ),
+            patch(
+                "api.services.goals_metrics._fetch_agent_stats",
+                new_callable=AsyncMock,
+                return_value={},
+            ),
+        ):
+            result = await get_metrics(cache)
+            assert result["open_issues"] == 5
+
+            # Let the background refreshes finish while the mocks are active
+            await asyncio.gather(*cache._inflight.values())
+
+        assert cache.get("metrics:open")["open_issues"] == 9
+
+    @pytest.mark.asyncio
+    async def test_entry_past_hard_ttl_waits_for_refresh(self, mock_settings):
+        """An entry older than its hard TTL is refreshed before returning."""
+        cache = TTLCache(ttl=300, max_size=10)
+        cache._store["metrics:open"] = ({"open_issues": 5, "open_prs": 1}, 0)
+        cache.set("metrics:windowed", {"issues_closed": {}})
+        cache.set("metrics:by_agent", {"by_agent": {}})
+
+        with patch(
+            "api.services.goals_metrics._fetch_open_counts",
+            new_callable=AsyncMock,
+            return_value=(9, 9),
+        ):
+            result = await get_metrics(cache)
+
+        assert result["open_issues"] == 9
@@ -146,6 +146,17 @@ def test_missing_sections(tmp_path):
     assert result["constraints"] == []
 
 
+def test_subheadings_stay_in_their_section(tmp_path):
+    """Only ``## `` headings split sections; ``###`` lines belong to the body."""
+    content = "## Mission\n\nFirst line.\n### Detail\nSecond line.\n## Goal 1: Next\n"
+    path = _write_goals(tmp_path, content)
+    with patch("api.services.goals_parser._find_goals_file", return_value=path):
+        result = parse_goals_file()
+
+    assert result["mission"] == "First line.\n### Detail\nSecond line."
+    assert [g["title"] for g in result["goals"]] == ["Next"]
+
+
 def test_goal_with_no_examples(tmp_path):
     content = """\
 # Goals
@@ -220,3 +231,24 @@ Single goal now.
     assert result2["mission"] == "New mission."
     assert len(result2["goals"]) == 1
     assert result2["goals"][0]["title"] == "Only One"
+
+
+def test_cache_invalidates_on_size_change_with_same_mtime(tmp_path):
+    """An edit that leaves the mtime unchanged is still picked up via size."""
+    import os
+
+    goals_file = tmp_path / "goals.md"
+    goals_file.write_text(WELL_FORMED_GOALS)
+    path = str(goals_file)
+    st = os.stat(path)
+
+    with patch("api.services.goals_parser._find_goals_file", return_value=path):
+        result1 = parse_goals_file()
+
+        goals_file.write_text("## Mission\n\nShorter.\n")
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+        result2 = parse_goals_file()
+
+    assert result2 is not result1
+    assert result2["mission"] == "Shorter."
@@ -5,18 +5,22 @@ Covers roadmap snapshot fetching via GraphQL, error handling, and caching.
 
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import httpx
 import pytest
 
 from api.services.cache import TTLCache
 from api.services.goals_roadmap import (
     RoadmapItem,
-    _extract_field,
+    _field_values,
     get_roadmap_snapshot,
 )
 
 
-def _graphql_response(items: list[dict]) -> dict:
-    """Build a mock GraphQL response with ProjectV2 items."""
+def _graphql_response(items: list[dict], end_cursor: str | None = None) -> dict:
+    """Build a mock GraphQL response with ProjectV2 items.
+
+    Passing *end_cursor* marks the page as having a next page.
+    """
     nodes = []
     for item in items:
         field_values = []
@@ -39,19 +43,22 @@ def _graphql_response(items: list[dict]) -> dict:
         "data": {
             "organization": {
                 "projectV2": {
-                    "items": {"nodes": nodes},
+                    "items": {
+                        "nodes": nodes,
+                        "pageInfo": {
+                            "hasNextPage": end_cursor is not None,
+                            "endCursor": end_cursor,
+                        },
+                    },
                 }
             }
         }
     }
 
 
-def _mock_http_response(json_data: dict, status_code: int = 200) -> MagicMock:
-    """Create a mock httpx Response."""
-    resp = MagicMock()
-    resp.status_code = status_code
-    resp.json.return_value = json_data
-    return resp
+def _mock_http_response(json_data: dict, status_code: int = 200) -> httpx.Response:
+    """Create an httpx Response carrying *json_data*."""
+    return httpx.Response(status_code, json=json_data)
 
 
 class TestRoadmapItem:
@@ -79,27 +86,35 @@ class TestRoadmapItem:
         assert item.priority == "P1"
 
 
-class TestExtractField:
-    """Tests for _extract_field helper."""
+class TestFieldValues:
+    """Tests for _field_values helper."""
 
     def test_extracts_single_select(self):
         nodes = [{"field": {"name": "Priority"}, "name": "P1"}]
-        assert _extract_field(nodes, "Priority") == "P1"
+        assert _field_values(nodes) == {"priority": "P1"}
 
     def test_extracts_text_field(self):
         nodes = [{"field": {"name": "Goal"}, "text": "Revenue"}]
-        assert _extract_field(nodes, "Goal") == "Revenue"
+        assert _field_values(nodes) == {"goal": "Revenue"}
 
-    def test_case_insensitive(self):
+    def test_names_lowercased(self):
         nodes = [{"field": {"name": "Roadmap Status"}, "name": "Active"}]
-        assert _extract_field(nodes, "roadmap status") == "Active"
+        assert _field_values(nodes)["roadmap status"] == "Active"
 
-    def test_missing_field_returns_empty(self):
-        nodes = [{"field": {"name": "Priority"}, "name": "P1"}]
-        assert _extract_field(nodes, "NonExistent") == ""
+    def test_first_value_wins(self):
+        nodes = [
+            {"field": {"name": "Priority"}, "name": "P1"},
+            {"field": {"name": "priority"}, "name": "P3"},
+        ]
+        assert _field_values(nodes) == {"priority": "P1"}
+
+    def test_skips_nodes_without_field(self):
+        # Field types outside the query's fragments come back as empty objects
+        nodes = [{}, {"field": {"name": "Phase"}, "name": "Build"}]
+        assert _field_values(nodes) == {"phase": "Build"}
 
     def test_empty_nodes(self):
-        assert _extract_field([], "Priority") == ""
+        assert _field_values([]) == {}
 
 
 class TestGetRoadmapSnapshot:
@@ -156,6 +171,35 @@ class TestGetRoadmapSnapshot:
         assert result["counts"]["done"] == 1
         assert result["counts"]["deferred"] == 0
 
+    @pytest.mark.asyncio
+    async def test_pages_through_all_items(self, mock_settings):
+        """Items beyond the first page are counted, following endCursor."""
+        first = _graphql_response(
+            [{"title": "A", "Roadmap Status": "Done"}], end_cursor="c1"
+        )
+        second = _graphql_response([{"title": "B", "Roadmap Status": "Active"}])
+
+        mock_client = MagicMock()
+        mock_client.post = AsyncMock(
+            side_effect=[_mock_http_response(first), _mock_http_response(second)]
+        )
+
+        with patch(
+            "api.services.goals_roadmap.get_shared_client",
+            return_value=mock_client,
+        ):
+            cache = TTLCache(ttl=300, max_size=10)
+            result = await get_roadmap_snapshot(cache)
+
+        assert mock_client.post.call_count == 2
+        cursors = [
+            call.kwargs["json"]["variables"]["cursor"]
+            for call in mock_client.post.call_args_list
+        ]
+        assert cursors == [None, "c1"]
+        assert [item["title"] for item in result["active"]] == ["B"]
+        assert result["counts"]["done"] == 1
+
     @pytest.mark.asyncio
     async def test_empty_project(self, mock_settings):
         """Empty project returns zero counts and no active items."""
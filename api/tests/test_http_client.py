@@ -1,14 +1,25 @@
 """Tests for http_client module — pagination, error handling, GitHub API wrappers."""
 
+import asyncio
+import gzip
+
 import httpx
 import pytest
 
 from api.services.http_client import (
+    _ConcurrencyLimitTransport,
+    _ConditionalGetTransport,
+    _RateLimitRetryTransport,
+    close_shared_client,
     fetch_closed_issues,
     fetch_merged_prs,
     github_api_get,
+    get_shared_client,
     github_headers,
+    last_page_number,
     paginated_github_search,
+    parse_json,
+    prewarm_shared_client,
 )
 
 
@@ -30,6 +41,344 @@ class TestGitHubHeaders:
         headers = github_headers()
         assert "Authorization" not in headers
 
+    def test_reuses_dict_for_same_token(self, mock_settings):
+        assert github_headers() is github_headers()
+
+    def test_token_change_rebuilds_headers(self, mock_settings):
+        mock_settings.github_token = "first"  # noqa: S105
+        first = github_headers()
+        mock_settings.github_token = "second"  # noqa: S105
+        assert github_headers()["Authorization"] == "Bearer second"
+        assert first["Authorization"] == "Bearer first"
+
+
+class TestSharedClient:
+    """Tests for get_shared_client() and close_shared_client()."""
+
+    def test_returns_same_client(self):
+        assert get_shared_client() is get_shared_client()
+
+    @pytest.mark.asyncio
+    async def test_close_releases_client(self):
+        client = get_shared_client()
+        await close_shared_client()
+
+        assert client.is_closed
+        assert get_shared_client() is not client
+
+    @pytest.mark.asyncio
+    async def test_close_without_client_is_noop(self):
+        await close_shared_client()
+
+    @pytest.mark.asyncio
+    async def test_prewarm_requests_rate_limit(self, monkeypatch, mock_settings):
+        urls = []
+
+        async def mock_get(self, url, **kwargs):
+            urls.append(url)
+            return httpx.Response(200, json={})
+
+        monkeypatch.setattr(httpx.AsyncClient, "get", mock_get)
+        await prewarm_shared_client()
+        assert urls == ["https://api.github.com/rate_limit"]
+
+    @pytest.mark.asyncio
+    async def test_prewarm_failure_is_swallowed(self, monkeypatch, mock_settings):
+        async def mock_get(self, url, **kwargs):
+            raise httpx.ConnectError("unreachable")
+
+        monkeypatch.setattr(httpx.AsyncClient, "get", mock_get)
+        await prewarm_shared_client()
+
+
+class TestConcurrencyLimitTransport:
+    """Tests for _ConcurrencyLimitTransport."""
+
+    @staticmethod
+    async def _peak_concurrency(url: str, limit: int, requests: int) -> int:
+        in_flight = peak = 0
+
+        async def handler(request):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return httpx.Response(200)
+
+        transport = _ConcurrencyLimitTransport(httpx.MockTransport(handler), limit)
+        async with httpx.AsyncClient(transport=transport) as client:
+            await asyncio.gather(*(client.get(url) for _ in range(requests)))
+        return peak
+
+    @pytest.mark.asyncio
+    async def test_caps_github_requests(self):
+        peak = await self._peak_concurrency("https://api.github.com/x", 2, 6)
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_other_hosts_unlimited(self):
+        peak = await self._peak_concurrency("https://example.com/x", 2, 6)
+        assert peak == 6
+
+
+class TestRateLimitRetryTransport:
+    """Tests for _RateLimitRetryTransport."""
+
+    @staticmethod
+    def _client(responses, calls):
+        async def handler(request):
+            calls.append(request)
+            return responses.pop(0)
+
+        transport = _RateLimitRetryTransport(httpx.MockTransport(handler))
+        return httpx.AsyncClient(transport=transport)
+
+    @pytest.mark.asyncio
+    async def test_retries_after_retry_after_header(self, monkeypatch):
+        """A 429 with Retry-After is retried after the advertised delay."""
+        sleeps = []
+
+        async def fake_sleep(delay):
+            sleeps.append(delay)
+
+        monkeypatch.setattr("api.services.http_client.asyncio.sleep", fake_sleep)
+        calls = []
+        responses = [
+            httpx.Response(429, headers={"Retry-After": "2"}),
+            httpx.Response(200, json={"ok": True}),
+        ]
+        async with self._client(responses, calls) as client:
+            resp = await client.get("https://api.github.com/repos/o/r")
+
+        assert resp.status_code == 200
+        assert len(calls) == 2
+        # The advertised delay plus up to a second of jitter
+        assert len(sleeps) == 1
+        assert 2.0 <= sleeps[0] <= 3.0
+
+    @pytest.mark.asyncio
+    async def test_does_not_retry_plain_forbidden(self, monkeypatch):
+        """A 403 without rate-limit headers is returned as-is."""
+        calls = []
+        responses = [httpx.Response(403, json={"message": "forbidden"})]
+        async with self._client(responses, calls) as client:
+            resp = await client.get("https://api.github.com/repos/o/r")
+
+        assert resp.status_code == 403
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_gives_up_when_wait_exceeds_cap(self, monkeypatch):
+        """An exhausted quota resetting far in the future is not waited on."""
+        calls = []
+        responses = [
+            httpx.Response(
+                403,
+                headers={
+                    "X-RateLimit-Remaining": "0",
+                    "X-RateLimit-Reset": "9999999999",
+                },
+            )
+        ]
+        async with self._client(responses, calls) as client:
+            resp = await client.get("https://api.github.com/repos/o/r")
+
+        assert resp.status_code == 403
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_ignores_non_github_hosts(self, monkeypatch):
+        """Rate-limit handling only applies to api.github.com."""
+        calls = []
+        responses = [httpx.Response(429, headers={"Retry-After": "1"})]
+        async with self._client(responses, calls) as client:
+            resp = await client.get("https://example.com/feed.xml")
+
+        assert resp.status_code == 429
+        assert len(calls) == 1
+
+
+class TestConditionalGetTransport:
+    """Tests for _ConditionalGetTransport."""
+
+    URL = "https://api.github.com/repos/o/r/commits"
+
+    @staticmethod
+    def _client(responses, calls):
+        async def handler(request):
+            calls.append(request)
+            return responses.pop(0)
+
+        transport = _ConditionalGetTransport(httpx.MockTransport(handler))
+        return httpx.AsyncClient(transport=transport)
+
+    @pytest.mark.asyncio
+    async def test_replays_cached_response_on_not_modified(self):
+        """A 304 is answered with the remembered body and headers."""
+        calls = []
+        link = '<https://api.github.com/repos/o/r/commits?page=7>; rel="last"'
+        responses = [
+            httpx.Response(
+                200, headers={"ETag": '"abc"', "Link": link}, json=[{"sha": "1"}]
+            ),
+            httpx.Response(304, headers={"ETag": '"abc"'}),
+        ]
+        async with self._client(responses, calls) as client:
+            await client.get(self.URL)
+            resp = await client.get(self.URL)
+
+        assert calls[1].headers["If-None-Match"] == '"abc"'
+        assert resp.status_code == 200
+        assert resp.json() == [{"sha": "1"}]
+        assert resp.links["last"]["url"].endswith("page=7")
+
+    @pytest.mark.asyncio
+    async def test_replays_compressed_body(self):
+        """Content-encoded bodies are replayed and decoded correctly."""
+        calls = []
+        body = gzip.compress(b'{"total_count": 3}')
+        headers = {"ETag": '"gz"', "Content-Encoding": "gzip"}
+        responses = [
+            httpx.Response(200, headers=headers, content=body),
+            httpx.Response(304),
+        ]
+        async with self._client(responses, calls) as client:
+            first = await client.get(self.URL)
+            second = await client.get(self.URL)
+
+        assert first.json() == second.json() == {"total_count": 3}
+
+    @pytest.mark.asyncio
+    async def test_changed_resource_replaces_cached_response(self):
+        calls = []
+        responses = [
+            httpx.Response(200, headers={"ETag": '"v1"'}, json={"v": 1}),
+            httpx.Response(200, headers={"ETag": '"v2"'}, json={"v": 2}),
+            httpx.Response(304),
+        ]
+        async with self._client(responses, calls) as client:
+            await client.get(self.URL)
+            await client.get(self.URL)
+            resp = await client.get(self.URL)
+
+        assert calls[2].headers["If-None-Match"] == '"v2"'
+        assert resp.json() == {"v": 2}
+
+    @pytest.mark.asyncio
+    async def test_validators_are_per_token(self):
+        """A response fetched with one token is never replayed for another."""
+        calls = []
+        responses = [
+            httpx.Response(200, headers={"ETag": '"abc"'}, json={}),
+            httpx.Response(200, headers={"ETag": '"abc"'}, json={}),
+        ]
+        async with self._client(responses, calls) as client:
+            await client.get(self.URL, headers={"Authorization": "Bearer a"})
+            await client.get(self.URL, headers={"Authorization": "Bearer b"})
+
+        assert "If-None-Match" not in calls[1].headers
+
+    @pytest.mark.asyncio
+    async def test_ignores_non_github_hosts(self):
+        calls = []
+        responses = [
+            httpx.Response(200, headers={"ETag": '"abc"'}, text="<rss/>"),
+            httpx.Response(200, headers={"ETag": '"abc"'}, text="<rss/>"),
+        ]
+        async with self._client(responses, calls) as client:
+            await client.get("https://example.com/feed.xml")
+            await client.get("https://example.com/feed.xml")
+
+        assert "If-None-Match" not in calls[1].headers
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "url",
+        [
+            "https://api.github.com/search/issues?q=repo:o/r+closed:>=2026-10-15",
+            "https://api.github.com/repos/o/r/commits?since=2026-10-15T00:00:00Z",
+        ],
+    )
+    async def test_moving_cutoff_urls_are_not_retained(self, url):
+        """Searches and since-listings are never requested twice, so not kept."""
+        calls = []
+        responses = [
+            httpx.Response(200, headers={"ETag": '"abc"'}, json={}),
+            httpx.Response(200, headers={"ETag": '"abc"'}, json={}),
+        ]
+        transport = _ConditionalGetTransport(
+            httpx.MockTransport(
+                lambda request: calls.append(request) or responses.pop(0)
+            )
+        )
+        async with httpx.AsyncClient(transport=transport) as client:
+            await client.get(url)
+            await client.get(url)
+
+        assert transport._cache == {}
+        assert "If-None-Match" not in calls[1].headers
+
+    @pytest.mark.asyncio
+    async def test_evicts_least_recently_used_past_byte_budget(self, monkeypatch):
+        monkeypatch.setattr("api.services.http_client._ETAG_CACHE_MAX_BYTES", 2 * 1024)
+        body = b"x" * 1024
+        transport = _ConditionalGetTransport(
+            httpx.MockTransport(
+                lambda request: httpx.Response(
+                    200, headers={"ETag": '"abc"'}, content=body
+                )
+            )
+        )
+        async with httpx.AsyncClient(transport=transport) as client:
+            for name in ("a", "b", "c"):
+                await client.get(f"https://api.github.com/repos/o/{name}")
+
+        assert [key.rsplit("/", 1)[1] for key in transport._cache] == ["b", "c"]
+        assert transport._cached_bytes == 2 * len(body)
+
+
+class TestLastPageNumber:
+    """Tests for last_page_number()."""
+
+    @staticmethod
+    def _resp(link=None):
+        headers = {"Link": link} if link else {}
+        return httpx.Response(200, headers=headers, json=[])
+
+    def test_reads_last_page_among_several_rels(self):
+        link = (
+            "<https://api.github.com/repositories/1/commits?since=2026-01-01"
+            'T00%3A00%3A00Z&per_page=1&page=2>; rel="next", '
+            "<https://api.github.com/repositories/1/commits?since=2026-01-01"
+            'T00%3A00%3A00Z&per_page=1&page=42>; rel="last"'
+        )
+        assert last_page_number(self._resp(link)) == 42
+
+    def test_no_link_header_returns_none(self):
+        assert last_page_number(self._resp()) is None
+
+    def test_no_last_rel_returns_none(self):
+        link = '<https://api.github.com/repos/o/r/commits?page=1>; rel="prev"'
+        assert last_page_number(self._resp(link)) is None
+
+    def test_non_numeric_page_returns_none(self):
+        link = '<https://api.github.com/repos/o/r/commits?page=x>; rel="last"'
+        assert last_page_number(self._resp(link)) is None
+
+
+class TestParseJson:
+    """Tests for parse_json()."""
+
+    def test_decodes_response_body(self):
+        resp = httpx.Response(200, json=[{"number": 1, "title": "café"}])
+        assert parse_json(resp) == [{"number": 1, "title": "café"}]
+
+    def test_raises_value_error_on_malformed_body(self):
+        resp = httpx.Response(200, content=b"not json")
+        with pytest.raises(ValueError):
+            parse_json(resp)
+
 
 class TestGitHubApiGet:
     """Tests for github_api_get()."""
@@ -112,6 +461,21 @@ class TestGitHubApiGet:
         )
         assert captured_params == {"q": "test", "per_page": "50"}
 
+    @pytest.mark.asyncio
+    async def test_uses_caller_supplied_headers(self, monkeypatch):
+        """Headers passed by the caller are sent instead of rebuilt ones."""
+        captured_headers = None
+
+        async def mock_get(self, url, **kwargs):
+            nonlocal captured_headers
+            captured_headers = kwargs.get("headers")
+            return httpx.Response(200, json={})
+
+        monkeypatch.setattr(httpx.AsyncClient, "get", mock_get)
+        headers = {"Accept": "application/vnd.github+json"}
+        await github_api_get("https://api.github.com/test", headers=headers)
+        assert captured_headers is headers
+
 
 class TestPaginatedGitHubSearch:
     """Tests for paginated_github_search()."""
@@ -243,6 +607,72 @@ class TestPaginatedGitHubSearch:
         )
         assert result == [{"id": 1}]
 
+    @pytest.mark.asyncio
+    async def test_fetches_remaining_pages_concurrently(self, monkeypatch):
+        """Pages after the first are requested together, returned in order."""
+        total = 250
+        requested_pages = []
+        in_flight = 0
+        peak = 0
+
+        async def mock_get(self, url, **kwargs):
+            nonlocal in_flight, peak
+            page = int(kwargs["params"]["page"])
+            requested_pages.append(page)
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            start = (page - 1) * 100
+            ids = range(start, min(start + 100, total))
+            return httpx.Response(
+                200, json={"items": [{"id": i} for i in ids], "total_count": total}
+            )
+
+        monkeypatch.setattr(httpx.AsyncClient, "get", mock_get)
+        result = await paginated_github_search(
+            "https://api.github.com/search/issues", params={"q": "test"}
+        )
+        assert [item["id"] for item in result] == list(range(total))
+        assert sorted(requested_pages) == [1, 2, 3]
+        assert peak == 2  # pages 2 and 3 overlapped
+
+    @pytest.mark.asyncio
+    async def test_stops_at_search_result_limit(self, monkeypatch):
+        """Never requests pages past the Search API's 1000-result cap."""
+        requested_pages = []
+
+        async def mock_get(self, url, **kwargs):
+            requested_pages.append(int(kwargs["params"]["page"]))
+            return httpx.Response(
+                200, json={"items": [{"id": 1}] * 100, "total_count": 5000}
+            )
+
+        monkeypatch.setattr(httpx.AsyncClient, "get", mock_get)
+        result = await paginated_github_search(
+            "https://api.github.com/search/issues", params={"q": "test"}
+        )
+        assert len(result) == 1000
+        assert max(requested_pages) == 10
+
+    @pytest.mark.asyncio
+    async def test_keeps_pages_before_a_failed_page(self, monkeypatch):
+        """A failed middle page truncates results to the pages before it."""
+
+        async def mock_get(self, url, **kwargs):
+            page = int(kwargs["params"]["page"])
+            if page == 3:
+                return httpx.Response(500, json={"message": "error"})
+            return httpx.Response(
+                200, json={"items": [{"page": page}] * 100, "total_count": 400}
+            )
+
+        monkeypatch.setattr(httpx.AsyncClient, "get", mock_get)
+        result = await paginated_github_search(
+            "https://api.github.com/search/issues", params={"q": "test"}
+        )
+        assert {item["page"] for item in result} == {1, 2}
+
     @pytest.mark.asyncio
     async def test_handles_missing_total_count(self, monkeypatch):
         """When total_count is missing, returns items from first page."""
@@ -334,6 +764,57 @@ class TestFetchMergedPrs:
         assert len(result) == 1
         assert result[0]["number"] == 1
 
+    @pytest.mark.asyncio
+    async def test_keeps_only_listed_fields(self, monkeypatch):
+        """Bulky keys such as head/base repository objects are dropped."""
+        prs = [
+            {
+                "number": 1,
+                "merged_at": "2026-02-15T10:00:00Z",
+                "updated_at": "2026-02-15T10:00:00Z",
+                "user": {"login": "dev"},
+                "body": "long description",
+                "head": {"repo": {"full_name": "o/r"}},
+            },
+        ]
+
+        async def mock_get(self, url, **kwargs):
+            return httpx.Response(200, json=prs)
+
+        monkeypatch.setattr(httpx.AsyncClient, "get", mock_get)
+        result = await fetch_merged_prs("test/repo", "2026-02-15")
+        assert result == [
+            {
+                "number": 1,
+                "user": {"login": "dev"},
+                "updated_at": "2026-02-15T10:00:00Z",
+                "merged_at": "2026-02-15T10:00:00Z",
+            }
+        ]
+
+    @pytest.mark.asyncio
+    async def test_normalizes_offset_since_to_utc(self, monkeypatch):
+        """A since with a UTC offset is compared in UTC against GitHub's Z times."""
+        prs = [
+            {
+                "number": 1,
+                "merged_at": "2026-02-15T12:00:00Z",  # == 14:00 at +02:00
+                "updated_at": "2026-02-15T12:00:00Z",
+            },
+            {
+                "number": 2,
+                "merged_at": "2026-02-15T11:59:59Z",
+                "updated_at": "2026-02-15T11:59:59Z",
+            },
+        ]
+
+        async def mock_get(self, url, **kwargs):
+            return httpx.Response(200, json=prs)
+
+        monkeypatch.setattr(httpx.AsyncClient, "get", mock_get)
+        result = await fetch_merged_prs("test/repo", "2026-02-15T14:00:00+02:00")
+        assert [pr["number"] for pr in result] == [1]
+
     @pytest.mark.asyncio
     async def test_paginates_multiple_pages(self, monkeypatch):
         """Fetches multiple pages of PRs."""
@@ -355,16 +836,43 @@ class TestFetchMergedPrs:
         ]
 
         call_count = 0
+        next_link = '<https://api.github.com/repos/test/repo/pulls?page=2>; rel="next"'
 
         async def mock_get(self, url, **kwargs):
             nonlocal call_count
             call_count += 1
-            return httpx.Response(200, json=page1 if call_count == 1 else page2)
+            if call_count == 1:
+                return httpx.Response(200, json=page1, headers={"Link": next_link})
+            return httpx.Response(200, json=page2)
 
         monkeypatch.setattr(httpx.AsyncClient, "get", mock_get)
         result = await fetch_merged_prs("test/repo", "2026-02-15")
         assert len(result) == 120  # 100 from page1 + 20 from page2
 
+    @pytest.mark.asyncio
+    async def test_full_last_page_without_next_link_stops(self, monkeypatch):
+        """A full page with no rel="next" link is the last; no extra request."""
+        page1 = [
+            {
+                "number": i,
+                "merged_at": "2026-02-15T10:00:00Z",
+                "updated_at": "2026-02-15T10:00:00Z",
+            }
+            for i in range(100)
+        ]
+
+        call_count = 0
+
+        async def mock_get(self, url, **kwargs):
+            nonlocal call_count
+            call_count += 1
+            return httpx.Response(200, json=page1)
+
+        monkeypatch.setattr(httpx.AsyncClient, "get", mock_get)
+        result = await fetch_merged_prs("test/repo", "2026-02-15")
+        assert len(result) == 100
+        assert call_count == 1
+
     @pytest.mark.asyncio
     async def test_stops_when_oldest_updated_before_since(self, monkeypatch):
         """Stops pagination when oldest item on page was updated before since."""
@@ -1,5 +1,8 @@
 """Tests for the ingestion orchestrator — dedup, capping, failure handling."""
 
+import asyncio
+import time
+from itertools import pairwise
 from datetime import datetime, timezone
 from unittest.mock import AsyncMock
 
@@ -7,6 +10,9 @@ from api.models.article import ArticleIndex, ArticleSummary
 from api.services.ingestion.analyzer import AnalysisError, AnalysisResult
 from api.services.ingestion.scraper import ScrapedArticle
 
+# _mock_orchestrator_deps patches asyncio.sleep away; pacing tests need it back
+_real_sleep = asyncio.sleep
+
 
 def _make_parsed(article_id, title="Test Article"):
     return {
@@ -86,6 +92,15 @@ def _mock_orchestrator_deps(mocker, existing_ids=None, parsed_articles=None):
         "api.services.ingestion.orchestrator.write_article_index",
         new_callable=AsyncMock,
     )
+    mocker.patch(
+        "api.services.ingestion.orchestrator.get_analysis_cache",
+        new_callable=AsyncMock,
+        return_value={},
+    )
+    mocker.patch(
+        "api.services.ingestion.orchestrator.write_analysis_cache",
+        new_callable=AsyncMock,
+    )
     # Eliminate sleep between articles in tests
     mocker.patch(
         "api.services.ingestion.orchestrator.asyncio.sleep", new_callable=AsyncMock
@@ -248,3 +263,142 @@ async def test_filters_low_relevance_articles(mocker):
     assert mock_analyze.call_count == 2  # Both analyzed
     assert mock_write_only.call_count == 1  # Only one written
     mock_write_index.assert_called_once()
+
+
+async def test_processes_articles_concurrently(mocker):
+    """Articles overlap, up to ARTICLE_CONCURRENCY at a time, in index order."""
+    from api.services.ingestion.orchestrator import ARTICLE_CONCURRENCY, run_ingestion
+
+    parsed = [_make_parsed(f"article-{i}") for i in range(ARTICLE_CONCURRENCY * 2)]
+    mock_analyze, _, mock_write_index = _mock_orchestrator_deps(
+        mocker, existing_ids=[], parsed_articles=parsed
+    )
+
+    in_flight = 0
+    peak = 0
+    all_started = asyncio.Event()
+
+    async def _analyze_side_effect(title, content):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        if in_flight == ARTICLE_CONCURRENCY:
+            all_started.set()
+        await all_started.wait()
+        in_flight -= 1
+        return AnalysisResult(insights=[], ai_summary=None, relevance_score=7)
+
+    mock_analyze.side_effect = _analyze_side_effect
+
+    stats = await run_ingestion()
+
+    assert stats.new == len(parsed)
+    assert peak == ARTICLE_CONCURRENCY
+    written_ids = [a.id for a in mock_write_index.call_args[0][0]]
+    assert written_ids == [p["id"] for p in reversed(parsed)]
+
+
+async def test_reuses_cached_analysis_for_filtered_articles(mocker):
+    """A filtered article seen again is not sent to the LLM a second time."""
+    from api.services.ingestion.orchestrator import run_ingestion
+
+    parsed = [_make_parsed("low-relevance")]
+    mock_analyze, mock_write_only, _ = _mock_orchestrator_deps(
+        mocker, existing_ids=[], parsed_articles=parsed
+    )
+    mock_analyze.return_value = AnalysisResult(
+        insights=[], ai_summary=None, relevance_score=2
+    )
+    mock_write_cache = mocker.patch(
+        "api.services.ingestion.orchestrator.write_analysis_cache",
+        new_callable=AsyncMock,
+    )
+
+    first = await run_ingestion()
+    cache = mock_write_cache.call_args[0][0]
+    assert len(cache) == 1
+
+    mocker.patch(
+        "api.services.ingestion.orchestrator.get_analysis_cache",
+        new_callable=AsyncMock,
+        return_value=cache,
+    )
+    second = await run_ingestion()
+
+    assert first.filtered == second.filtered == 1
+    assert mock_analyze.call_count == 1
+    mock_write_only.assert_not_called()
+    # Nothing new to remember, so the cache isn't uploaded again
+    assert mock_write_cache.call_count == 1
+
+
+async def test_malformed_cached_analysis_is_replaced(mocker):
+    """An entry missing fields is treated as a miss and overwritten."""
+    from api.services.ingestion.analyzer import analysis_cache_key
+    from api.services.ingestion.orchestrator import run_ingestion
+
+    parsed = [_make_parsed("low-relevance")]
+    mock_analyze, _, _ = _mock_orchestrator_deps(
+        mocker, existing_ids=[], parsed_articles=parsed
+    )
+    mock_analyze.return_value = AnalysisResult(
+        insights=[], ai_summary=None, relevance_score=2
+    )
+    cache_key = analysis_cache_key(parsed[0]["title"], "Scraped content here")
+    mocker.patch(
+        "api.services.ingestion.orchestrator.get_analysis_cache",
+        new_callable=AsyncMock,
+        return_value={cache_key: {"insights": [], "used_at": time.time()}},
+    )
+    mock_write_cache = mocker.patch(
+        "api.services.ingestion.orchestrator.write_analysis_cache",
+        new_callable=AsyncMock,
+    )
+
+    stats = await run_ingestion()
+
+    assert stats.filtered == 1
+    assert stats.failed == 0
+    mock_analyze.assert_called_once()
+    entry = mock_write_cache.call_args[0][0][cache_key]
+    assert entry["relevance_score"] == 2
+    assert entry["ai_summary"] is None
+
+
+async def test_spaces_analyses_when_scrapes_are_slow(mocker):
+    """LLM calls stay INTER_ARTICLE_DELAY apart even when scrapes finish together."""
+    from api.services.ingestion.orchestrator import run_ingestion
+
+    delay = 0.05
+    parsed = [_make_parsed(f"article-{i}") for i in range(5)]
+    mock_analyze, _, _ = _mock_orchestrator_deps(
+        mocker, existing_ids=[], parsed_articles=parsed
+    )
+    mocker.patch("api.services.ingestion.orchestrator.asyncio.sleep", _real_sleep)
+    mocker.patch("api.services.ingestion.orchestrator.INTER_ARTICLE_DELAY", delay)
+
+    # Later articles scrape faster, so all scrapes finish within a short burst
+    async def _slow_scrape(url):
+        index = int(url.rsplit("-", 1)[1])
+        await _real_sleep(0.3 - 0.03 * index)
+        return ScrapedArticle(text=f"Scraped content {index}", word_count=50)
+
+    mocker.patch(
+        "api.services.ingestion.orchestrator.scrape_article",
+        side_effect=_slow_scrape,
+    )
+
+    call_times = []
+
+    async def _analyze_side_effect(title, content):
+        call_times.append(time.monotonic())
+        return AnalysisResult(insights=[], ai_summary=None, relevance_score=7)
+
+    mock_analyze.side_effect = _analyze_side_effect
+
+    stats = await run_ingestion()
+
+    assert stats.new == len(parsed)
+    gaps = [b - a for a, b in pairwise(call_times)]
+    assert len(gaps) == len(parsed) - 1
+    assert min(gaps) >= delay * 0.9
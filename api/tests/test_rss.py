@@ -16,6 +16,7 @@ from api.services.ingestion.rss import (
     _generate_article_id,
     _parse_published_date,
     fetch_and_parse_source,
+    fetch_feed,
     load_sources,
     parse_feed_entries,
 )
@@ -236,6 +237,10 @@ class TestExtractSummary:
         assert len(result) <= MAX_SUMMARY_LENGTH
         assert result.endswith("...")
 
+    def test_plain_text_kept_as_is(self) -> None:
+        entry = feedparser.FeedParserDict({"summary": "  Models > benchmarks  "})
+        assert _extract_summary(entry) == "Models > benchmarks"
+
 
 # ---------------------------------------------------------------------------
 # _generate_article_id
@@ -422,3 +427,71 @@ class TestFetchAndParseSource:
 
         assert len(articles) == 2
         assert articles[0]["title"] == "RSS Article One"
+
+    @pytest.mark.asyncio
+    async def test_unchanged_feed_is_not_reparsed(
+        self, sample_source: SourceConfig, sample_rss_feed: str
+    ) -> None:
+        with (
+            patch(
+                "api.services.ingestion.rss.fetch_feed",
+                return_value=sample_rss_feed,
+            ),
+            patch(
+                "api.services.ingestion.rss.parse_feed_entries",
+                wraps=parse_feed_entries,
+            ) as mock_parse,
+        ):
+            first = await fetch_and_parse_source(sample_source)
+            second = await fetch_and_parse_source(sample_source)
+
+        assert mock_parse.call_count == 1
+        assert second == first
+
+
+# ---------------------------------------------------------------------------
+# fetch_feed — conditional GETs
+# ---------------------------------------------------------------------------
+
+
+class TestFetchFeed:
+    @pytest.mark.asyncio
+    async def test_replays_body_on_not_modified(self, monkeypatch) -> None:
+        sent_headers = []
+        responses = [
+            httpx.Response(
+                200,
+                text="<rss/>",
+                headers={"ETag": '"v1"', "Last-Modified": "Wed, 14 Oct 2026"},
+            ),
+            httpx.Response(304),
+        ]
+
+        async def mock_get(self, url, **kwargs):
+            sent_headers.append(kwargs["headers"])
+            resp = responses.pop(0)
+            resp.request = httpx.Request("GET", url)
+            return resp
+
+        monkeypatch.setattr(httpx.AsyncClient, "get", mock_get)
+
+        assert await fetch_feed("https://example.com/feed") == "<rss/>"
+        assert await fetch_feed("https://example.com/feed") == "<rss/>"
+        assert "If-None-Match" not in sent_headers[0]
+        assert sent_headers[1]["If-None-Match"] == '"v1"'
+        assert sent_headers[1]["If-Modified-Since"] == "Wed, 14 Oct 2026"
+
+    @pytest.mark.asyncio
+    async def test_feed_without_validators_is_not_cached(self, monkeypatch) -> None:
+        sent_headers = []
+
+        async def mock_get(self, url, **kwargs):
+            sent_headers.append(kwargs["headers"])
+            return httpx.Response(200, text="<rss/>", request=httpx.Request("GET", url))
+
+        monkeypatch.setattr(httpx.AsyncClient, "get", mock_get)
+
+        await fetch_feed("https://example.com/feed")
+        await fetch_feed("https://example.com/feed")
+        assert "If-None-Match" not in sent_headers[1]
+        assert "If-Modified-Since" not in sent_headers[1]
@@ -8,6 +8,7 @@ Usage:
 import asyncio
 import logging
 import sys
+from datetime import datetime, timezone
 
 from api.services.ingestion.orchestrator import run_ingestion
 
@@ -33,8 +34,6 @@ async def _clear_index() -> None:
 
 
 async def main() -> int:
-    from datetime import datetime, timezone
-
     force = "--force" in sys.argv
 
     if force: